@@ -0,0 +1,43 @@
+"""Benchmark Compression - Tamanho e tempo por codec/nível do catálogo
+
+Uso: python -m benchmarks.bench_compression [--poemas 100000] [--repeat 3]
+"""
+
+import argparse
+from benchmarks.bench_serializers import best_of
+from benchmarks.catalog_factory import build_catalog
+from src.infrastructure import compressed_io
+
+LEVELS = {
+    'gzip': (1, 6, 9),
+    'zstd': (1, 3, 9, 19),
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--poemas", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    catalog = build_catalog(args.poemas)
+
+    for label, indent in (("compacto", None), ("indentado", 4)):
+        raw = catalog.model_dump_json(indent=indent).encode('utf-8')
+        print(f"\nCatálogo {label}: {len(raw)} bytes ({catalog.total_poemas} poemas)")
+        print(f"{'codec':<8}{'nível':>6}{'tamanho':>12}{'razão':>8}{'encode (s)':>12}{'decode (s)':>12}")
+
+        for codec, levels in LEVELS.items():
+            if codec == 'zstd' and not compressed_io.zstd_available():
+                print(f"{codec:<8}{'indisponível':>18}")
+                continue
+            for level in levels:
+                packed = compressed_io.compress(raw, codec, level)
+                enc = best_of(args.repeat, lambda: compressed_io.compress(raw, codec, level))
+                dec = best_of(args.repeat, lambda: compressed_io.decompress(packed))
+                ratio = len(raw) / len(packed)
+                print(f"{codec:<8}{level:>6}{len(packed):>12}{ratio:>8.1f}{enc:>12.3f}{dec:>12.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""Benchmark Import - Tempo de inicialização por comando da CLI
+
+Cada cenário roda em um interpretador novo (sem cache de sys.modules) e
+mede os imports que o comando faz antes de começar a trabalhar. "eager"
+reproduz o config.py anterior, que importava toda a infraestrutura no
+topo do módulo.
+
+Uso: python -m benchmarks.bench_import [--repeat 5] [--importtime download]
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from typing import Dict, Optional
+
+# O que o config.py importava no topo antes dos imports lazy
+EAGER_MODULES = [
+    "src.infrastructure.browser",
+    "src.infrastructure.parser",
+    "src.infrastructure.http_client",
+    "src.infrastructure.repositories",
+    "src.infrastructure.serializers",
+    "src.infrastructure.binary_catalog",
+    "src.infrastructure.sqlite_catalog",
+    "src.infrastructure.manifest",
+    "src.infrastructure.ledger",
+    "src.application.scraper_service",
+    "src.application.filter_service",
+    "src.application.download_service",
+    "src.application.structure_service",
+    "src.application.persistence_service",
+    "src.application.diff_service",
+    "src.application.report_service",
+]
+
+# Módulos que as factories do download carregam ao rodar
+DOWNLOAD_MODULES = [
+    "src.main_download",
+    "src.application.persistence_service",
+    "src.infrastructure.repositories",
+    "src.infrastructure.serializers",
+    "src.infrastructure.manifest",
+    "src.application.filter_service",
+    "src.application.download_service",
+    "src.infrastructure.http_client",
+]
+
+SCENARIOS = {
+    "config (eager)": EAGER_MODULES + ["config"],
+    "config (lazy)": ["config"],
+    "download (eager)": EAGER_MODULES + DOWNLOAD_MODULES,
+    "download (lazy)": ["src.cli"] + DOWNLOAD_MODULES,
+    "verify": ["src.cli", "src.main_verify", "src.infrastructure.manifest"],
+    "stats": ["src.cli", "src.main_stats", "src.application.persistence_service", "src.infrastructure.manifest"],
+}
+
+PROBE = """
+import sys, time, json, importlib
+inicio = time.perf_counter()
+for name in {modules!r}:
+    importlib.import_module(name)
+elapsed = time.perf_counter() - inicio
+heavy = [m for m in ("playwright", "bs4", "httpx") if m in sys.modules]
+print(json.dumps({{"s": elapsed, "modules": len(sys.modules), "heavy": heavy}}))
+"""
+
+
+def measure(modules: list, repeat: int) -> Optional[Dict]:
+    """Melhor de repeat execuções em processos novos (None se faltar dependência)"""
+    best = None
+    for _ in range(repeat):
+        proc = subprocess.run(
+            [sys.executable, "-c", PROBE.format(modules=modules)],
+            capture_output=True,
+            text=True
+        )
+        if proc.returncode != 0:
+            return None
+        result = json.loads(proc.stdout.strip().splitlines()[-1])
+        if best is None or result["s"] < best["s"]:
+            best = result
+    return best
+
+
+def importtime(modules: list, top: int = 15) -> None:
+    """Imprime os imports de maior tempo cumulativo (python -X importtime)"""
+    code = "import importlib\nfor name in %r:\n    importlib.import_module(name)" % modules
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True)
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        rows.append((int(cumulative), name.rstrip()))
+    rows.sort(reverse=True)
+    print(f"\n{'cumulativo (ms)':>16}  módulo")
+    for cumulative, name in rows[:top]:
+        print(f"{cumulative / 1000:>16.1f}  {name}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--importtime",
+        choices=sorted(SCENARIOS),
+        default=None,
+        help="Detalha um cenário com python -X importtime"
+    )
+    args = parser.parse_args()
+
+    print(f"{'cenário':<20}{'import (ms)':>12}{'módulos':>10}  pesados carregados")
+    for name, modules in SCENARIOS.items():
+        result = measure(modules, args.repeat)
+        if result is None:
+            print(f"{name:<20}{'indisponível (dependência ausente)':>36}")
+            continue
+        heavy = ", ".join(result["heavy"]) or "-"
+        print(f"{name:<20}{result['s'] * 1000:>12.1f}{result['modules']:>10}  {heavy}")
+
+    if args.importtime:
+        importtime(SCENARIOS[args.importtime])
+
+
+if __name__ == "__main__":
+    main()
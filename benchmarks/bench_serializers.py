@@ -0,0 +1,78 @@
+"""Benchmark Serializers - Compara backends de JSON do catálogo
+
+Uso: python -m benchmarks.bench_serializers [--poemas 100000] [--repeat 3]
+"""
+
+import argparse
+import json
+import time
+from benchmarks.catalog_factory import build_catalog
+from src.domain.models import Categoria, Poema, StructureCatalog
+from src.infrastructure.serializers import SERIALIZERS, get_serializer
+
+
+def best_of(repeat: int, func) -> float:
+    """Menor tempo de execução em segundos"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def legacy_encode(catalog: StructureCatalog) -> bytes:
+    """Caminho anterior: model_dump + json.dump indentado"""
+    return json.dumps(catalog.model_dump(), ensure_ascii=False, indent=4).encode('utf-8')
+
+
+def legacy_decode(raw: bytes) -> StructureCatalog:
+    """Caminho anterior: json.load + reconstrução nó a nó"""
+    def rebuild(data):
+        categoria = Categoria(nome=data['nome'], path=data['path'])
+        for poema in data.get('poemas', []):
+            categoria.poemas.append(Poema(**poema))
+        categoria.subcategorias = [rebuild(sub) for sub in data.get('subcategorias', [])]
+        return categoria
+
+    data = json.loads(raw)
+    return StructureCatalog(
+        total_categorias=data['total_categorias'],
+        total_poemas=data['total_poemas'],
+        categorias=[rebuild(cat) for cat in data['categorias']]
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--poemas", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    catalog = build_catalog(args.poemas)
+    print(f"Catálogo sintético: {catalog.total_poemas} poemas\n")
+    print(f"{'backend':<20}{'tamanho':>12}{'encode (s)':>12}{'decode (s)':>12}")
+
+    raw = legacy_encode(catalog)
+    enc = best_of(args.repeat, lambda: legacy_encode(catalog))
+    dec = best_of(args.repeat, lambda: legacy_decode(raw))
+    print(f"{'stdlib (anterior)':<20}{len(raw):>12}{enc:>12.3f}{dec:>12.3f}")
+
+    for name, cls in SERIALIZERS.items():
+        for pretty in (False, True):
+            try:
+                serializer = cls(pretty=pretty)
+            except ImportError:
+                print(f"{name:<20}{'não instalado':>12}")
+                break
+            raw = serializer.encode(catalog)
+            enc = best_of(args.repeat, lambda: serializer.encode(catalog))
+            dec = best_of(args.repeat, lambda: serializer.decode(raw))
+            label = f"{name}{' (pretty)' if pretty else ''}"
+            print(f"{label:<20}{len(raw):>12}{enc:>12.3f}{dec:>12.3f}")
+
+    print(f"\nauto: {get_serializer('auto').name}")
+
+
+if __name__ == "__main__":
+    main()
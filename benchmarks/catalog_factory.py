@@ -0,0 +1,35 @@
+"""Benchmarks Catalog Factory - Catálogo Sintético para Medições"""
+
+from src.domain.models import Categoria, Poema, StructureCatalog
+
+
+def build_catalog(
+    total_poemas: int = 100_000,
+    categorias: int = 50,
+    subcategorias: int = 20
+) -> StructureCatalog:
+    """
+    Gera catálogo sintético com dois níveis de categorias.
+    
+    Args:
+        total_poemas: Número aproximado de poemas
+        categorias: Categorias de primeiro nível
+        subcategorias: Subcategorias por categoria
+        
+    Returns:
+        Catálogo com poemas distribuídos igualmente entre as subcategorias
+    """
+    por_sub = max(1, total_poemas // (categorias * subcategorias))
+    poema_id = 0
+    raizes = []
+    for i in range(categorias):
+        raiz = Categoria(nome=f"Categoria {i}", path=f"Categoria {i}")
+        for j in range(subcategorias):
+            path = f"{raiz.path}/Secção {j}"
+            sub = Categoria(nome=f"Secção {j}", path=path)
+            for _ in range(por_sub):
+                poema_id += 1
+                sub.add_poema(Poema(id=poema_id, titulo=f"Poema nº {poema_id} — ação", categoria_path=path))
+            raiz.add_subcategoria(sub)
+        raizes.append(raiz)
+    return StructureCatalog.from_categorias(raizes)
@@ -0,0 +1,164 @@
+"""Stub Site - Servidor Local no Lugar do arquivopessoa.net
+
+Serve páginas /textos/{id} com as classes que o parser de metadados
+procura e PDFs sintéticos em /typographia/textos/arquivopessoa-{id}.pdf,
+com ETag/Last-Modified e 304 para requisições condicionais. Permite
+testar e medir o crawler sem tocar no site real:
+
+    python -m benchmarks.stub_site --port 8081 --latency 80
+    pessoa metadata --base-url http://127.0.0.1:8081 --rate 50 --concurrency 8
+
+Ao encerrar (Ctrl+C), imprime requisições por status e a maior taxa
+observada em uma janela de 1 s.
+"""
+
+import argparse
+import asyncio
+import hashlib
+import random
+import time
+from collections import Counter
+from email.utils import formatdate
+from http import HTTPStatus
+from typing import Dict, Optional, Tuple
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>{titulo} - Arquivo Pessoa</title></head>
+<body>
+<div class="texto">
+  <h2 class="titulo-texto">{titulo}</h2>
+  <div class="texto-poesia"><p>Verso um do poema {id}.<br>Verso dois.</p></div>
+  <div class="autor">{autor}</div>
+  <div class="data">{data}</div>
+  <div class="fonte">{fonte}</div>
+  <div class="nota">Nota editorial &amp; observações sobre o texto {id}.</div>
+</div>
+</body></html>
+"""
+
+AUTORES = ("Fernando Pessoa", "Álvaro de Campos", "Ricardo Reis", "Alberto Caeiro", "Bernardo Soares")
+
+# Momento fixo: Last-Modified estável entre execuções do servidor
+LAST_MODIFIED = formatdate(1_700_000_000, usegmt=True)
+
+
+class StubSite:
+    """Servidor HTTP/1.1 mínimo (keep-alive) com as rotas de páginas e PDFs"""
+
+    def __init__(self, max_id: int = 5000, missing_every: int = 0, latency_ms: float = 0.0, pdf_kb: int = 64):
+        self.max_id = max_id
+        self.missing_every = missing_every
+        self.latency = latency_ms / 1000
+        self.pdf_kb = pdf_kb
+        self.status = Counter()
+        self.por_segundo = Counter()
+
+    def exists(self, poema_id: int) -> bool:
+        """IDs acima de max_id e múltiplos de missing_every não existem (404)"""
+        return 0 < poema_id <= self.max_id and not (self.missing_every and poema_id % self.missing_every == 0)
+
+    def page(self, poema_id: int) -> bytes:
+        return PAGE_TEMPLATE.format(
+            id=poema_id,
+            titulo=f"Poema nº {poema_id}",
+            autor=AUTORES[poema_id % len(AUTORES)],
+            data=f"{1910 + poema_id % 25}-{1 + poema_id % 12:02d}",
+            fonte=f"Espólio BNP/E3, {poema_id % 150}-{poema_id % 90}"
+        ).encode('utf-8')
+
+    def pdf(self, poema_id: int) -> bytes:
+        corpo = hashlib.sha256(str(poema_id).encode()).digest() * (self.pdf_kb * 32)
+        return b'%PDF-1.4\n' + corpo + b'\n%%EOF\n'
+
+    def route(self, method: str, path: str, headers: Dict[str, str]) -> Tuple[HTTPStatus, bytes, Dict[str, str]]:
+        """Status, corpo e cabeçalhos da resposta"""
+        poema_id: Optional[int] = None
+        if path.startswith('/textos/'):
+            content_type, build = 'text/html; charset=utf-8', self.page
+            id_text = path[len('/textos/'):]
+        elif path.startswith('/typographia/textos/arquivopessoa-') and path.endswith('.pdf'):
+            content_type, build = 'application/pdf', self.pdf
+            id_text = path[len('/typographia/textos/arquivopessoa-'):-len('.pdf')]
+        else:
+            return HTTPStatus.NOT_FOUND, b'', {}
+
+        if id_text.isdigit():
+            poema_id = int(id_text)
+        if poema_id is None or not self.exists(poema_id):
+            return HTTPStatus.NOT_FOUND, b'', {}
+
+        body = build(poema_id)
+        etag = f'"{hashlib.md5(body).hexdigest()[:16]}"'
+        validators = {'ETag': etag, 'Last-Modified': LAST_MODIFIED, 'Content-Type': content_type}
+        if headers.get('if-none-match') == etag:
+            return HTTPStatus.NOT_MODIFIED, b'', validators
+        if method == 'HEAD':
+            return HTTPStatus.OK, b'', {**validators, 'Content-Length': str(len(body))}
+        return HTTPStatus.OK, body, validators
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while request_line := await reader.readline():
+                headers: Dict[str, str] = {}
+                while (line := await reader.readline()) not in (b'\r\n', b'\n', b''):
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+
+                parts = request_line.decode('latin-1').split()
+                if len(parts) < 2:
+                    return
+                method, path = parts[0].upper(), parts[1].split('?')[0]
+                if self.latency:
+                    await asyncio.sleep(self.latency * random.uniform(0.5, 1.5))
+
+                status, body, extra = self.route(method, path, headers)
+                self.status[status.value] += 1
+                self.por_segundo[int(time.time())] += 1
+
+                response_headers = {'Content-Length': str(len(body)), **extra}
+                head = f"HTTP/1.1 {status.value} {status.phrase}\r\n" + ''.join(
+                    f"{name}: {value}\r\n" for name, value in response_headers.items()
+                ) + "\r\n"
+                writer.write(head.encode('latin-1') + body)
+                await writer.drain()
+                if headers.get('connection', '').lower() == 'close':
+                    return
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    def summary(self) -> str:
+        pico = max(self.por_segundo.values(), default=0)
+        status = ', '.join(f"{code}: {count}" for code, count in sorted(self.status.items()))
+        return f"{sum(self.status.values())} requisições ({status or '-'}); pico de {pico} req/s"
+
+
+async def serve(site: StubSite, addr: str, port: int) -> None:
+    server = await asyncio.start_server(site.handle, addr, port)
+    print(f"Stub em http://{addr}:{server.sockets[0].getsockname()[1]} (IDs 1..{site.max_id})", flush=True)
+    async with server:
+        await server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=8081)
+    parser.add_argument("--addr", default="127.0.0.1")
+    parser.add_argument("--max-id", type=int, default=5000, help="Maior ID existente")
+    parser.add_argument("--missing-every", type=int, default=0, help="IDs múltiplos deste valor dão 404")
+    parser.add_argument("--latency", type=float, default=0.0, help="Latência média por requisição (ms)")
+    parser.add_argument("--pdf-kb", type=int, default=64, help="Tamanho dos PDFs sintéticos (KB)")
+    args = parser.parse_args()
+
+    site = StubSite(args.max_id, args.missing_every, args.latency, args.pdf_kb)
+    try:
+        asyncio.run(serve(site, args.addr, args.port))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print(site.summary())
+
+
+if __name__ == "__main__":
+    main()
@@ -1,27 +1,42 @@
-"""Configuration and Factory Functions"""
+"""Configuration and Factory Functions
+
+Os imports de infraestrutura e serviços ficam dentro de cada factory:
+importar o container não carrega Playwright, BeautifulSoup ou httpx, e
+cada comando paga só pelo que usa (ver benchmarks/bench_import.py).
+"""
 
 from pathlib import Path
-from typing import Optional
-from src.infrastructure.browser import PlaywrightBrowser
-from src.infrastructure.parser import HtmlParserAdapter
-from src.infrastructure.http_client import HttpDownloader
-from src.infrastructure.repositories import (
-    JsonStructureRepository,
-    PdfFileRepository
-)
-from src.application.scraper_service import WebScraperService
-from src.application.filter_service import FilterService
-from src.application.download_service import DownloadService
-from src.application.structure_service import StructureService
-from src.application.persistence_service import PersistenceService
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from src.infrastructure.manifest import SqliteManifestRepository
+    from src.application.scraper_service import WebScraperService
+    from src.application.filter_service import FilterService
+    from src.application.download_service import DownloadService
+    from src.application.structure_service import StructureService
+    from src.application.persistence_service import PersistenceService
+    from src.application.diff_service import DiffService
+    from src.application.report_service import ReportService
+    from src.application.sync_service import SyncService
+    from src.application.extraction_service import ExtractionService
+    from src.application.search_service import SearchService
+    from src.application.export_service import ExportService
+    from src.application.metadata_service import MetadataService
+    from src.application.discovery_service import DiscoveryService
+    from src.application.plan_service import PlanService
+    from src.infrastructure.http_client import HttpDownloader
 
 
 class DIContainer:
     """Dependency Injection Container - Factory para dependências"""
 
     @staticmethod
-    def create_scraper_service(headless: bool = False) -> WebScraperService:
+    def create_scraper_service(headless: bool = False) -> "WebScraperService":
         """Factory para WebScraperService"""
+        from src.infrastructure.browser import PlaywrightBrowser
+        from src.infrastructure.parser import HtmlParserAdapter
+        from src.application.scraper_service import WebScraperService
+
         browser = PlaywrightBrowser(headless=headless)
         parser = HtmlParserAdapter()
         return WebScraperService(browser, parser)
@@ -30,26 +45,283 @@ class DIContainer:
     def create_download_service(
         base_path: Path,
         min_delay: float = 3.0,
-        max_delay: float = 7.0
-    ) -> DownloadService:
-        """Factory para DownloadService"""
-        http_downloader = HttpDownloader()
-        pdf_repo = PdfFileRepository(base_path)
+        max_delay: float = 7.0,
+        manifest: Optional["SqliteManifestRepository"] = None,
+        ledger_path: Optional[Path] = None
+    ) -> "DownloadService":
+        """
+        Factory para DownloadService.
+
+        Com manifesto, cada PDF salvo é registrado; com ledger_path, cada
+        tentativa HTTP é anexada ao ledger de requisições.
+        """
+        from src.infrastructure.http_client import HttpDownloader
+        from src.infrastructure.ledger import RequestLedger
+        from src.infrastructure.repositories import PdfFileRepository
+        from src.application.download_service import DownloadService
+
+        ledger = RequestLedger(ledger_path) if ledger_path else None
+        http_downloader = HttpDownloader(ledger=ledger)
+        pdf_repo = PdfFileRepository(base_path, manifest)
         return DownloadService(http_downloader, pdf_repo, base_path, min_delay, max_delay)
 
     @staticmethod
-    def create_persistence_service() -> PersistenceService:
-        """Factory para PersistenceService"""
-        json_repo = JsonStructureRepository()
+    def create_persistence_service(
+        serializer: str = "auto",
+        pretty: bool = False,
+        format: str = "json",
+        compression: Optional[str] = None
+    ) -> "PersistenceService":
+        """
+        Factory para PersistenceService.
+
+        format: "json" (default), "binary" (mmap, leitura lazy) ou
+        "sqlite" (upserts incrementais e consultas SQL)
+        compression: "zstd", "gzip", "auto" ou None, só para JSON; a
+        leitura detecta o codec automaticamente
+        """
+        from src.application.persistence_service import PersistenceService
+
+        if format == "binary":
+            from src.infrastructure.binary_catalog import BinaryStructureRepository
+            return PersistenceService(
+                BinaryStructureRepository(),
+                Path("output/categorias_estrutura.bin")
+            )
+        if format == "sqlite":
+            from src.infrastructure.sqlite_catalog import SqliteStructureRepository
+            return PersistenceService(
+                SqliteStructureRepository(),
+                Path("output/categorias_estrutura.db")
+            )
+        if format != "json":
+            raise ValueError(f"Formato de catálogo desconhecido: {format}")
+        from src.infrastructure.repositories import JsonStructureRepository
+        from src.infrastructure.serializers import get_serializer
+
+        json_repo = JsonStructureRepository(get_serializer(serializer, pretty), compression)
         return PersistenceService(json_repo)
 
     @staticmethod
-    def create_filter_service(base_path: Path) -> FilterService:
-        """Factory para FilterService"""
-        return FilterService(base_path)
+    def create_catalog_reader(format: str = "auto") -> "PersistenceService":
+        """
+        Factory para leitura do catálogo pelos comandos.
+
+        "auto": a cópia binária (mmap, decodifica uma raiz ou subárvore
+        por vez) quando existe e não é mais antiga que o JSON; senão o
+        JSON, lido em streaming. Outro valor força o formato. O arquivo
+        do serviço devolvido pode não existir: quem chama confere.
+        """
+        if format != "auto":
+            return DIContainer.create_persistence_service(format=format)
+
+        json_service = DIContainer.create_persistence_service()
+        binary_service = DIContainer.create_persistence_service(format="binary")
+        return binary_service if binary_service.is_current_copy_of(json_service) else json_service
+
+    @staticmethod
+    def create_filter_service(
+        base_path: Path,
+        max_workers: int = 16,
+        manifest: Optional["SqliteManifestRepository"] = None
+    ) -> "FilterService":
+        """Factory para FilterService (max_workers: listagens de diretório em paralelo)"""
+        from src.application.filter_service import FilterService
+
+        return FilterService(base_path, max_workers, manifest)
+
+    @staticmethod
+    def create_manifest(base_path: Path) -> "SqliteManifestRepository":
+        """Factory para o manifesto de downloads, guardado junto dos PDFs"""
+        from src.infrastructure.manifest import SqliteManifestRepository
+
+        return SqliteManifestRepository((base_path or Path("arquivos_pessoa")) / ".manifest.db")
 
     @staticmethod
-    def create_structure_service() -> StructureService:
+    def create_structure_service(
+        serializer: str = "auto",
+        pretty: bool = False
+    ) -> "StructureService":
         """Factory para StructureService"""
-        json_repo = JsonStructureRepository()
+        from src.infrastructure.repositories import JsonStructureRepository
+        from src.infrastructure.serializers import get_serializer
+        from src.application.structure_service import StructureService
+
+        json_repo = JsonStructureRepository(get_serializer(serializer, pretty))
         return StructureService(json_repo)
+
+    @staticmethod
+    def create_diff_service() -> "DiffService":
+        """Factory para DiffService"""
+        from src.application.diff_service import DiffService
+
+        return DiffService()
+
+    @staticmethod
+    def create_report_service() -> "ReportService":
+        """Factory para ReportService"""
+        from src.application.report_service import ReportService
+
+        return ReportService()
+
+    @staticmethod
+    def create_sync_service(
+        base_path: Path,
+        headless: bool = True,
+        min_delay: float = 2.0,
+        max_delay: float = 2.3,
+        ledger_path: Optional[Path] = None
+    ) -> "SyncService":
+        """
+        Factory para SyncService (modo daemon).
+
+        Reúne scraper, download, persistência, filtro e diff sobre um
+        único manifesto; browser e cliente HTTP são abertos pelo chamador
+        e mantidos abertos entre as tarefas.
+        """
+        from src.application.sync_service import SyncService
+
+        manifest = DIContainer.create_manifest(base_path)
+        return SyncService(
+            scraper_service=DIContainer.create_scraper_service(headless=headless),
+            download_service=DIContainer.create_download_service(
+                base_path, min_delay, max_delay, manifest=manifest, ledger_path=ledger_path
+            ),
+            persistence_service=DIContainer.create_persistence_service(compression="auto"),
+            binary_service=DIContainer.create_persistence_service(format="binary"),
+            filter_service=DIContainer.create_filter_service(base_path, manifest=manifest),
+            diff_service=DIContainer.create_diff_service(),
+            manifest=manifest
+        )
+
+    @staticmethod
+    def create_extraction_service(
+        base_path: Path,
+        store_path: Optional[Path] = None,
+        extractor: str = "auto",
+        max_workers: Optional[int] = None
+    ) -> "ExtractionService":
+        """
+        Factory para ExtractionService.
+
+        extractor: "pdftotext", "pypdf" ou "auto"; textos vão para
+        store_path (default output/textos.db). O manifesto, se existir,
+        fornece os hashes e evita re-hashear os PDFs.
+        """
+        from src.infrastructure.text_store import SqliteTextStore
+        from src.application.extraction_service import ExtractionService
+
+        store = SqliteTextStore(store_path or SqliteTextStore.DEFAULT_PATH)
+        manifest = None
+        if (base_path / ".manifest.db").exists():
+            manifest = DIContainer.create_manifest(base_path)
+        return ExtractionService(base_path, store, extractor, max_workers, manifest)
+
+    @staticmethod
+    def create_search_service(index_path: Optional[Path] = None) -> "SearchService":
+        """Factory para SearchService (índice em index_path, default output/busca.db)"""
+        from src.infrastructure.search_index import SqliteSearchIndex
+        from src.application.search_service import SearchService
+
+        return SearchService(SqliteSearchIndex(index_path or SqliteSearchIndex.DEFAULT_PATH))
+
+    @staticmethod
+    def create_export_service(base_path: Path) -> "ExportService":
+        """Factory para ExportService (usa o manifesto, se existir, para conferir os hashes)"""
+        from src.application.export_service import ExportService
+
+        manifest = None
+        if (base_path / ".manifest.db").exists():
+            manifest = DIContainer.create_manifest(base_path)
+        return ExportService(base_path, manifest)
+
+    @staticmethod
+    def create_metadata_service(
+        store_path: Optional[Path] = None,
+        concurrency: int = 4,
+        rate: float = 1.0,
+        max_age_days: float = 30.0,
+        base_url: Optional[str] = None,
+        ledger_path: Optional[Path] = None
+    ) -> "MetadataService":
+        """
+        Factory para MetadataService (crawler das páginas /textos/{id}).
+
+        Todas as tasks compartilham um cliente HTTP limitado a `rate`
+        requisições por segundo; base_url aponta para outro servidor (ex.:
+        benchmarks/stub_site.py). Metadados vão para store_path (default
+        output/metadados.db).
+        """
+        from src.infrastructure.metadata_store import SqliteMetadataStore
+        from src.application.metadata_service import MetadataService
+
+        http_downloader = DIContainer.create_http_client(rate, base_url, ledger_path)
+        store = SqliteMetadataStore(store_path or SqliteMetadataStore.DEFAULT_PATH)
+        return MetadataService(http_downloader, store, concurrency, max_age_days)
+
+    @staticmethod
+    def create_http_client(
+        rate: float,
+        base_url: Optional[str] = None,
+        ledger_path: Optional[Path] = None
+    ) -> "HttpDownloader":
+        """
+        Factory para um HttpDownloader compartilhado por tasks concorrentes,
+        limitado a `rate` requisições por segundo.
+        """
+        from src.infrastructure.http_client import HttpDownloader
+        from src.infrastructure.ledger import RequestLedger
+        from src.infrastructure.rate_limiter import AsyncRateLimiter
+
+        return HttpDownloader(
+            ledger=RequestLedger(ledger_path) if ledger_path else None,
+            base_url=base_url or HttpDownloader.BASE_URL,
+            rate_limiter=AsyncRateLimiter(rate)
+        )
+
+    @staticmethod
+    def create_discovery_service(
+        concurrency: int = 8,
+        rate: float = 2.0,
+        base_url: Optional[str] = None,
+        ledger_path: Optional[Path] = None,
+        dense_span: int = 16,
+        min_span: int = 256,
+        beyond: int = 1024,
+        exhaustive: bool = False
+    ) -> "DiscoveryService":
+        """
+        Factory para DiscoveryService (sondagem de IDs por HEAD).
+
+        dense_span/min_span controlam a bisseção das lacunas do catálogo
+        e beyond até onde procurar IDs acima do maior ID conhecido.
+        """
+        from src.application.discovery_service import DiscoveryService
+
+        return DiscoveryService(
+            DIContainer.create_http_client(rate, base_url, ledger_path),
+            concurrency, dense_span, min_span, beyond, exhaustive
+        )
+
+    @staticmethod
+    def create_plan_service(
+        base_path: Path,
+        concurrency: int = 8,
+        rate: float = 2.0,
+        base_url: Optional[str] = None,
+        ledger_path: Optional[Path] = None,
+        min_delay: float = 2.0,
+        max_delay: float = 2.3
+    ) -> "PlanService":
+        """
+        Factory para PlanService (HEAD nos faltantes antes do download).
+
+        min_delay/max_delay devem ser os do download que vai executar o
+        plano: entram na estimativa de duração.
+        """
+        from src.application.plan_service import PlanService
+
+        return PlanService(
+            DIContainer.create_http_client(rate, base_url, ledger_path),
+            base_path, concurrency, min_delay, max_delay
+        )
@@ -6,12 +6,10 @@ import logging
 from pathlib import Path
 from pydantic import BaseModel
 from scraper import ArquivoPessoaScraper  
+from src.infrastructure import compressed_io
+from src.utils.logger import setup_logging
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s'
-)
-logger = logging.getLogger(__name__)
+logger = setup_logging(__name__, logging.INFO)
 
 
 
@@ -152,7 +150,8 @@ async def main():
             logger.error(f"Estrutura de categorias não encontrada em {estrutura_path}")
             return
 
-        with open(estrutura_path, "r", encoding="utf-8") as f:
+        # O catálogo pode estar comprimido (zstd/gzip): detecção pelos magic bytes
+        with compressed_io.open_read(Path(estrutura_path)) as f:
             categorias_data = json.load(f)
 
         logger.info("Iniciando download de poemas faltantes...")
@@ -5,33 +5,12 @@ import random
 from retry import retry
 from pathlib import Path
 from bs4 import BeautifulSoup
-from pydantic import BaseModel
 from typing import Optional
 from playwright.async_api import async_playwright
+from src.domain.models import Poema, Categoria
+from src.utils.logger import setup_logging
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s'
-)
-logger = logging.getLogger(__name__)
-
-
-class Poema(BaseModel):
-    """Modelo para representar um poema"""
-    id: int
-    titulo: str
-    categoria_path: str
-
-
-class Categoria(BaseModel):
-    """Modelo para representar uma categoria"""
-    nome: str
-    path: str
-    poemas: list[Poema] = []
-    subcategorias: list['Categoria'] = []
-
-
-Categoria.model_rebuild()
+logger = setup_logging(__name__, logging.INFO)
 
 
 class ArquivoPessoaScraper:
@@ -185,13 +164,13 @@ class ArquivoPessoaScraper:
                 for li_texto in ul_interna.find_all('li', class_='texto', recursive=False):
                     poema = self._parse_poema(li_texto, path)
                     if poema:
-                        categoria.poemas.append(poema)
+                        categoria.add_poema(poema)
                 
                 # Procura por subcategorias
                 for li_sub in ul_interna.find_all('li', class_='categoria', recursive=False):
                     sub_categoria = self._parse_categoria(li_sub, path)
                     if sub_categoria:
-                        categoria.subcategorias.append(sub_categoria)
+                        categoria.add_subcategoria(sub_categoria)
             
             return categoria
         except Exception as e:
@@ -274,11 +253,8 @@ class ArquivoPessoaScraper:
 
 
     def _count_poemas(self, categoria: Categoria) -> int:
-        """Conta poemas recursivamente"""
-        count = len(categoria.poemas)
-        for sub in categoria.subcategorias:
-            count += self._count_poemas(sub)
-        return count
+        """Conta poemas recursivamente (agregado em cache)"""
+        return categoria.total_poemas
 
 def save_to_file_json(data: dict, filepath: Path):
     """Salva dados em um arquivo JSON"""
@@ -0,0 +1,220 @@
+"""Application Diff Service - Comparação entre Snapshots do Catálogo"""
+
+import logging
+import os
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+from src.domain.models import (
+    Categoria,
+    CatalogDiff,
+    CategoriaChange,
+    PoemaChange,
+    StructureCatalog
+)
+from src.domain.repositories import IManifestRepository
+
+logger = logging.getLogger(__name__)
+
+
+def _parent_path(path: str) -> str:
+    """Path da categoria pai ('' para primeiro nível)"""
+    return path.rsplit('/', 1)[0] if '/' in path else ''
+
+
+def _signature(categoria: Categoria) -> Optional[Tuple[frozenset, Tuple[str, ...]]]:
+    """
+    Assinatura de conteúdo usada para reconhecer uma categoria
+    renomeada/movida: ids dos poemas diretos + nomes das subcategorias.
+    """
+    poema_ids = frozenset(poema.id for poema in categoria.poemas)
+    sub_nomes = tuple(sorted(sub.nome for sub in categoria.subcategorias))
+    if not poema_ids and not sub_nomes:
+        return None  # Categoria vazia: não há como reconhecê-la
+    return poema_ids, sub_nomes
+
+
+class DiffService:
+    """Serviço para comparar dois snapshots do catálogo em tempo linear"""
+
+    def diff(self, antigo: StructureCatalog, novo: StructureCatalog) -> CatalogDiff:
+        """
+        Compara dois catálogos. Poemas são identificados pelo id e
+        categorias pelo path.
+
+        Args:
+            antigo: Snapshot anterior
+            novo: Snapshot atual
+
+        Returns:
+            Diferenças encontradas
+        """
+        diff = CatalogDiff()
+        self._diff_poemas(antigo, novo, diff)
+        self._diff_categorias(antigo, novo, diff)
+        logger.info(f"✓ Diff calculado: {diff.summary()}")
+        return diff
+
+    @staticmethod
+    def _diff_poemas(antigo: StructureCatalog, novo: StructureCatalog, diff: CatalogDiff) -> None:
+        """Compara poemas via índices id -> poema dos dois catálogos"""
+        old_poemas = antigo.index.poemas
+        new_poemas = novo.index.poemas
+
+        for poema_id, (poema, _) in new_poemas.items():
+            entry = old_poemas.get(poema_id)
+            if entry is None:
+                diff.poemas_adicionados.append(poema)
+                continue
+
+            anterior = entry[0]
+            if anterior.titulo != poema.titulo:
+                diff.poemas_renomeados.append(PoemaChange(id=poema_id, antes=anterior, depois=poema))
+            if anterior.categoria_path != poema.categoria_path:
+                diff.poemas_movidos.append(PoemaChange(id=poema_id, antes=anterior, depois=poema))
+
+        for poema_id, (poema, _) in old_poemas.items():
+            if poema_id not in new_poemas:
+                diff.poemas_removidos.append(poema)
+
+    @staticmethod
+    def _diff_categorias(antigo: StructureCatalog, novo: StructureCatalog, diff: CatalogDiff) -> None:
+        """
+        Compara categorias por path. Pares removida/adicionada com a mesma
+        assinatura de conteúdo são reportados como renomeados (mesmo pai)
+        ou movidos (pai diferente). Movimentos implícitos, causados pela
+        renomeação de um ancestral, não são repetidos.
+        """
+        old_cats = antigo.index.categorias
+        new_cats = novo.index.categorias
+
+        removidas = [path for path in old_cats if path not in new_cats]
+        adicionadas = [path for path in new_cats if path not in old_cats]
+
+        # Assinaturas ambíguas (repetidas) não são usadas para pareamento
+        by_signature: Dict[tuple, Optional[str]] = {}
+        for path in removidas:
+            signature = _signature(old_cats[path])
+            if signature is not None:
+                by_signature[signature] = None if signature in by_signature else path
+
+        renamed: Dict[str, str] = {}
+        for path in adicionadas:
+            signature = _signature(new_cats[path])
+            old_path = by_signature.pop(signature, None) if signature is not None else None
+            if old_path is not None:
+                renamed[old_path] = path
+
+        for old_path, new_path in renamed.items():
+            old_parent, new_parent = _parent_path(old_path), _parent_path(new_path)
+            if old_parent == new_parent:
+                diff.categorias_renomeadas.append(CategoriaChange(path_antes=old_path, path_depois=new_path))
+            elif renamed.get(old_parent) == new_parent and old_cats[old_path].nome == new_cats[new_path].nome:
+                continue  # Consequência da renomeação do pai
+            else:
+                diff.categorias_movidas.append(CategoriaChange(path_antes=old_path, path_depois=new_path))
+
+        matched_new = set(renamed.values())
+        diff.categorias_removidas.extend(path for path in removidas if path not in renamed)
+        diff.categorias_adicionadas.extend(path for path in adicionadas if path not in matched_new)
+
+    @staticmethod
+    def filter_changed(
+        categorias: Iterable[Categoria],
+        poema_ids: set
+    ) -> List[Categoria]:
+        """
+        Reduz a árvore aos poemas cujos ids estão em poema_ids,
+        no mesmo formato consumido por DownloadService.
+
+        Args:
+            categorias: Categorias do catálogo novo
+            poema_ids: Ids a manter (ex.: CatalogDiff.changed_poema_ids)
+
+        Returns:
+            Categorias contendo apenas os poemas selecionados
+        """
+        result = []
+        for categoria in categorias:
+            if categoria.total_poemas == 0:
+                continue
+            subcategorias = DiffService.filter_changed(categoria.subcategorias, poema_ids)
+            poemas = [poema for poema in categoria.poemas if poema.id in poema_ids]
+            if poemas or subcategorias:
+                result.append(Categoria(
+                    nome=categoria.nome,
+                    path=categoria.path,
+                    poemas=poemas,
+                    subcategorias=subcategorias
+                ))
+        return result
+
+    def relocate(self, diff: CatalogDiff, base_path: Path, manifest: IManifestRepository) -> int:
+        """
+        Move no disco os PDFs de poemas que só mudaram de categoria, em
+        vez de baixá-los de novo.
+
+        Renomear uma categoria marca todos os seus poemas como movidos;
+        o conteúdo do PDF não muda, então o arquivo registrado no path
+        antigo vai para o novo (os.replace) e a entrada do manifesto o
+        acompanha. Poemas também renomeados ficam para o download (o
+        título faz parte do PDF). Diretórios antigos que ficam vazios
+        são removidos.
+
+        Args:
+            diff: Diff entre o catálogo anterior e o atual
+            base_path: Diretório base dos PDFs
+            manifest: Manifesto reconciliado
+
+        Returns:
+            Arquivos movidos
+        """
+        movidos = 0
+        for change in diff.poemas_movidos:
+            if change.antes.titulo != change.depois.titulo:
+                continue
+            origem = change.antes.relative_path(change.antes.categoria_path)
+            destino = change.depois.relative_path(change.depois.categoria_path)
+            entry = next((e for e in manifest.get(change.id) if e.path == origem), None)
+            if entry is None or (base_path / destino).exists():
+                continue
+
+            (base_path / destino).parent.mkdir(parents=True, exist_ok=True)
+            try:
+                os.replace(base_path / origem, base_path / destino)
+            except FileNotFoundError:
+                manifest.remove(change.id, origem)
+                continue
+            # Nova entrada antes de remover a antiga: uma queda no meio deixa
+            # só uma entrada órfã, que a próxima reconciliação descarta
+            manifest.record(entry.model_copy(update={'path': destino}))
+            manifest.remove(change.id, origem)
+            self._prune_empty(base_path, (base_path / origem).parent)
+            movidos += 1
+
+        if movidos:
+            logger.info(f"✓ {movidos} PDFs movidos localmente para as novas categorias")
+        return movidos
+
+    @staticmethod
+    def _prune_empty(base_path: Path, directory: Path) -> None:
+        """Remove diretórios vazios de directory até (sem incluir) base_path"""
+        while directory != base_path and base_path in directory.parents:
+            try:
+                directory.rmdir()
+            except OSError:
+                return  # Não vazio
+            directory = directory.parent
+
+    @staticmethod
+    def save_diff(diff: CatalogDiff, filepath: Path) -> None:
+        """Persiste diff em JSON"""
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        filepath.write_text(diff.model_dump_json(indent=4), encoding='utf-8')
+        logger.info(f"✓ Diff salvo em {filepath}")
+
+    @staticmethod
+    def load_diff(filepath: Path) -> CatalogDiff:
+        """Carrega diff salvo por save_diff"""
+        if not filepath.exists():
+            raise FileNotFoundError(f"Arquivo de diff não encontrado: {filepath}")
+        return CatalogDiff.model_validate_json(filepath.read_bytes())
@@ -0,0 +1,164 @@
+"""Application Discovery Service - Sondagem do Espaço de IDs contra o Catálogo"""
+
+import asyncio
+import logging
+import time
+from typing import Dict, List, Optional, Set, Tuple
+from src.domain.models import ProbeReport
+from src.infrastructure.http_client import HttpDownloader
+from src.utils import metrics
+
+logger = logging.getLogger(__name__)
+
+PROBES = metrics.counter("pessoa_probe_requests", "Sondagens HEAD de IDs, por resultado", ["resultado"])
+
+
+class DiscoveryService:
+    """
+    Procura poemas que existem no servidor mas faltam no catálogo, sem
+    browser: HEAD no PDF de IDs fora do catálogo.
+
+    1. Limite superior: HEAD em max+1, max+2, max+4, ... até max+beyond
+       e bisseção entre o último ID existente e a sondagem seguinte.
+    2. Lacunas: cada faixa contígua de IDs fora do catálogo em
+       [1, limite] é bissectada. Faixas de até dense_span IDs são
+       sondadas inteiras; nas maiores, extremos e meio são sondados e a
+       faixa é dividida. Sem nenhum acerto, faixas de até min_span IDs
+       são dadas como vazias (amostragem); com exhaustive, todo ID é
+       sondado.
+
+    Sondagens rodam em paralelo (até `concurrency` em voo), no ritmo do
+    limitador de taxa do cliente HTTP.
+    """
+
+    def __init__(
+        self,
+        http_downloader: HttpDownloader,
+        concurrency: int = 8,
+        dense_span: int = 16,
+        min_span: int = 256,
+        beyond: int = 1024,
+        exhaustive: bool = False
+    ):
+        self.http_downloader = http_downloader
+        self.concurrency = max(1, concurrency)
+        self.dense_span = max(1, dense_span)
+        self.min_span = max(self.dense_span, min_span)
+        self.beyond = max(1, beyond)
+        self.exhaustive = exhaustive
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._probes: Dict[int, asyncio.Task] = {}
+        self._erros: Dict[int, str] = {}
+        self._vazias: List[Tuple[int, int]] = []
+
+    async def probe(self, catalog_ids: Set[int]) -> ProbeReport:
+        """
+        Sonda o espaço de IDs e cruza com o catálogo.
+
+        Args:
+            catalog_ids: IDs de poemas do catálogo
+
+        Returns:
+            Relatório com IDs fora do catálogo, limite e faixas presumidas vazias
+        """
+        inicio = time.monotonic()
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        self._probes, self._erros, self._vazias = {}, {}, []
+        maximo = max(catalog_ids, default=0)
+
+        limite = await self._find_upper(maximo)
+        lacunas = self._gaps(catalog_ids, limite)
+        logger.info(
+            f"🔭 Limite superior: {limite} (catálogo vai até {maximo}); "
+            f"{len(lacunas)} lacunas, {sum(hi - lo + 1 for lo, hi in lacunas)} IDs fora do catálogo"
+        )
+        await asyncio.gather(*(self._explore(lo, hi) for lo, hi in lacunas))
+
+        existentes = sorted(
+            poema_id for poema_id, task in self._probes.items()
+            if task.result() and poema_id not in catalog_ids
+        )
+        return ProbeReport(
+            ids_catalogo=len(catalog_ids),
+            maximo_catalogo=maximo,
+            limite_superior=limite,
+            sondagens=len(self._probes),
+            fora_do_catalogo=existentes,
+            faixas_vazias=sorted(self._vazias),
+            erros=dict(sorted(self._erros.items())),
+            duracao=time.monotonic() - inicio
+        )
+
+    @staticmethod
+    def _gaps(catalog_ids: Set[int], limite: int) -> List[Tuple[int, int]]:
+        """Faixas contíguas [lo, hi] de IDs em [1, limite] fora do catálogo"""
+        lacunas: List[Tuple[int, int]] = []
+        anterior = 0
+        for poema_id in sorted(i for i in catalog_ids if 0 < i <= limite):
+            if poema_id > anterior + 1:
+                lacunas.append((anterior + 1, poema_id - 1))
+            anterior = poema_id
+        if limite > anterior:
+            lacunas.append((anterior + 1, limite))
+        return lacunas
+
+    async def _exists(self, poema_id: int) -> bool:
+        """HEAD no PDF, no máximo uma vez por ID (chamadas concorrentes compartilham a mesma)"""
+        task = self._probes.get(poema_id)
+        if task is None:
+            task = self._probes[poema_id] = asyncio.ensure_future(self._head(poema_id))
+        return await task
+
+    async def _head(self, poema_id: int) -> bool:
+        async with self._semaphore:
+            try:
+                status, _ = await self.http_downloader.head(poema_id)
+            except Exception as e:
+                status = getattr(getattr(e, 'response', None), 'status_code', 0)
+                self._erros[poema_id] = f"HTTP {status}" if status else type(e).__name__
+                PROBES.labels(resultado="erro").inc()
+                return False
+        existe = 200 <= status < 300
+        PROBES.labels(resultado="existe" if existe else "ausente").inc()
+        return existe
+
+    async def _find_upper(self, maximo: int) -> int:
+        """Maior ID existente além do catálogo (passos exponenciais e bisseção)"""
+        pontos = []
+        passo = 1
+        while passo <= self.beyond:
+            pontos.append(maximo + passo)
+            passo *= 2
+        acertos = await asyncio.gather(*(self._exists(ponto) for ponto in pontos))
+
+        ultimo = max((ponto for ponto, existe in zip(pontos, acertos) if existe), default=maximo)
+        seguinte = next((ponto for ponto in pontos if ponto > ultimo), None)
+        if seguinte is None:
+            logger.warning(f"⚠️  Há IDs existentes até {ultimo}: aumente --beyond para sondar além")
+            return ultimo
+
+        # Invariante: lo existe (ou é o fim do catálogo), hi não
+        lo, hi = ultimo, seguinte
+        while hi - lo > 1:
+            meio = (lo + hi) // 2
+            if await self._exists(meio):
+                lo = meio
+            else:
+                hi = meio
+        return lo
+
+    async def _explore(self, lo: int, hi: int) -> None:
+        """Bisseção adaptativa de uma faixa de IDs fora do catálogo"""
+        tamanho = hi - lo + 1
+        if tamanho <= 0:
+            return
+        if tamanho <= self.dense_span:
+            await asyncio.gather(*(self._exists(poema_id) for poema_id in range(lo, hi + 1)))
+            return
+
+        meio = (lo + hi) // 2
+        acertos = await asyncio.gather(self._exists(lo), self._exists(meio), self._exists(hi))
+        if any(acertos) or tamanho > self.min_span or self.exhaustive:
+            await asyncio.gather(self._explore(lo + 1, meio - 1), self._explore(meio + 1, hi - 1))
+        else:
+            self._vazias.append((lo, hi))
@@ -4,14 +4,20 @@ import asyncio
 import logging
 import random
 from pathlib import Path
-from typing import Optional
-from src.domain.models import Categoria
+from typing import List, Optional
+from src.domain.models import Categoria, PlanItem, pdf_filename, pdf_relative_path
 from src.infrastructure.http_client import HttpDownloader
 from src.infrastructure.repositories import PdfFileRepository
 from src.application.progress_tracker import ProgressTracker
+from src.utils import metrics
+from src.utils import profiling
 
 logger = logging.getLogger(__name__)
 
+DOWNLOADS_IN_FLIGHT = metrics.gauge("pessoa_downloads_in_flight", "Downloads em andamento")
+DOWNLOADS_QUEUED = metrics.gauge("pessoa_downloads_queued", "Poemas da categoria corrente aguardando download")
+DOWNLOADS = metrics.counter("pessoa_downloads", "Downloads concluídos por resultado", ["resultado"])
+
 
 class DownloadService:
     """Serviço para gerenciar downloads de PDFs com retry e delays"""
@@ -49,26 +55,78 @@ class DownloadService:
         # Baixar poemas desta categoria
         if categoria.poemas:
             logger.info(f"Baixando {len(categoria.poemas)} poemas de '{categoria.nome}'...")
+            DOWNLOADS_QUEUED.set(len(categoria.poemas))
 
             for poema in categoria.poemas:
-                pdf_filename = f"{poema.id:04d} - {poema.titulo}.pdf"
-                pdf_path = categoria_dir / pdf_filename
-
-                try:
-                    await self.http_downloader.download_and_save(poema.id, pdf_path)
-                    progress_tracker.increment(pdf_filename)
-                except Exception as e:
-                    logger.error(f"  ✗ [{progress_tracker.atual + 1:04d}/{progress_tracker.total:04d}] {pdf_filename}: {e}")
-                    progress_tracker.increment()  # Incrementar mesmo com erro
-
-                # Delay aleatório entre downloads
-                delay = random.uniform(self.min_delay, self.max_delay)
-                await asyncio.sleep(delay)
+                DOWNLOADS_QUEUED.dec()
+                size = await self._download_poema(poema.id, poema.titulo, categoria.path, progress_tracker)
+                if size is not None:
+                    categoria.record_bytes(poema.id, size)
+                await self._delay()
 
         # Processar subcategorias recursivamente
         for subcategoria in categoria.subcategorias:
             await self.download_categoria_recursively(subcategoria, progress_tracker)
 
+    async def download_plan(
+        self,
+        itens: List[PlanItem],
+        progress_tracker: ProgressTracker
+    ) -> None:
+        """
+        Executa um plano de `pessoa plan`: baixa os itens na ordem do plano.
+
+        Args:
+            itens: Itens pendentes do plano, na ordem de execução
+            progress_tracker: Rastreador de progresso
+        """
+        DOWNLOADS_QUEUED.set(len(itens))
+        for posicao, item in enumerate(itens):
+            (self.base_path / item.categoria_path).mkdir(parents=True, exist_ok=True)
+            DOWNLOADS_QUEUED.dec()
+            size = await self._download_poema(item.poema_id, item.titulo, item.categoria_path, progress_tracker)
+            if size is not None and item.size is not None and size != item.size:
+                logger.warning(
+                    f"  ⚠️  {item.filename}: {size} bytes, o HEAD do plano informou {item.size}",
+                    extra={'poem_id': item.poema_id, 'bytes': size}
+                )
+            if posicao < len(itens) - 1:
+                await self._delay()
+
+    async def _download_poema(
+        self,
+        poema_id: int,
+        titulo: str,
+        categoria_path: str,
+        progress_tracker: ProgressTracker
+    ) -> Optional[int]:
+        """Baixa e salva um PDF; retorna o tamanho (None em caso de erro)"""
+        filename = pdf_filename(poema_id, titulo)
+        pdf_path = self.base_path / pdf_relative_path(categoria_path, poema_id, titulo)
+
+        DOWNLOADS_IN_FLIGHT.inc()
+        try:
+            with profiling.span("http.download"):
+                content, validators = await self.http_downloader.download_with_validators(poema_id, categoria_path)
+            with profiling.span("pdf.save"):
+                await self.file_repository.save(content, pdf_path, poema_id, validators)
+            progress_tracker.record_success(filename, len(content))
+            DOWNLOADS.labels(resultado="ok").inc()
+            return len(content)
+        except Exception as e:
+            logger.error(f"  ✗ {filename}: {e}", extra={'poem_id': poema_id, 'categoria': categoria_path})
+            progress_tracker.record_failure(filename, e)
+            DOWNLOADS.labels(resultado="erro").inc()
+            return None
+        finally:
+            DOWNLOADS_IN_FLIGHT.dec()
+
+    async def _delay(self) -> None:
+        """Delay aleatório entre downloads"""
+        delay = random.uniform(self.min_delay, self.max_delay)
+        with profiling.span("delay"):
+            await asyncio.sleep(delay)
+
     async def download_all_poemas(
         self,
         categoria: Categoria,
@@ -82,8 +140,6 @@ class DownloadService:
             progress_tracker: Rastreador de progresso (opcional)
         """
         if progress_tracker is None:
-            from .structure_service import StructureService
-            total = StructureService.count_poemas_recursively(categoria)
-            progress_tracker = ProgressTracker(total)
+            progress_tracker = ProgressTracker(categoria.total_poemas)
 
         await self.download_categoria_recursively(categoria, progress_tracker)
@@ -0,0 +1,110 @@
+"""Application Export Service - Exportação do Espelho em um Único Arquivo"""
+
+import logging
+import tempfile
+import time
+from pathlib import Path, PurePosixPath
+from typing import Dict, Optional
+from src.domain.models import Categoria
+from src.domain.repositories import IManifestRepository
+from src.application.persistence_service import PersistenceService
+from src.infrastructure.archive_writer import ArchiveWriter
+from src.infrastructure.manifest import build_entry
+from src.utils import profiling
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = "manifest.jsonl"
+
+
+class ExportService:
+    """
+    Empacota os PDFs na ordem do catálogo, com o catálogo e o manifesto.
+
+    Layout do arquivo (extrair na raiz do projeto reproduz o espelho):
+        output/<catálogo>                 primeiro membro
+        <base_path>/<categoria>/<pdf>     na ordem do catálogo
+        <base_path>/manifest.jsonl        último membro: uma ManifestEntry
+                                          por PDF, com o SHA-256 calculado
+                                          durante a cópia
+
+    Nada é carregado inteiro: o catálogo é percorrido uma raiz por vez, o
+    manifesto vai para um arquivo temporário (em memória até 1 MiB) e cada
+    PDF é copiado em blocos.
+    """
+
+    def __init__(self, base_path: Path, manifest: Optional[IManifestRepository] = None):
+        self.base_path = base_path
+        self.manifest = manifest
+
+    async def export(self, persistence_service: PersistenceService, writer: ArchiveWriter) -> Dict[str, int]:
+        """
+        Escreve o espelho no arquivo.
+
+        Args:
+            persistence_service: Fonte do catálogo (binário ou JSON)
+            writer: Arquivo de destino (tar/zip)
+
+        Returns:
+            Contadores: arquivos, bytes, ausentes, divergentes (hash
+            diferente do manifesto local)
+        """
+        stats = {'arquivos': 0, 'bytes': 0, 'ausentes': 0, 'divergentes': 0}
+        prefix = PurePosixPath(self.base_path.name)
+
+        catalogo = persistence_service.default_path
+        with profiling.span("export.catalogo"):
+            writer.add_file(f"output/{catalogo.name}", catalogo)
+
+        with tempfile.SpooledTemporaryFile(max_size=1 << 20) as manifest_lines:
+            async for raiz in persistence_service.iter_categorias():
+                antes = stats['arquivos']
+                with profiling.span("export.pdfs"):
+                    self._export_tree(raiz, writer, prefix, manifest_lines, stats)
+                logger.info(f"📦 {raiz.nome}: {stats['arquivos'] - antes} arquivos")
+
+            size = manifest_lines.tell()
+            manifest_lines.seek(0)
+            writer.add_stream(str(prefix / MANIFEST_NAME), manifest_lines, size, time.time())
+
+        if stats['divergentes']:
+            logger.warning(
+                f"⚠️  {stats['divergentes']} PDFs com hash diferente do manifesto local "
+                f"(o arquivo exportado traz o hash real; execute: pessoa verify --full)"
+            )
+        return stats
+
+    def _export_tree(
+        self,
+        raiz: Categoria,
+        writer: ArchiveWriter,
+        prefix: PurePosixPath,
+        manifest_lines,
+        stats: Dict[str, int]
+    ) -> None:
+        """Exporta uma árvore de categorias em pré-ordem (ordem do catálogo)"""
+        stack = [raiz]
+        while stack:
+            categoria = stack.pop()
+            for poema in categoria.poemas:
+                relative = poema.relative_path(categoria.path)
+                filepath = self.base_path / relative
+                try:
+                    stat, sha256 = writer.add_file(str(prefix / relative), filepath)
+                except FileNotFoundError:
+                    stats['ausentes'] += 1
+                    continue
+
+                entry = None
+                if self.manifest is not None:
+                    entry = next((e for e in self.manifest.get(poema.id) if e.path == relative), None)
+                if entry is None or entry.sha256 != sha256 or entry.size != stat.st_size:
+                    if entry is not None:
+                        stats['divergentes'] += 1
+                        logger.debug(f"  ≠ {relative}: manifesto {entry.sha256[:12]}, arquivo {sha256[:12]}")
+                    entry = build_entry(filepath, relative, poema.id, sha256)
+                manifest_lines.write(entry.model_dump_json().encode('utf-8') + b'\n')
+
+                stats['arquivos'] += 1
+                stats['bytes'] += stat.st_size
+            stack.extend(reversed(categoria.subcategorias))
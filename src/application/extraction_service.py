@@ -0,0 +1,204 @@
+"""Application Extraction Service - Extração Paralela de Texto dos PDFs"""
+
+import logging
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path, PurePosixPath
+from typing import Dict, Iterable, List, Optional, Tuple
+from src.domain.models import Categoria, TextEntry
+from src.domain.repositories import IManifestRepository
+from src.application.progress_tracker import ProgressTracker
+from src.infrastructure.manifest import sha256_file
+from src.infrastructure.text_extraction import extract_in_worker, get_extractor, init_worker
+from src.infrastructure.text_store import SqliteTextStore
+from src.utils import profiling
+
+logger = logging.getLogger(__name__)
+
+# "0042 - Título.pdf" -> 42
+_PDF_NAME = re.compile(r'^(\d+) - .+\.pdf$')
+
+# (poema_id, path relativo, sha256, mtime_ns)
+Job = Tuple[int, str, str, int]
+
+
+class ExtractionService:
+    """
+    Extrai o texto de cada PDF em um pool de processos.
+
+    O armazenamento guarda sha256 e mtime da origem de cada texto: arquivos
+    com mtime inalterado são pulados só com um stat; com mtime diferente,
+    o hash (do manifesto, quando confere, ou recalculado) decide se o
+    conteúdo mudou e precisa ser extraído de novo.
+    """
+
+    def __init__(
+        self,
+        base_path: Path,
+        store: SqliteTextStore,
+        extractor: str = "auto",
+        max_workers: Optional[int] = None,
+        manifest: Optional[IManifestRepository] = None
+    ):
+        self.base_path = base_path
+        self.store = store
+        # Resolve no processo principal: backend indisponível falha antes do pool
+        self.extractor = get_extractor(extractor).name
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.manifest = manifest
+
+    def candidates_from_archive(self) -> Dict[int, List[str]]:
+        """PDFs no diretório base, por poema_id (paths relativos, em ordem)"""
+        candidates: Dict[int, List[str]] = {}
+        for root, dirs, files in os.walk(self.base_path):
+            dirs.sort()
+            for name in sorted(files):
+                match = _PDF_NAME.match(name)
+                if match:
+                    relative = Path(root, name).relative_to(self.base_path).as_posix()
+                    candidates.setdefault(int(match.group(1)), []).append(relative)
+        return candidates
+
+    @staticmethod
+    def candidates_from_categorias(categorias: Iterable[Categoria]) -> Dict[int, List[str]]:
+        """Paths esperados de cada poema do catálogo (um poema pode estar em várias categorias)"""
+        candidates: Dict[int, List[str]] = {}
+        stack = list(reversed(list(categorias)))
+        while stack:
+            categoria = stack.pop()
+            for poema in categoria.poemas:
+                candidates.setdefault(poema.id, []).append(poema.relative_path(categoria.path))
+            stack.extend(reversed(categoria.subcategorias))
+        return candidates
+
+    def plan(self, candidates: Dict[int, List[str]], force: bool = False) -> Tuple[List[Job], Dict[str, int]]:
+        """
+        Decide o que extrair, comparando com o cache.
+
+        Args:
+            candidates: Paths candidatos por poema_id (usa o primeiro existente)
+            force: Extrair tudo novamente
+
+        Returns:
+            Trabalhos de extração e contadores (inalterados, movidos, ausentes)
+        """
+        cached = self.store.entries()
+        manifest_sha: Dict[Tuple[int, str], Tuple[int, str]] = {}
+        if self.manifest is not None:
+            manifest_sha = {(e.poema_id, e.path): (e.mtime_ns, e.sha256) for e in self.manifest.entries()}
+
+        stats = {'inalterados': 0, 'movidos': 0, 'ausentes': 0}
+        to_hash: List[Tuple[int, str, int]] = []
+        jobs: List[Job] = []
+
+        for poema_id, paths in candidates.items():
+            for relative in paths:
+                try:
+                    mtime_ns = (self.base_path / relative).stat().st_mtime_ns
+                    break
+                except FileNotFoundError:
+                    continue
+            else:
+                stats['ausentes'] += 1
+                continue
+
+            entry = cached.get(poema_id)
+            if not force and entry and entry.path == relative and entry.mtime_ns == mtime_ns:
+                stats['inalterados'] += 1
+                continue
+
+            known = manifest_sha.get((poema_id, relative))
+            if known and known[0] == mtime_ns:
+                jobs.append((poema_id, relative, known[1], mtime_ns))
+            else:
+                to_hash.append((poema_id, relative, mtime_ns))
+
+        # hashlib libera o GIL: threads bastam para o hashing
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            digests = executor.map(sha256_file, [self.base_path / relative for _, relative, _ in to_hash])
+            jobs.extend((i, relative, digest, mtime) for (i, relative, mtime), digest in zip(to_hash, digests))
+
+        pendentes: List[Job] = []
+        for job in jobs:
+            entry = cached.get(job[0])
+            if not force and entry and entry.sha256 == job[2]:
+                # Mesmo conteúdo (cópia, novo mtime ou outra categoria)
+                self.store.touch(job[0], job[1], job[3])
+                stats['movidos'] += 1
+            else:
+                pendentes.append(job)
+        self.store.commit()
+        return pendentes, stats
+
+    def run(
+        self,
+        candidates: Dict[int, List[str]],
+        force: bool = False,
+        prune: bool = False
+    ) -> Dict[str, int]:
+        """
+        Extrai os textos novos ou alterados.
+
+        Args:
+            candidates: Paths candidatos por poema_id
+            force: Ignorar o cache
+            prune: Remover do armazenamento poemas fora de candidates
+                (mantém o armazenamento alinhado ao catálogo)
+
+        Returns:
+            Contadores: candidatos, inalterados, movidos, ausentes, extraidos, erros, removidos
+        """
+        with profiling.span("extracao.plan"):
+            jobs, stats = self.plan(candidates, force)
+        stats.update(candidatos=len(candidates), extraidos=0, erros=0, removidos=0)
+        logger.info(
+            f"📋 {len(jobs)} PDFs para extrair ({stats['inalterados']} inalterados, "
+            f"{stats['movidos']} sem mudança de conteúdo, {stats['ausentes']} sem PDF)"
+        )
+
+        if jobs:
+            progress = ProgressTracker(len(jobs))
+            chunksize = max(1, min(16, len(jobs) // (self.max_workers * 4)))
+            paths = [str(self.base_path / relative) for _, relative, _, _ in jobs]
+
+            with profiling.span("extracao.pool"), ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                initializer=init_worker,
+                initargs=(self.extractor,)
+            ) as executor:
+                for (poema_id, relative, sha256, mtime_ns), (texto, erro) in zip(
+                    jobs, executor.map(extract_in_worker, paths, chunksize=chunksize)
+                ):
+                    self.store.record(TextEntry(
+                        poema_id=poema_id,
+                        path=relative,
+                        sha256=sha256,
+                        mtime_ns=mtime_ns,
+                        chars=len(texto),
+                        extractor=self.extractor,
+                        extracted_at=time.time(),
+                        erro=erro
+                    ), texto)
+                    nome = PurePosixPath(relative).name
+                    if erro:
+                        logger.warning(f"  ✗ {nome}: {erro}", extra={'poem_id': poema_id})
+                        progress.record_failure(nome)
+                        stats['erros'] += 1
+                    else:
+                        progress.record_success(nome, len(texto))
+                        stats['extraidos'] += 1
+            self.store.commit()
+
+        if prune:
+            orfaos = set(self.store.entries()) - set(candidates)
+            if orfaos:
+                self.store.remove(orfaos)
+                stats['removidos'] = len(orfaos)
+
+        logger.info(
+            f"✓ Extração concluída: {stats['extraidos']} extraídos, {stats['erros']} erros, "
+            f"{stats['removidos']} removidos"
+        )
+        return stats
@@ -1,9 +1,13 @@
 """Application Filter Service - Filtragem de Arquivos Faltantes"""
 
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Dict, FrozenSet, Iterable, Optional, Set, Tuple
 from src.domain.models import Categoria
+from src.domain.repositories import IManifestRepository
+from src.utils import profiling
 
 logger = logging.getLogger(__name__)
 
@@ -11,37 +15,132 @@ logger = logging.getLogger(__name__)
 class FilterService:
     """Serviço para filtrar poemas com arquivos faltantes"""
 
-    def __init__(self, base_path: Path):
+    def __init__(
+        self,
+        base_path: Path,
+        max_workers: int = 16,
+        manifest: Optional[IManifestRepository] = None
+    ):
         self.base_path = base_path or Path("arquivos_pessoa")
+        self.max_workers = max_workers
+        self.manifest = manifest
+        self._manifest_keys: Optional[Set[Tuple[int, str]]] = None
+
+    def refresh_manifest(self) -> None:
+        """
+        Descarta as chaves do manifesto em cache; a próxima filtragem as
+        relê. Necessário quando a mesma instância filtra de novo depois
+        de downloads ou de uma reconciliação (ex.: a cada sync do daemon).
+        """
+        self._manifest_keys = None
+
+    def plan_missing(self, categoria: Categoria) -> Tuple[Optional[Categoria], int]:
+        """
+        Calcula, em uma única passada, a árvore de faltantes e sua contagem.
+
+        Com manifesto, um poema está baixado se houver entrada para seu
+        arquivo (o disco não é tocado; reconcilie o manifesto antes). Sem
+        manifesto, cada diretório de categoria é listado uma vez
+        (os.scandir) em um pool de threads; a presença de cada PDF vira um
+        lookup em conjunto, sem um stat por arquivo.
+
+        Args:
+            categoria: Categoria a filtrar
+
+        Returns:
+            Categoria com apenas poemas faltantes (ou None) e o total faltante
+        """
+        # Subárvore sem poemas: nada a verificar no disco
+        if categoria.total_poemas == 0:
+            return None, 0
+
+        with profiling.span("filtro.plan_missing"):
+            if self.manifest is not None:
+                if self._manifest_keys is None:
+                    self._manifest_keys = self.manifest.keys()
+                filtrada = self._filter_by_manifest(categoria, self._manifest_keys)
+            else:
+                listings = self._list_directories(self._directories(categoria))
+                filtrada = self._filter(categoria, listings)
+        return filtrada, filtrada.total_poemas if filtrada else 0
 
     def filter_missing_poemas(self, categoria: Categoria) -> Optional[Categoria]:
         """
         Filtra categoria deixando apenas poemas sem arquivo baixado.
         Processa recursivamente subcategorias.
-        
+
         Args:
             categoria: Categoria a filtrar
-            
+
         Returns:
             Categoria com apenas poemas faltantes, ou None se nenhum falta
         """
-        # Filtra poemas faltantes
-        poemas_faltantes = []
-        for poema in categoria.poemas:
-            pdf_filename = f"{poema.id:04d} - {poema.titulo}.pdf"
-            pdf_path = self.base_path / categoria.path / pdf_filename
+        return self.plan_missing(categoria)[0]
+
+    def count_missing_poemas(self, categoria: Categoria) -> int:
+        """
+        Conta recursivamente poemas faltantes em uma categoria.
+
+        Args:
+            categoria: Categoria a contar
+
+        Returns:
+            Número total de poemas faltantes
+        """
+        return self.plan_missing(categoria)[1]
 
-            if not pdf_path.exists():
-                poemas_faltantes.append(poema)
+    def _directories(self, categoria: Categoria) -> Set[Path]:
+        """Diretórios que precisam ser listados para verificar a subárvore"""
+        directories: Set[Path] = set()
+        stack = [categoria]
+        while stack:
+            atual = stack.pop()
+            stack.extend(sub for sub in atual.subcategorias if sub.total_poemas)
+            if not atual.poemas:
+                continue
+            directory = self.base_path / atual.path
+            directories.add(directory)
+            for poema in atual.poemas:
+                # Título com '/' gera o arquivo em um subdiretório
+                if '/' in poema.titulo:
+                    directories.add((directory / poema.filename).parent)
+        return directories
 
-        # Filtra subcategorias recursivamente
+    @staticmethod
+    def _scan(directory: Path) -> FrozenSet[str]:
+        """Nomes das entradas do diretório; vazio se ele não existir"""
+        try:
+            with os.scandir(directory) as entries:
+                return frozenset(entry.name for entry in entries)
+        except (FileNotFoundError, NotADirectoryError):
+            return frozenset()
+
+    def _list_directories(self, directories: Iterable[Path]) -> Dict[Path, FrozenSet[str]]:
+        """Lista os diretórios em paralelo (latência de FS de rede se sobrepõe)"""
+        directories = list(directories)
+        if len(directories) <= 1 or self.max_workers <= 1:
+            return {directory: self._scan(directory) for directory in directories}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return dict(zip(directories, executor.map(self._scan, directories)))
+
+    def _filter_by_manifest(
+        self,
+        categoria: Categoria,
+        keys: Set[Tuple[int, str]]
+    ) -> Optional[Categoria]:
+        """Monta a árvore de faltantes consultando as chaves do manifesto"""
+        poemas_faltantes = [
+            poema for poema in categoria.poemas
+            if (poema.id, poema.relative_path(categoria.path)) not in keys
+        ]
         subcategorias_filtradas = []
         for subcategoria in categoria.subcategorias:
-            subcat_filtrada = self.filter_missing_poemas(subcategoria)
+            if subcategoria.total_poemas == 0:
+                continue
+            subcat_filtrada = self._filter_by_manifest(subcategoria, keys)
             if subcat_filtrada:
                 subcategorias_filtradas.append(subcat_filtrada)
 
-        # Retorna apenas se houver faltantes
         if poemas_faltantes or subcategorias_filtradas:
             return Categoria(
                 nome=categoria.nome,
@@ -52,27 +151,41 @@ class FilterService:
 
         return None
 
-    def count_missing_poemas(self, categoria: Categoria) -> int:
-        """
-        Conta recursivamente poemas faltantes em uma categoria.
-        
-        Args:
-            categoria: Categoria a contar
-            
-        Returns:
-            Número total de poemas faltantes
-        """
-        # Contar poemas faltantes nesta categoria
-        count = 0
-        for poema in categoria.poemas:
-            pdf_filename = f"{poema.id:04d} - {poema.titulo}.pdf"
-            pdf_path = self.base_path / categoria.path / pdf_filename
-
-            if not pdf_path.exists():
-                count += 1
+    def _filter(
+        self,
+        categoria: Categoria,
+        listings: Dict[Path, FrozenSet[str]]
+    ) -> Optional[Categoria]:
+        """Monta a árvore de faltantes a partir das listagens já feitas"""
+        poemas_faltantes = []
+        if categoria.poemas:
+            directory = self.base_path / categoria.path
+            existentes = listings[directory]
+            for poema in categoria.poemas:
+                pdf_filename = poema.filename
+                if '/' in pdf_filename:
+                    pdf_path = directory / pdf_filename
+                    presente = pdf_path.name in listings[pdf_path.parent]
+                else:
+                    presente = pdf_filename in existentes
+                if not presente:
+                    poemas_faltantes.append(poema)
 
-        # Contar recursivamente em subcategorias
+        subcategorias_filtradas = []
         for subcategoria in categoria.subcategorias:
-            count += self.count_missing_poemas(subcategoria)
+            if subcategoria.total_poemas == 0:
+                continue
+            subcat_filtrada = self._filter(subcategoria, listings)
+            if subcat_filtrada:
+                subcategorias_filtradas.append(subcat_filtrada)
 
-        return count
+        # Retorna apenas se houver faltantes
+        if poemas_faltantes or subcategorias_filtradas:
+            return Categoria(
+                nome=categoria.nome,
+                path=categoria.path,
+                poemas=poemas_faltantes,
+                subcategorias=subcategorias_filtradas
+            )
+
+        return None
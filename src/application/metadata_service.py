@@ -0,0 +1,174 @@
+"""Application Metadata Service - Crawler Concorrente das Páginas de Poemas"""
+
+import asyncio
+import logging
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+from src.domain.models import PoemaMetadata
+from src.domain.repositories import IMetadataRepository
+from src.application.progress_tracker import ProgressTracker
+from src.infrastructure.http_client import HttpDownloader
+from src.infrastructure.metadata_parser import parse_metadata
+from src.utils import metrics, profiling
+
+logger = logging.getLogger(__name__)
+
+METADATA_FETCHES = metrics.counter(
+    "pessoa_metadata_fetches", "Páginas de metadados buscadas, por resultado", ["resultado"]
+)
+
+
+class MetadataService:
+    """
+    Busca a página /textos/{id} de cada poema e guarda os metadados.
+
+    `concurrency` tasks consomem uma fila de IDs sobre um único cliente
+    HTTP; o limitador de taxa do cliente decide o ritmo, a concorrência
+    só esconde a latência. É incremental: busca IDs sem metadados,
+    vencidos (mais velhos que max_age_days) ou com erro há mais de
+    retry_after_hours. Páginas já buscadas vão com If-None-Match /
+    If-Modified-Since, e um 304 só renova fetched_at.
+    """
+
+    def __init__(
+        self,
+        http_downloader: HttpDownloader,
+        store: IMetadataRepository,
+        concurrency: int = 4,
+        max_age_days: float = 30.0,
+        retry_after_hours: float = 24.0
+    ):
+        self.http_downloader = http_downloader
+        self.store = store
+        self.concurrency = max(1, concurrency)
+        self.max_age = max_age_days * 86400
+        self.retry_after = retry_after_hours * 3600
+
+    def plan(
+        self,
+        ids: Iterable[int],
+        force: bool = False,
+        now: Optional[float] = None
+    ) -> Tuple[List[int], Dict[str, int]]:
+        """
+        Decide quais IDs buscar.
+
+        Args:
+            ids: IDs do catálogo
+            force: Buscar todos
+            now: Instante de referência (default: agora)
+
+        Returns:
+            IDs a buscar, em ordem, e contadores (novos, vencidos, com_erro, em_dia)
+        """
+        now = time.time() if now is None else now
+        cached = self.store.entries()
+        stats = {'novos': 0, 'vencidos': 0, 'com_erro': 0, 'em_dia': 0}
+        pendentes: List[int] = []
+
+        for poema_id in sorted(set(ids)):
+            entry = cached.get(poema_id)
+            if entry is None:
+                stats['novos'] += 1
+            elif entry.erro is not None and (force or now - entry.fetched_at >= self.retry_after):
+                stats['com_erro'] += 1
+            elif entry.erro is None and (force or now - entry.fetched_at >= self.max_age):
+                stats['vencidos'] += 1
+            else:
+                stats['em_dia'] += 1
+                continue
+            pendentes.append(poema_id)
+        return pendentes, stats
+
+    async def run(self, ids: Iterable[int], force: bool = False, limit: Optional[int] = None) -> Dict[str, int]:
+        """
+        Busca os metadados pendentes.
+
+        Args:
+            ids: IDs do catálogo
+            force: Ignorar a idade dos metadados
+            limit: Máximo de páginas nesta execução
+
+        Returns:
+            Contadores do plano mais atualizados, inalterados (304) e erros
+        """
+        pendentes, stats = self.plan(ids, force)
+        if limit is not None:
+            pendentes = pendentes[:limit]
+        stats.update(buscados=len(pendentes), atualizados=0, inalterados=0, erros=0)
+        logger.info(
+            f"📋 {len(pendentes)} páginas para buscar ({stats['novos']} novas, {stats['vencidos']} vencidas, "
+            f"{stats['com_erro']} com erro, {stats['em_dia']} em dia)"
+        )
+        if not pendentes:
+            return stats
+
+        queue: asyncio.Queue = asyncio.Queue()
+        for poema_id in pendentes:
+            queue.put_nowait(poema_id)
+        progress = ProgressTracker(len(pendentes))
+
+        async def worker() -> None:
+            while True:
+                try:
+                    poema_id = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                resultado = await self._fetch_one(poema_id, progress)
+                stats[resultado] += 1
+                METADATA_FETCHES.labels(resultado=resultado).inc()
+
+        with profiling.span("metadados.crawl"):
+            await asyncio.gather(*(worker() for _ in range(min(self.concurrency, len(pendentes)))))
+        self.store.commit()
+
+        logger.info(
+            f"✓ Metadados: {stats['atualizados']} atualizados, {stats['inalterados']} inalterados, "
+            f"{stats['erros']} erros"
+        )
+        return stats
+
+    async def _fetch_one(self, poema_id: int, progress: ProgressTracker) -> str:
+        """Busca e grava uma página; devolve o contador afetado"""
+        anterior = self.store.get(poema_id)
+        validators = None
+        if anterior is not None and anterior.erro is None:
+            validators = {'etag': anterior.etag, 'last_modified': anterior.last_modified}
+
+        nome = f"textos/{poema_id}"
+        try:
+            status, html, novos = await self.http_downloader.fetch_page(poema_id, validators)
+        except Exception as e:
+            # Dados anteriores são mantidos; o erro só agenda nova tentativa
+            status = getattr(getattr(e, 'response', None), 'status_code', 0)
+            base = anterior or PoemaMetadata(poema_id=poema_id, fetched_at=0.0)
+            self.store.record(base.model_copy(update={
+                'status': status,
+                'fetched_at': time.time(),
+                'erro': f"HTTP {status}" if status else type(e).__name__
+            }))
+            progress.record_failure(nome, e)
+            return 'erros'
+
+        if status == 304 and anterior is not None:
+            self.store.record(anterior.model_copy(update={
+                'status': status,
+                'etag': novos.get('etag', anterior.etag),
+                'last_modified': novos.get('last_modified', anterior.last_modified),
+                'fetched_at': time.time()
+            }))
+            progress.record_skip(nome)
+            return 'inalterados'
+
+        with profiling.span("metadados.parse"):
+            campos = parse_metadata(html)
+        self.store.record(PoemaMetadata(
+            poema_id=poema_id,
+            **campos,
+            status=status,
+            etag=novos.get('etag'),
+            last_modified=novos.get('last_modified'),
+            fetched_at=time.time()
+        ))
+        progress.record_success(nome, len(html))
+        return 'atualizados'
@@ -2,9 +2,12 @@
 
 import logging
 from pathlib import Path
-from src.domain.models import StructureCatalog
+from typing import AsyncIterator, Optional, Set, Tuple
+from src.domain.models import Categoria, StructureCatalog
 from src.domain.repositories import IJsonRepository
+from src.infrastructure.journal import CatalogJournal
 from src.application.structure_service import StructureService
+from src.utils import profiling
 
 logger = logging.getLogger(__name__)
 
@@ -12,8 +15,36 @@ logger = logging.getLogger(__name__)
 class PersistenceService:
     """Serviço de persistência e recuperação de estrutura"""
 
-    def __init__(self, json_repository: IJsonRepository):
+    DEFAULT_PATH = Path("output/categorias_estrutura.json")
+
+    def __init__(
+        self,
+        json_repository: IJsonRepository,
+        default_path: Optional[Path] = None
+    ):
         self.structure_service = StructureService(json_repository)
+        self.default_path = default_path or self.DEFAULT_PATH
+
+    def is_current_copy_of(self, source: "PersistenceService") -> bool:
+        """
+        Se o arquivo deste serviço existe e não é mais antigo que o de
+        `source`. Cópias derivadas (ex.: o binário gerado do JSON) ficam
+        velhas quando o original é regravado sem elas.
+
+        Args:
+            source: Serviço do catálogo original
+
+        Returns:
+            True se a cópia pode ser lida no lugar do original
+        """
+        if not self.default_path.exists():
+            return False
+        if not source.default_path.exists():
+            return True
+        if self.default_path.stat().st_mtime_ns < source.default_path.stat().st_mtime_ns:
+            logger.warning(f"⚠️  {self.default_path} é mais antigo que {source.default_path}; usando {source.default_path}")
+            return False
+        return True
 
     async def save_catalog(
         self,
@@ -25,30 +56,114 @@ class PersistenceService:
         
         Args:
             catalog: Catálogo a salvar
-            filepath: Caminho (default: output/categorias_estrutura.json)
+            filepath: Caminho (default: self.default_path)
             
         Returns:
             Caminho do arquivo salvo
         """
         if filepath is None:
-            filepath = Path("output/categorias_estrutura.json")
+            filepath = self.default_path
 
-        await self.structure_service.save_structure(catalog, filepath)
+        with profiling.span(f"persistencia.save ({filepath.suffix or filepath.name})"):
+            await self.structure_service.save_structure(catalog, filepath)
         return filepath
 
-    async def load_catalog(self) -> StructureCatalog:
+    async def load_catalog(self, strict: bool = False) -> StructureCatalog:
         """
         Carrega catálogo de arquivo.
         
         Args:
-            filepath: Caminho (default: output/categorias_estrutura.json)
+            strict: Ativa validação estrita do arquivo
             
         Returns:
             Catálogo carregado
         """
-        filepath = Path("output/categorias_estrutura.json")
+        filepath = self.default_path
 
         if not filepath.exists():
             raise FileNotFoundError(f"Arquivo de estrutura não encontrado: {filepath}")
 
-        return await self.structure_service.load_structure(filepath)
+        with profiling.span("persistencia.load"):
+            return await self.structure_service.load_structure(filepath, strict=strict)
+
+    async def load_categoria(self, path: str) -> Optional[Categoria]:
+        """
+        Carrega apenas uma categoria do catálogo.
+        
+        Args:
+            path: Path da categoria (ex.: "Poesia/Alberto Caeiro")
+            
+        Returns:
+            Categoria com sua subárvore, ou None se não existir
+        """
+        filepath = self.default_path
+
+        if not filepath.exists():
+            raise FileNotFoundError(f"Arquivo de estrutura não encontrado: {filepath}")
+
+        return await self.structure_service.load_subtree(filepath, path)
+
+    async def iter_categorias(self) -> AsyncIterator[Categoria]:
+        """
+        Itera categorias de primeiro nível em streaming.
+        
+        Yields:
+            Cada categoria de primeiro nível, com sua subárvore
+        """
+        filepath = self.default_path
+
+        if not filepath.exists():
+            raise FileNotFoundError(f"Arquivo de estrutura não encontrado: {filepath}")
+
+        async for categoria in self.structure_service.iter_structure(filepath):
+            yield categoria
+
+    async def poema_ids(self) -> Set[int]:
+        """IDs distintos de poemas do catálogo, lido em streaming"""
+        ids: Set[int] = set()
+        async for raiz in self.iter_categorias():
+            stack = [raiz]
+            while stack:
+                categoria = stack.pop()
+                ids.update(poema.id for poema in categoria.poemas)
+                stack.extend(categoria.subcategorias)
+        return ids
+
+    @staticmethod
+    def replay_journal(journal_path: Path) -> Tuple[StructureCatalog, bool]:
+        """
+        Reconstrói catálogo a partir do journal de descoberta.
+        
+        Args:
+            journal_path: Caminho do journal JSONL
+            
+        Returns:
+            Catálogo (possivelmente parcial) e se o scrape foi completo
+        """
+        with profiling.span("journal.replay"):
+            categorias, completo = CatalogJournal.replay(journal_path)
+        return StructureCatalog.from_categorias(categorias), completo
+
+    async def compact_journal(
+        self,
+        journal_path: Path,
+        filepath: Optional[Path] = None
+    ) -> StructureCatalog:
+        """
+        Consolida o journal no formato do catálogo e remove o journal.
+        
+        Args:
+            journal_path: Caminho do journal JSONL
+            filepath: Destino do catálogo (default: self.default_path)
+            
+        Returns:
+            Catálogo consolidado
+        """
+        catalog, completo = self.replay_journal(journal_path)
+        if not completo:
+            logger.warning(f"⚠️ Journal incompleto: consolidando {catalog.total_poemas} poemas parciais")
+
+        await self.save_catalog(catalog, filepath)
+        journal_path.unlink()
+        logger.info(f"✓ Journal consolidado: {journal_path}")
+        return catalog
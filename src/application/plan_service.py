@@ -0,0 +1,230 @@
+"""Application Plan Service - Plano de Download com HEAD Antes da Execução"""
+
+import asyncio
+import logging
+import shutil
+import statistics
+import time
+from collections import deque
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+from src.domain.models import Categoria, DownloadPlan, PlanItem, Poema, RequestRecord
+from src.infrastructure.http_client import HttpDownloader
+from src.utils import metrics
+
+logger = logging.getLogger(__name__)
+
+PLAN_HEADS = metrics.counter("pessoa_plan_heads", "HEADs do planejador, por resultado", ["resultado"])
+
+ORDENS = ("catalogo", "menores", "maiores")
+
+
+class PlanService:
+    """
+    Monta o plano de um download antes de executá-lo.
+
+    HEAD no PDF de cada poema faltante (até `concurrency` em voo, no
+    ritmo do limitador de taxa do cliente) traz Content-Length e
+    validadores sem baixar o corpo. Com os tamanhos, o plano estima o
+    total de bytes e a duração: o download é sequencial, então cada
+    item custa latência + tamanho/vazão, mais a pausa entre downloads.
+    Latência e vazão vêm dos downloads de PDF registrados no ledger
+    (ou de valores padrão, sem histórico).
+    """
+
+    # Sem histórico no ledger: conexão doméstica modesta até o site
+    DEFAULT_LATENCY_MS = 300.0
+    DEFAULT_THROUGHPUT = 512 * 1024
+    # Amostras do ledger consideradas (as mais recentes)
+    LEDGER_SAMPLES = 2000
+
+    def __init__(
+        self,
+        http_downloader: HttpDownloader,
+        base_path: Path,
+        concurrency: int = 8,
+        min_delay: float = 2.0,
+        max_delay: float = 2.3
+    ):
+        self.http_downloader = http_downloader
+        self.base_path = base_path or Path("arquivos_pessoa")
+        self.concurrency = max(1, concurrency)
+        self.delay_medio = (min_delay + max_delay) / 2
+
+    @staticmethod
+    def collect(categoria: Categoria) -> List[Tuple[Poema, str]]:
+        """
+        Poemas de uma árvore (de faltantes) em pré-ordem, com o path da
+        categoria onde o PDF é gravado.
+
+        Args:
+            categoria: Categoria filtrada pelo FilterService
+
+        Returns:
+            Pares (poema, categoria_path), na ordem do catálogo
+        """
+        pares: List[Tuple[Poema, str]] = []
+        pilha = [categoria]
+        while pilha:
+            atual = pilha.pop()
+            pares.extend((poema, atual.path) for poema in atual.poemas)
+            pilha.extend(reversed(atual.subcategorias))
+        return pares
+
+    async def build(
+        self,
+        faltantes: Sequence[Tuple[Poema, str]],
+        ordem: str = "catalogo",
+        prioridades: Sequence[str] = (),
+        history: Iterable[RequestRecord] = ()
+    ) -> DownloadPlan:
+        """
+        Consulta os faltantes com HEAD e monta o plano.
+
+        Args:
+            faltantes: Pares (poema, categoria_path), na ordem do catálogo
+            ordem: "catalogo", "menores" (primeiro) ou "maiores" (primeiro)
+            prioridades: Paths de categorias cujos poemas vão à frente,
+                nesta ordem (a ordem vale dentro de cada grupo)
+            history: Tentativas do ledger, para medir latência e vazão
+
+        Returns:
+            Plano com itens na ordem de execução
+        """
+        if ordem not in ORDENS:
+            raise ValueError(f"Ordem desconhecida: {ordem} (use {', '.join(ORDENS)})")
+
+        # Histórico consumido antes dos HEADs, que vão para o mesmo ledger
+        latencia_ms, vazao, fonte = self.throughput(history)
+        respostas = await self._head_all({poema.id for poema, _ in faltantes})
+
+        itens: List[PlanItem] = []
+        ausentes: Set[int] = set()
+        for poema, categoria_path in faltantes:
+            status, validators, erro = respostas[poema.id]
+            if status == 404:
+                ausentes.add(poema.id)
+                continue
+            size = validators.get('size')
+            itens.append(PlanItem(
+                poema_id=poema.id,
+                titulo=poema.titulo,
+                categoria_path=categoria_path,
+                size=int(size) if size and size.isdigit() else None,
+                etag=validators.get('etag'),
+                last_modified=validators.get('last_modified'),
+                erro=erro
+            ))
+
+        itens = self._order(itens, ordem, prioridades)
+        conhecidos = [item.size for item in itens if item.size is not None]
+        mediana = int(statistics.median(conhecidos)) if conhecidos else 0
+        tamanhos = [item.size if item.size is not None else mediana for item in itens]
+
+        transferencia = sum(latencia_ms / 1000 + size / vazao for size in tamanhos)
+        return DownloadPlan(
+            criado_em=time.time(),
+            base_path=str(self.base_path),
+            ordem=ordem,
+            prioridades=list(prioridades),
+            itens=itens,
+            ausentes=sorted(ausentes),
+            total_bytes=sum(tamanhos),
+            sem_tamanho=len(itens) - len(conhecidos),
+            latencia_ms=latencia_ms,
+            vazao_bytes_s=vazao,
+            fonte_vazao=fonte,
+            delay_medio=self.delay_medio,
+            duracao_estimada=transferencia + self.delay_medio * max(0, len(itens) - 1),
+            espaco_livre=self.free_space(self.base_path)
+        )
+
+    async def _head_all(self, ids: Set[int]) -> Dict[int, Tuple[int, Dict[str, str], Optional[str]]]:
+        """HEAD uma vez por ID (um poema pode estar em várias categorias)"""
+        semaphore = asyncio.Semaphore(self.concurrency)
+        feitos = 0
+
+        async def head(poema_id: int) -> Tuple[int, Dict[str, str], Optional[str]]:
+            nonlocal feitos
+            async with semaphore:
+                try:
+                    status, validators = await self.http_downloader.head(poema_id)
+                    erro = None
+                except Exception as e:
+                    status = getattr(getattr(e, 'response', None), 'status_code', 0)
+                    validators, erro = {}, f"HTTP {status}" if status else type(e).__name__
+            PLAN_HEADS.labels(resultado="erro" if erro else "ausente" if status == 404 else "ok").inc()
+            feitos += 1
+            if feitos % 500 == 0:
+                logger.info(f"  📡 {feitos}/{len(ids)} HEADs")
+            return status, validators, erro
+
+        ordenados = sorted(ids)
+        resultados = await asyncio.gather(*(head(poema_id) for poema_id in ordenados))
+        return dict(zip(ordenados, resultados))
+
+    @staticmethod
+    def _order(itens: List[PlanItem], ordem: str, prioridades: Sequence[str]) -> List[PlanItem]:
+        """Ordena por grupo de prioridade e, dentro do grupo, pela ordem pedida"""
+        def grupo(item: PlanItem) -> int:
+            for posicao, path in enumerate(prioridades):
+                if item.categoria_path == path or item.categoria_path.startswith(path.rstrip('/') + '/'):
+                    return posicao
+            return len(prioridades)
+
+        # sorted é estável: empates mantêm a ordem do catálogo
+        if ordem == "menores":
+            return sorted(itens, key=lambda item: (grupo(item), item.size is None, item.size or 0))
+        if ordem == "maiores":
+            return sorted(itens, key=lambda item: (grupo(item), item.size is None, -(item.size or 0)))
+        return sorted(itens, key=grupo)
+
+    @classmethod
+    def throughput(cls, history: Iterable[RequestRecord]) -> Tuple[float, float, str]:
+        """
+        Latência (ms até o primeiro byte) e vazão (bytes/s depois dele)
+        por download, medidas nos PDFs baixados com sucesso.
+
+        Args:
+            history: Tentativas do ledger, na ordem de gravação
+
+        Returns:
+            Latência mediana, vazão agregada e a fonte ("ledger" ou "padrão")
+        """
+        amostras = deque(
+            (
+                record for record in history
+                if record.recurso == "pdf" and record.status == 200 and record.ok and record.bytes
+            ),
+            maxlen=cls.LEDGER_SAMPLES
+        )
+        if not amostras:
+            return cls.DEFAULT_LATENCY_MS, float(cls.DEFAULT_THROUGHPUT), "padrão"
+
+        latencia_ms = statistics.median(record.ttfb_ms or record.total_ms for record in amostras)
+        # Vazão agregada (soma/soma): arquivos grandes pesam o que pesam
+        corpo_s = sum(max(record.total_ms - record.ttfb_ms, 1.0) for record in amostras) / 1000
+        vazao = sum(record.bytes for record in amostras) / corpo_s
+        return latencia_ms, vazao, "ledger"
+
+    @staticmethod
+    def free_space(path: Path) -> int:
+        """Bytes livres no disco de `path` (ou do ancestral mais próximo que existe)"""
+        path = Path(path).absolute()
+        while not path.exists() and path != path.parent:
+            path = path.parent
+        return shutil.disk_usage(path).free
+
+    @staticmethod
+    def pending(plan: DownloadPlan, manifest_keys: Set[Tuple[int, str]]) -> List[PlanItem]:
+        """
+        Itens do plano ainda sem arquivo no manifesto, na ordem do plano.
+
+        Args:
+            plan: Plano gravado por `pessoa plan`
+            manifest_keys: Pares (poema_id, path) registrados no manifesto
+
+        Returns:
+            Itens a baixar
+        """
+        return [item for item in plan.itens if (item.poema_id, item.relative_path) not in manifest_keys]
@@ -1,46 +1,163 @@
 """Application Progress Tracker - Rastreamento de Progresso"""
 
 import logging
-from typing import Callable
+import threading
+import time
+from typing import Callable, Optional
+from src.utils.helpers import TextHelper
 
 logger = logging.getLogger(__name__)
 
 
 class ProgressTracker:
-    """Rastreador de progresso de downloads"""
+    """
+    Rastreador de progresso de downloads.
 
-    def __init__(self, total: int):
+    Contabiliza sucessos, falhas, pulados e bytes; estima vazão por média
+    móvel exponencial (EWMA) e o ETA a partir dela. Seguro para uso
+    concorrente (threads ou tasks asyncio). A linha de progresso e os
+    callbacks são emitidos no máximo uma vez por refresh_interval, então
+    o volume de log não cresce com o número de arquivos; o detalhe por
+    arquivo vai para DEBUG.
+    """
+
+    def __init__(
+        self,
+        total: int,
+        refresh_interval: float = 5.0,
+        smoothing: float = 0.3,
+        clock: Callable[[], float] = time.monotonic
+    ):
         self.total = total
-        self.atual = 0
+        self.refresh_interval = refresh_interval
+        self.smoothing = smoothing
         self.callbacks: list[Callable] = []
 
-    def increment(self, title: str = "") -> None:
+        self.sucesso = 0
+        self.falhas = 0
+        self.pulados = 0
+        self.bytes = 0
+
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._inicio = clock()
+        self._ultimo_report = self._inicio
+        self._amostra = (self._inicio, 0, 0)  # (instante, itens, bytes)
+        self._itens_por_s: Optional[float] = None
+        self._bytes_por_s: Optional[float] = None
+
+    @property
+    def atual(self) -> int:
+        """Itens processados (sucesso + falha + pulado)"""
+        return self.sucesso + self.falhas + self.pulados
+
+    def increment(self, title: str = "", nbytes: int = 0) -> None:
         """
-        Incrementa contador e notifica.
-        
+        Registra um item concluído com sucesso.
+
         Args:
             title: Descrição opcional do item incrementado
+            nbytes: Bytes transferidos
         """
-        self.atual += 1
-        progress_str = f"[{self.atual:04d}/{self.total:04d}]"
+        self.record_success(title, nbytes)
+
+    def record_success(self, title: str = "", nbytes: int = 0) -> None:
+        """Registra download concluído"""
+        with self._lock:
+            self.sucesso += 1
+            self.bytes += nbytes
         if title:
-            logger.info(f"  ✓ {progress_str} {title}")
-        else:
-            logger.info(f"  ✓ {progress_str}")
+            logger.debug(f"  ✓ {title} ({TextHelper.format_bytes(nbytes)})")
+        self._maybe_report()
 
-        # Executar callbacks registrados
-        for callback in self.callbacks:
-            callback(self.atual, self.total)
+    def record_failure(self, title: str = "", error: Optional[BaseException] = None) -> None:
+        """Registra download que falhou"""
+        with self._lock:
+            self.falhas += 1
+        if title:
+            logger.debug(f"  ✗ {title}: {error}")
+        self._maybe_report()
+
+    def record_skip(self, title: str = "") -> None:
+        """Registra item pulado (ex.: já baixado)"""
+        with self._lock:
+            self.pulados += 1
+        if title:
+            logger.debug(f"  ↷ {title}")
+        self._maybe_report()
 
     def on_progress(self, callback: Callable[[int, int], None]) -> None:
         """
-        Registra callback para ser chamado ao incrementar.
-        
+        Registra callback chamado a cada atualização (coalescida) de progresso.
+
         Args:
             callback: Função(atual, total)
         """
         self.callbacks.append(callback)
 
+    def _sample(self, now: float) -> None:
+        """Atualiza as médias EWMA com a taxa do intervalo desde a última amostra"""
+        instante, itens, nbytes = self._amostra
+        dt = now - instante
+        if dt <= 0:
+            return
+        taxa_itens = (self.atual - itens) / dt
+        taxa_bytes = (self.bytes - nbytes) / dt
+        if self._itens_por_s is None:
+            self._itens_por_s, self._bytes_por_s = taxa_itens, taxa_bytes
+        else:
+            alpha = self.smoothing
+            self._itens_por_s = alpha * taxa_itens + (1 - alpha) * self._itens_por_s
+            self._bytes_por_s = alpha * taxa_bytes + (1 - alpha) * self._bytes_por_s
+        self._amostra = (now, self.atual, self.bytes)
+
+    def _maybe_report(self) -> None:
+        """Emite progresso se o intervalo de refresh passou (ou ao terminar)"""
+        now = self._clock()
+        with self._lock:
+            concluido = self.atual >= self.total
+            if now - self._ultimo_report < self.refresh_interval and not concluido:
+                return
+            self._ultimo_report = now
+            self._sample(now)
+            linha = self._format_line()
+            atual, total = self.atual, self.total
+
+        logger.info(linha)
+        for callback in self.callbacks:
+            callback(atual, total)
+
+    @property
+    def throughput(self) -> float:
+        """Vazão suavizada em bytes/s"""
+        return self._bytes_por_s or 0.0
+
+    @property
+    def items_per_second(self) -> float:
+        """Vazão suavizada em itens/s"""
+        return self._itens_por_s or 0.0
+
+    @property
+    def eta(self) -> Optional[float]:
+        """Segundos restantes estimados, ou None sem amostra ainda"""
+        if not self._itens_por_s:
+            return None
+        return max(0, self.total - self.atual) / self._itens_por_s
+
+    @property
+    def elapsed(self) -> float:
+        """Segundos desde a criação do tracker"""
+        return self._clock() - self._inicio
+
+    def _format_line(self) -> str:
+        eta = self.eta
+        return (
+            f"  ⏳ [{self.atual:04d}/{self.total:04d}] {self.progress_percent:.1f}% | "
+            f"✓ {self.sucesso} ✗ {self.falhas} ↷ {self.pulados} | "
+            f"{TextHelper.format_bytes(self.bytes)}, {TextHelper.format_bytes(self.throughput)}/s | "
+            f"ETA {TextHelper.format_duration(eta) if eta is not None else '--:--'}"
+        )
+
     @property
     def progress_percent(self) -> float:
         """Retorna percentual de progresso"""
@@ -50,4 +167,11 @@ class ProgressTracker:
 
     def get_summary(self) -> str:
         """Retorna resumo do progresso"""
-        return f"{self.atual}/{self.total} ({self.progress_percent:.1f}%)"
+        elapsed = self.elapsed
+        media = self.bytes / elapsed if elapsed > 0 else 0
+        return (
+            f"{self.atual}/{self.total} ({self.progress_percent:.1f}%) - "
+            f"{self.sucesso} ok, {self.falhas} falhas, {self.pulados} pulados, "
+            f"{TextHelper.format_bytes(self.bytes)} em {TextHelper.format_duration(elapsed)} "
+            f"({TextHelper.format_bytes(media)}/s)"
+        )
@@ -0,0 +1,184 @@
+"""Application Report Service - Relatório do Ledger de Requisições"""
+
+import logging
+import math
+from collections import Counter, defaultdict
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Sequence, Set
+from src.domain.models import (
+    CategoriaLatency,
+    LatencyStats,
+    LedgerReport,
+    RequestRecord,
+    ThroughputBucket
+)
+from src.utils.helpers import TextHelper
+
+logger = logging.getLogger(__name__)
+
+
+def percentile(sorted_values: Sequence[float], q: float) -> float:
+    """
+    Percentil pelo método nearest-rank.
+
+    Args:
+        sorted_values: Valores já ordenados
+        q: Percentil entre 0 e 100
+
+    Returns:
+        Valor do percentil (0 para amostra vazia)
+    """
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(q / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def latency_stats(values: Iterable[float]) -> LatencyStats:
+    """Percentis p50/p90/p95/p99 e máximo de uma amostra"""
+    ordered = sorted(values)
+    if not ordered:
+        return LatencyStats()
+    return LatencyStats(
+        count=len(ordered),
+        p50=percentile(ordered, 50),
+        p90=percentile(ordered, 90),
+        p95=percentile(ordered, 95),
+        p99=percentile(ordered, 99),
+        max=ordered[-1]
+    )
+
+
+class ReportService:
+    """Serviço que agrega o ledger de tentativas HTTP em um relatório"""
+
+    def build(
+        self,
+        records: Iterable[RequestRecord],
+        runs: Optional[Set[str]] = None,
+        bucket_seconds: int = 60,
+        top_categorias: int = 10,
+        min_requisicoes: int = 5,
+        recursos: Optional[Set[str]] = None
+    ) -> LedgerReport:
+        """
+        Agrega tentativas em uma única passada.
+
+        Args:
+            records: Tentativas lidas do ledger
+            runs: Restringe a essas execuções (None: todas)
+            bucket_seconds: Janela de tempo da série de vazão
+            top_categorias: Quantas categorias mais lentas listar
+            min_requisicoes: Mínimo de downloads para ranquear uma categoria
+            recursos: Restringe a esses recursos ("pdf", "pagina", "head"; None: todos)
+
+        Returns:
+            Relatório com percentis, vazão, erros e categorias lentas
+        """
+        report = LedgerReport()
+        vistos: Dict[str, None] = {}
+        total_ms: List[float] = []
+        ttfb_ms: List[float] = []
+        connect_ms: List[float] = []
+        erros: Counter = Counter()
+        buckets: Dict[int, List[int]] = defaultdict(lambda: [0, 0])
+        por_categoria: Dict[str, List[float]] = defaultdict(list)
+
+        for record in records:
+            if runs is not None and record.run_id not in runs:
+                continue
+            if recursos is not None and record.recurso not in recursos:
+                continue
+            vistos.setdefault(record.run_id)
+            report.tentativas += 1
+            if record.attempt > 1:
+                report.retentativas += 1
+
+            bucket = buckets[int(record.ts // bucket_seconds)]
+            bucket[0] += 1
+
+            if record.ok:
+                report.sucessos += 1
+                report.bytes += record.bytes
+                bucket[1] += record.bytes
+                total_ms.append(record.total_ms)
+                if record.ttfb_ms:
+                    ttfb_ms.append(record.ttfb_ms)
+                if record.connect_ms:
+                    connect_ms.append(record.connect_ms)
+                if record.categoria_path:
+                    por_categoria[record.categoria_path].append(record.total_ms)
+            else:
+                report.falhas += 1
+                erros[f"HTTP {record.status}" if record.status else (record.error or "desconhecido")] += 1
+
+        report.runs = list(vistos)
+        report.total = latency_stats(total_ms)
+        report.ttfb = latency_stats(ttfb_ms)
+        report.connect = latency_stats(connect_ms)
+        report.erros = dict(erros.most_common())
+        report.throughput = [
+            ThroughputBucket(
+                inicio=key * bucket_seconds,
+                requisicoes=count,
+                bytes=nbytes,
+                bytes_por_s=nbytes / bucket_seconds
+            )
+            for key, (count, nbytes) in sorted(buckets.items())
+        ]
+
+        categorias = []
+        for path, tempos in por_categoria.items():
+            if len(tempos) < min_requisicoes:
+                continue
+            tempos.sort()
+            categorias.append(CategoriaLatency(
+                path=path,
+                requisicoes=len(tempos),
+                media_ms=sum(tempos) / len(tempos),
+                p95_ms=percentile(tempos, 95)
+            ))
+        categorias.sort(key=lambda cat: cat.p95_ms, reverse=True)
+        report.categorias_lentas = categorias[:top_categorias]
+        return report
+
+    @staticmethod
+    def format_report(report: LedgerReport) -> str:
+        """Relatório em texto para o terminal"""
+        def linha_latencia(nome: str, stats: LatencyStats) -> str:
+            return (
+                f"  {nome:<8} n={stats.count:<6} p50={stats.p50:7.1f}  p90={stats.p90:7.1f}  "
+                f"p95={stats.p95:7.1f}  p99={stats.p99:7.1f}  max={stats.max:7.1f} ms"
+            )
+
+        linhas = [
+            f"Execuções: {', '.join(report.runs) or '-'}",
+            f"Tentativas: {report.tentativas} ({report.sucessos} ok, {report.falhas} falhas, "
+            f"{report.retentativas} retentativas) - {TextHelper.format_bytes(report.bytes)}",
+            "",
+            "Latência",
+            linha_latencia("total", report.total),
+            linha_latencia("ttfb", report.ttfb),
+            linha_latencia("connect", report.connect),
+        ]
+
+        if report.erros:
+            linhas += ["", "Erros"]
+            linhas += [f"  {nome:<24} {count}" for nome, count in report.erros.items()]
+
+        if report.throughput:
+            linhas += ["", "Vazão"]
+            for bucket in report.throughput:
+                inicio = datetime.fromtimestamp(bucket.inicio).strftime('%Y-%m-%d %H:%M')
+                linhas.append(
+                    f"  {inicio}  {bucket.requisicoes:5d} req  "
+                    f"{TextHelper.format_bytes(bucket.bytes_por_s)}/s"
+                )
+
+        if report.categorias_lentas:
+            linhas += ["", "Categorias mais lentas (p95)"]
+            linhas += [
+                f"  {cat.p95_ms:8.1f} ms  média {cat.media_ms:8.1f} ms  n={cat.requisicoes:<5} {cat.path}"
+                for cat in report.categorias_lentas
+            ]
+        return "\n".join(linhas)
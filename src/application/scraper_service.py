@@ -1,10 +1,14 @@
 """Application Services - Serviços de Negócio"""
 
 import logging
+from pathlib import Path
 from typing import Optional
 from src.domain.models import Categoria, StructureCatalog
 from src.infrastructure.browser import PlaywrightBrowser
 from src.infrastructure.parser import HtmlParserAdapter
+from src.infrastructure.journal import CatalogJournal
+from src.infrastructure import compressed_io
+from src.utils import profiling
 
 logger = logging.getLogger(__name__)
 
@@ -20,22 +24,67 @@ class WebScraperService:
         self.browser = browser
         self.parser = parser
 
-    async def fetch_and_extract_structure(self) -> StructureCatalog:
+    async def fetch_and_extract_structure(
+        self,
+        journal: Optional[CatalogJournal] = None,
+        snapshot_path: Optional[Path] = None
+    ) -> StructureCatalog:
         """
         Realiza scraping completo e extrai estrutura de categorias.
         
+        Args:
+            journal: Journal onde registrar descobertas durante o parsing
+            snapshot_path: Onde gravar o HTML expandido, comprimido (opcional)
+            
         Returns:
             Catálogo com todas as categorias e poemas
         """
         logger.info("[1] Acessando página e expandindo categorias...")
         html = await self.browser.fetch_with_javascript()
 
+        if snapshot_path:
+            with profiling.span("snapshot"):
+                compressed_io.write_bytes(snapshot_path, html.encode('utf-8'), 'auto')
+            logger.info(f"📸 Snapshot HTML salvo em {snapshot_path}")
+            # Uma queda daqui em diante retoma do snapshot, sem o browser
+            if journal:
+                journal.record_snapshot(snapshot_path)
+
+        return self._extract(html, journal)
+
+    async def extract_from_snapshot(
+        self,
+        snapshot_path: Path,
+        journal: Optional[CatalogJournal] = None
+    ) -> StructureCatalog:
+        """
+        Refaz a extração a partir de um snapshot do HTML expandido, sem
+        abrir o browser (retomada de um scrape interrompido no parsing).
+
+        Args:
+            snapshot_path: Snapshot gravado por fetch_and_extract_structure
+            journal: Journal onde registrar descobertas durante o parsing
+
+        Returns:
+            Catálogo com todas as categorias e poemas
+        """
+        logger.info(f"[1] Lendo snapshot {snapshot_path}...")
+        with profiling.span("snapshot.leitura"):
+            html = compressed_io.read_bytes(snapshot_path).decode('utf-8')
+        return self._extract(html, journal)
+
+    def _extract(self, html: str, journal: Optional[CatalogJournal]) -> StructureCatalog:
+        """Parsing do HTML expandido e contagem dos poemas"""
         logger.info("[2] Extraindo categorias do HTML...")
-        categorias = self.parser.parse_categories(html)
+        with profiling.span("parser.parse_categories"):
+            categorias = self.parser.parse_categories(html, journal)
+        if journal:
+            journal.complete()
         logger.info(f"✓ {len(categorias)} categorias principais encontradas")
 
         logger.info("[3] Contabilizando poemas...")
-        catalog = StructureCatalog.from_categorias(categorias)
+        with profiling.span("catalogo.from_categorias"):
+            catalog = StructureCatalog.from_categorias(categorias)
         logger.info(f"📊 Total: {catalog.total_poemas} poemas extraídos")
 
         return catalog
@@ -0,0 +1,113 @@
+"""Application Search Service - Busca por Título e Texto"""
+
+import logging
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from src.domain.models import SearchHit
+from src.application.persistence_service import PersistenceService
+from src.infrastructure.search_index import SqliteSearchIndex
+from src.infrastructure.text_store import SqliteTextStore
+from src.utils import profiling
+
+logger = logging.getLogger(__name__)
+
+
+def _fingerprint(*paths: Path) -> str:
+    """Identidade barata de arquivos (mtime_ns e tamanho; WAL incluso para SQLite)"""
+    partes = []
+    for path in paths:
+        for candidate in (path, path.with_name(path.name + "-wal")):
+            if candidate.exists():
+                stat = candidate.stat()
+                partes.append(f"{candidate.name}:{stat.st_mtime_ns}:{stat.st_size}")
+    return "|".join(partes)
+
+
+class SearchService:
+    """
+    Mantém o índice de busca em dia e responde consultas.
+
+    update() só relê o catálogo ou os textos quando o arquivo mudou desde
+    a última indexação (comparação por mtime/tamanho); dentro deles, só
+    poemas com título, categorias ou texto alterados são reescritos.
+    """
+
+    def __init__(self, index: SqliteSearchIndex):
+        self.index = index
+
+    async def update_catalog(self, persistence_service: PersistenceService, force: bool = False) -> Optional[Dict[str, int]]:
+        """
+        Reindexa títulos se o catálogo mudou.
+
+        Args:
+            persistence_service: Fonte do catálogo (binário ou JSON)
+            force: Reler o catálogo mesmo sem mudança no arquivo
+
+        Returns:
+            Contadores da atualização, ou None se nada mudou
+        """
+        fingerprint = _fingerprint(persistence_service.default_path)
+        if not force and self.index.get_meta('catalogo') == fingerprint:
+            return None
+
+        poemas: Dict[int, Tuple[str, List[str]]] = {}
+        with profiling.span("busca.ler_catalogo"):
+            async for raiz in persistence_service.iter_categorias():
+                stack = [raiz]
+                while stack:
+                    categoria = stack.pop()
+                    for poema in categoria.poemas:
+                        poemas.setdefault(poema.id, (poema.titulo, []))[1].append(categoria.path)
+                    stack.extend(categoria.subcategorias)
+
+        with profiling.span("busca.indexar_titulos"):
+            stats = self.index.sync_poemas(poemas)
+        self.index.set_meta('catalogo', fingerprint)
+        logger.info(
+            f"🔎 Títulos indexados: +{stats['adicionados']} ~{stats['atualizados']} -{stats['removidos']}"
+        )
+        return stats
+
+    def update_texts(self, store_path: Path, force: bool = False) -> Optional[Dict[str, int]]:
+        """
+        Reindexa textos extraídos se o armazenamento mudou.
+
+        Args:
+            store_path: Armazenamento de textos (pessoa extract)
+            force: Comparar as versões mesmo sem mudança no arquivo
+
+        Returns:
+            Contadores da atualização, ou None se nada mudou
+        """
+        if not store_path.exists():
+            return None
+        fingerprint = _fingerprint(store_path)
+        if not force and self.index.get_meta('textos') == fingerprint:
+            return None
+
+        with SqliteTextStore(store_path) as store, profiling.span("busca.indexar_textos"):
+            origens = {
+                poema_id: f"{entry.sha256}:{entry.extracted_at}"
+                for poema_id, entry in store.entries().items() if entry.erro is None
+            }
+            stats = self.index.sync_textos(origens, store.get)
+        # Abrir o armazenamento pode checkpointar o WAL: registra o estado final
+        self.index.set_meta('textos', _fingerprint(store_path))
+        logger.info(f"🔎 Textos indexados: +{stats['indexados']} -{stats['removidos']}")
+        return stats
+
+    def search(self, query: str, limit: int = 20, texto: bool = False) -> List[SearchHit]:
+        """
+        Busca poemas.
+
+        Args:
+            query: Consulta (acentos e caixa são ignorados)
+            limit: Máximo de resultados
+            texto: Buscar no texto dos poemas em vez do título
+
+        Returns:
+            Resultados em ordem de relevância
+        """
+        if texto:
+            return self.index.search_text(query, limit)
+        return self.index.search_titles(query, limit)
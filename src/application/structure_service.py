@@ -2,7 +2,7 @@
 
 import logging
 from pathlib import Path
-from typing import List
+from typing import AsyncIterator, Optional
 from src.domain.models import Categoria, StructureCatalog
 from src.domain.repositories import IJsonRepository
 
@@ -30,68 +30,60 @@ class StructureService:
         await self.json_repository.save(catalog, filepath)
         logger.info(f"✓ {catalog.total_categorias} categorias e {catalog.total_poemas} poemas salvos")
 
-    async def load_structure(self, filepath: Path) -> StructureCatalog:
+    async def load_structure(
+        self,
+        filepath: Path,
+        strict: bool = False
+    ) -> StructureCatalog:
         """
         Carrega catálogo de arquivo JSON.
         
+        O repositório decodifica o arquivo inteiro em uma única chamada
+        do backend de serialização, sem reconstrução nó a nó.
+        
         Args:
             filepath: Caminho do arquivo JSON
+            strict: Ativa validação estrita (sem coerção de tipos)
             
         Returns:
             Catálogo carregado
         """
-        data = await self.json_repository.load(filepath)
-        
-        # Reconstruir objetos Categoria a partir do dicionário
-        categorias = self._load_categorias_from_dict(data.get('categorias', []))
-        
-        catalog = StructureCatalog(
-            total_categorias=data.get('total_categorias', 0),
-            total_poemas=data.get('total_poemas', 0),
-            categorias=categorias
-        )
+        catalog = await self.json_repository.load_catalog(filepath, strict=strict)
         logger.info(f"✓ {catalog.total_categorias} categorias carregadas")
         return catalog
 
-    @staticmethod
-    def _load_categorias_from_dict(data_list: List[dict]) -> List[Categoria]:
-        """Reconstrói objetos Categoria a partir de dicionários"""
-        categorias = []
-        for cat_dict in data_list:
-            categoria = Categoria(
-                nome=cat_dict['nome'],
-                path=cat_dict['path'],
-                poemas=[],  # Será preenchido abaixo
-                subcategorias=[]
-            )
-            
-            # Adicionar poemas
-            for poema_dict in cat_dict.get('poemas', []):
-                from src.domain.models import Poema
-                categoria.poemas.append(Poema(**poema_dict))
-            
-            # Adicionar subcategorias recursivamente
-            if cat_dict.get('subcategorias'):
-                categoria.subcategorias = StructureService._load_categorias_from_dict(
-                    cat_dict['subcategorias']
-                )
+    async def load_subtree(self, filepath: Path, path: str) -> Optional[Categoria]:
+        """
+        Carrega uma única categoria (e sua subárvore) do arquivo.
+        
+        Args:
+            filepath: Caminho do arquivo de estrutura
+            path: Path da categoria
             
-            categorias.append(categoria)
+        Returns:
+            Categoria encontrada, ou None
+        """
+        return await self.json_repository.load_subtree(filepath, path)
+
+    async def iter_structure(self, filepath: Path) -> AsyncIterator[Categoria]:
+        """
+        Itera categorias de primeiro nível sem carregar o catálogo inteiro.
         
-        return categorias
+        Args:
+            filepath: Caminho do arquivo de estrutura
+            
+        Yields:
+            Cada categoria de primeiro nível
+        """
+        async for categoria in self.json_repository.iter_categorias(filepath):
+            yield categoria
 
     @staticmethod
     def count_poemas_recursively(categoria: Categoria) -> int:
-        """Conta poemas recursivamente em uma categoria e subcategorias"""
-        count = len(categoria.poemas)
-        for sub in categoria.subcategorias:
-            count += StructureService.count_poemas_recursively(sub)
-        return count
+        """Conta poemas em uma categoria e subcategorias (agregado em cache)"""
+        return categoria.total_poemas
 
     @staticmethod
     def count_categorias_recursively(categoria: Categoria) -> int:
-        """Conta categorias recursivamente"""
-        count = 1  # A própria categoria
-        for sub in categoria.subcategorias:
-            count += StructureService.count_categorias_recursively(sub)
-        return count
+        """Conta categorias recursivamente (agregado em cache)"""
+        return 1 + categoria.total_subcategorias  # A própria categoria
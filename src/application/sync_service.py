@@ -0,0 +1,269 @@
+"""Application Sync Service - Sincronização Contínua (modo daemon)"""
+
+import asyncio
+import logging
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+from src.domain.models import SyncRun
+from src.application.diff_service import DiffService
+from src.application.download_service import DownloadService
+from src.application.filter_service import FilterService
+from src.application.persistence_service import PersistenceService
+from src.application.progress_tracker import ProgressTracker
+from src.application.scraper_service import WebScraperService
+from src.infrastructure.journal import CatalogJournal
+from src.infrastructure.manifest import SqliteManifestRepository
+from src.infrastructure import compressed_io
+from src.utils import metrics
+from src.utils import profiling
+
+logger = logging.getLogger(__name__)
+
+SYNC_RUNS = metrics.counter("pessoa_sync_runs", "Execuções de tarefas do daemon", ["tarefa", "resultado"])
+SYNC_LAST_SUCCESS = metrics.gauge(
+    "pessoa_sync_last_success_timestamp_seconds", "Fim da última execução bem-sucedida", ["tarefa"]
+)
+
+REFRESH = "estrutura"
+SYNC = "sync"
+
+
+class SyncService:
+    """
+    Tarefas do daemon sobre browser e cliente HTTP já abertos.
+
+    O chamador mantém scraper_service.browser e download_service.http_downloader
+    dentro de seus context managers durante toda a vida do processo: cada
+    tarefa reaproveita o Chromium e o pool de conexões em vez de iniciá-los.
+    """
+
+    def __init__(
+        self,
+        scraper_service: WebScraperService,
+        download_service: DownloadService,
+        persistence_service: PersistenceService,
+        binary_service: PersistenceService,
+        filter_service: FilterService,
+        diff_service: DiffService,
+        manifest: SqliteManifestRepository,
+        output_dir: Path = Path("output")
+    ):
+        self.scraper_service = scraper_service
+        self.download_service = download_service
+        self.persistence_service = persistence_service
+        self.binary_service = binary_service
+        self.filter_service = filter_service
+        self.diff_service = diff_service
+        self.manifest = manifest
+        self.journal_path = output_dir / "categorias_estrutura.journal.jsonl"
+        self.diff_path = output_dir / "catalog_diff.json"
+        self.snapshot_dir = output_dir / "snapshots"
+        self.progress: Optional[ProgressTracker] = None
+        self._reconciled = False
+
+    async def refresh_structure(self) -> Dict[str, int]:
+        """
+        Refaz o scraping da estrutura com o browser aberto e consolida o catálogo.
+
+        Grava o diff contra o catálogo anterior e a cópia binária usada
+        pelo sync.
+
+        Returns:
+            Totais do catálogo e do diff
+        """
+        anterior = None
+        if self.persistence_service.default_path.exists():
+            anterior = await self.persistence_service.load_catalog()
+
+        # Journal incompleto com snapshot: refaz só o parsing, sem o browser
+        retomar = False
+        snapshot_path = None
+        if self.journal_path.exists():
+            _, retomar = self.persistence_service.replay_journal(self.journal_path)
+            if not retomar:
+                snapshot_path = CatalogJournal.snapshot_of(self.journal_path)
+
+        if not retomar:
+            with CatalogJournal(self.journal_path) as journal:
+                if snapshot_path:
+                    logger.info(f"♻️ Journal incompleto; refazendo o parsing de {snapshot_path}")
+                    await self.scraper_service.extract_from_snapshot(snapshot_path, journal)
+                else:
+                    browser = self.scraper_service.browser
+                    if not browser.is_alive:
+                        await browser.restart()
+                    codec = compressed_io.resolve_codec("auto")
+                    snapshot_path = self.snapshot_dir / (
+                        f"indice-{time.strftime('%Y%m%d-%H%M%S')}.html{compressed_io.SUFFIXES[codec]}"
+                    )
+                    await self.scraper_service.fetch_and_extract_structure(journal, snapshot_path)
+
+        catalog = await self.persistence_service.compact_journal(self.journal_path)
+        await self.binary_service.save_catalog(catalog, None)
+
+        detalhes = {'poemas': catalog.total_poemas, 'categorias': catalog.total_categorias}
+        if anterior is not None:
+            diff = self.diff_service.diff(anterior, catalog)
+            self.diff_service.save_diff(diff, self.diff_path)
+            detalhes['poemas_adicionados'] = len(diff.poemas_adicionados)
+            detalhes['poemas_alterados'] = len(diff.changed_poema_ids)
+            logger.info(f"📊 {diff.summary()}")
+        return detalhes
+
+    async def sync_missing(self) -> Dict[str, int]:
+        """
+        Baixa os poemas ausentes do disco segundo o manifesto.
+
+        A primeira execução reconcilia e incorpora PDFs existentes; as
+        seguintes só conferem tamanho/mtime das entradas registradas.
+
+        Returns:
+            Faltantes encontrados e resultado dos downloads
+        """
+        source = (
+            self.binary_service if self.binary_service.is_current_copy_of(self.persistence_service)
+            else self.persistence_service
+        )
+        if not source.default_path.exists():
+            raise FileNotFoundError(f"Arquivo de estrutura não encontrado: {source.default_path}")
+
+        reconcile = self.manifest.reconcile(self.filter_service.base_path, adopt=not self._reconciled)
+        self._reconciled = True
+        # Chaves lidas depois da reconciliação: inclui o que syncs anteriores baixaram
+        self.filter_service.refresh_manifest()
+
+        categorias_faltantes = []
+        total_faltantes = 0
+        async for categoria in source.iter_categorias():
+            cat_filtrada, faltantes = self.filter_service.plan_missing(categoria)
+            if cat_filtrada:
+                categorias_faltantes.append(cat_filtrada)
+                total_faltantes += faltantes
+
+        detalhes = {'faltantes': total_faltantes, 'removidos': reconcile['removidos']}
+        if not total_faltantes:
+            logger.info("✅ Nenhum poema faltante")
+            return detalhes
+
+        logger.info(f"📊 {total_faltantes} poemas para baixar")
+        ledger = self.download_service.http_downloader.ledger
+        if ledger:
+            # Cada sync é uma execução própria no ledger (main_report --run)
+            ledger.run_id = time.strftime('%Y%m%d-%H%M%S')
+
+        self.progress = ProgressTracker(total_faltantes)
+        for categoria in categorias_faltantes:
+            await self.download_service.download_categoria_recursively(categoria, self.progress)
+
+        if ledger:
+            ledger.flush()
+        detalhes['baixados'] = self.progress.sucesso
+        detalhes['falhas'] = self.progress.falhas
+        return detalhes
+
+
+class SyncScheduler:
+    """
+    Agenda as tarefas do SyncService e aceita disparos manuais.
+
+    Uma tarefa por vez: uma atualização da estrutura é sempre seguida de
+    um sync. Disparos durante uma execução ficam pendentes e rodam em
+    seguida (vários disparos iguais contam como um).
+    """
+
+    def __init__(
+        self,
+        sync_service: SyncService,
+        sync_interval: float,
+        refresh_interval: Optional[float],
+        refresh_on_start: bool = False
+    ):
+        self.sync_service = sync_service
+        self.sync_interval = sync_interval
+        self.refresh_interval = refresh_interval
+        self.started_at = time.time()
+        self.current: Optional[SyncRun] = None
+        self.last: Dict[str, SyncRun] = {}
+        self._next = {
+            SYNC: time.monotonic(),
+            REFRESH: time.monotonic() if refresh_on_start else self._after(refresh_interval),
+        }
+        self._wakeup = asyncio.Event()
+
+    @staticmethod
+    def _after(interval: Optional[float]) -> float:
+        return time.monotonic() + interval if interval else float('inf')
+
+    def trigger(self, tarefa: str) -> None:
+        """Agenda a tarefa para agora (REFRESH ou SYNC)"""
+        if tarefa not in self._next:
+            raise ValueError(f"Tarefa desconhecida: {tarefa}")
+        self._next[tarefa] = time.monotonic()
+        self._wakeup.set()
+        logger.info(f"🔔 Disparo manual: {tarefa}")
+
+    def status(self) -> Dict[str, Any]:
+        """Estado atual, últimas execuções e próximos agendamentos"""
+        agora = time.monotonic()
+        status: Dict[str, Any] = {
+            'iniciado_em': self.started_at,
+            'executando': self.current.model_dump() if self.current else None,
+            'ultimas': {tarefa: run.model_dump() for tarefa, run in self.last.items()},
+            'proximas_em_s': {
+                tarefa: round(max(0.0, quando - agora), 1)
+                for tarefa, quando in self._next.items() if quando != float('inf')
+            },
+        }
+        progress = self.sync_service.progress
+        if self.current and self.current.tarefa == SYNC and progress:
+            status['progresso'] = {
+                'atual': progress.atual,
+                'total': progress.total,
+                'bytes': progress.bytes,
+                'eta_s': progress.eta,
+            }
+        return status
+
+    async def _execute(self, tarefa: str) -> None:
+        """Executa uma tarefa; falhas são registradas e não derrubam o daemon"""
+        self.current = run = SyncRun(tarefa=tarefa, inicio=time.time())
+        logger.info(f"▶️ Iniciando tarefa: {tarefa}")
+        try:
+            with profiling.span(f"daemon.{tarefa}"):
+                if tarefa == REFRESH:
+                    run.detalhes = await self.sync_service.refresh_structure()
+                else:
+                    run.detalhes = await self.sync_service.sync_missing()
+            run.ok = True
+            SYNC_LAST_SUCCESS.labels(tarefa=tarefa).set(time.time())
+        except Exception as e:
+            run.erro = f"{type(e).__name__}: {e}"
+            logger.error(f"❌ Tarefa {tarefa} falhou: {e}", exc_info=True)
+        finally:
+            run.fim = time.time()
+            SYNC_RUNS.labels(tarefa=tarefa, resultado="ok" if run.ok else "erro").inc()
+            self.last[tarefa] = run
+            self.current = None
+        logger.info(f"⏹️ Tarefa {tarefa} concluída em {run.duracao:.1f}s: {run.detalhes}")
+
+    async def run(self) -> None:
+        """Laço principal; roda até a task ser cancelada (ex.: SIGTERM)"""
+        while True:
+            agora = time.monotonic()
+            if self._next[REFRESH] <= agora:
+                self._next[REFRESH] = self._after(self.refresh_interval)
+                await self._execute(REFRESH)
+                self._next[SYNC] = time.monotonic()
+                continue
+            if self._next[SYNC] <= agora:
+                self._next[SYNC] = self._after(self.sync_interval)
+                await self._execute(SYNC)
+                continue
+
+            # Dorme até o próximo agendamento ou um disparo manual
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=min(self._next.values()) - agora)
+            except TimeoutError:
+                pass
@@ -0,0 +1,86 @@
+"""CLI - Ponto de Entrada Único (comando `pessoa`)
+
+    pessoa scrape  [--format binary|sqlite|json] [--profile ...]
+    pessoa plan    [--order catalogo|menores|maiores] [--prioridade CAT]
+    pessoa download [--diff ...] [--categoria ...] [--plan ...] [--format ...] ...
+    pessoa verify  [base_path] [--full]
+    pessoa stats
+    pessoa daemon  [--sync-every 15] [--refresh-every 360] [--port 8765]
+    pessoa extract [base_path] [--catalog] [--workers N] [--show ID]
+    pessoa metadata [--concurrency 4] [--rate 1.0] [--show ID]
+    pessoa probe   [--concurrency 8] [--rate 2.0] [--exhaustive]
+    pessoa search  consulta [--texto] [--limit 20]
+    pessoa export  destino.tar.zst [--workers N]
+    pessoa diff    antigo [novo]
+    pessoa report  [ledger] [--run last]
+
+Cada subcomando importa só o seu módulo main_* na hora de executar:
+`pessoa download` não carrega Playwright nem BeautifulSoup, e `pessoa
+stats` nem httpx. `pessoa <comando> --help` mostra as opções do comando.
+"""
+
+import argparse
+import asyncio
+import importlib
+import inspect
+import sys
+from typing import List, Optional
+
+# comando -> (módulo, descrição)
+COMMANDS = {
+    "scrape": ("src.main_scraper", "Scraping do índice e download dos PDFs"),
+    "plan": ("src.main_plan", "HEAD nos faltantes: bytes, duração e espaço em disco antes do download"),
+    "download": ("src.main_download", "Download resumível dos poemas faltantes"),
+    "verify": ("src.main_verify", "Confere os PDFs no disco contra o manifesto"),
+    "probe": ("src.main_probe", "Procura por HEAD poemas no servidor que faltam no catálogo"),
+    "stats": ("src.main_stats", "Totais do catálogo, downloads e ledger"),
+    "extract": ("src.main_extract", "Extração paralela de texto dos PDFs, com cache"),
+    "metadata": ("src.main_metadata", "Metadados das páginas dos poemas (data, heterónimo, fonte)"),
+    "search": ("src.main_search", "Busca aproximada por título ou no texto dos poemas"),
+    "export": ("src.main_export", "Exporta o espelho em tar/zip (streaming, compressão paralela)"),
+    "daemon": ("src.main_daemon", "Sincronização periódica com browser e HTTP aquecidos"),
+    "diff": ("src.main_diff", "Compara dois snapshots do catálogo"),
+    "report": ("src.main_report", "Percentis, vazão e erros do ledger de requisições"),
+}
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Parser de primeiro nível; as opções de cada comando ficam no seu módulo"""
+    parser = argparse.ArgumentParser(prog="pessoa", description="Arquivo Pessoa: scraping e download")
+    subparsers = parser.add_subparsers(dest="command", metavar="<comando>", required=True)
+    for name, (_, description) in COMMANDS.items():
+        subparsers.add_parser(name, help=description, add_help=False)
+    return parser
+
+
+def run(command: str, argv: List[str]) -> int:
+    """
+    Importa o módulo do comando e executa seu main.
+
+    Args:
+        command: Nome do subcomando
+        argv: Argumentos repassados ao parser do comando
+
+    Returns:
+        Código de saída
+    """
+    module_name, _ = COMMANDS[command]
+    module = importlib.import_module(module_name)
+    result = module.main(argv)
+    if inspect.iscoroutine(result):
+        result = asyncio.run(result)
+    return result or 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Entrada do console script `pessoa`"""
+    # Tudo após o comando (inclusive -h) vai intacto para o parser dele
+    args, rest = build_parser().parse_known_args(argv)
+    try:
+        return run(args.command, rest)
+    except KeyboardInterrupt:
+        return 130
+
+
+if __name__ == "__main__":
+    sys.exit(main())
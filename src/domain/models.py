@@ -1,7 +1,31 @@
 """Domain Models - Entidades do Negócio"""
 
-from pydantic import BaseModel, Field
-from typing import List
+from bisect import bisect_left, insort
+from functools import lru_cache
+from pathlib import PurePosixPath
+from pydantic import BaseModel, Field, PrivateAttr
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+def pdf_filename(poema_id: int, titulo: str) -> str:
+    """Nome do PDF de um poema no espelho"""
+    return f"{poema_id:04d} - {titulo}.pdf"
+
+
+def pdf_relative_path(categoria_path: str, poema_id: int, titulo: str) -> str:
+    """
+    Path do PDF relativo ao diretório base, em formato POSIX.
+
+    Regra única de nomes: é a chave do manifesto, e filtro, download,
+    export, extração e plano de download a usam para achar o arquivo.
+    """
+    return f"{_posix_dir(categoria_path)}/{pdf_filename(poema_id, titulo)}"
+
+
+@lru_cache(maxsize=4096)
+def _posix_dir(categoria_path: str) -> str:
+    # Poucos paths de categoria, muitos poemas: normaliza cada um uma vez
+    return PurePosixPath(categoria_path).as_posix()
+
 
 class Poema(BaseModel):
     """Modelo que representa um poema"""
@@ -12,6 +36,27 @@ class Poema(BaseModel):
     class Config:
         frozen = True  # Imutável
 
+    @property
+    def filename(self) -> str:
+        """Nome do PDF no espelho"""
+        return pdf_filename(self.id, self.titulo)
+
+    def relative_path(self, categoria_path: str) -> str:
+        """Path do PDF sob a categoria onde ele é gravado (chave do manifesto)"""
+        return pdf_relative_path(categoria_path, self.id, self.titulo)
+
+
+class SubtreeStats:
+    """Agregados de uma subárvore de categorias"""
+
+    __slots__ = ('poemas', 'subcategorias', 'depth', 'bytes')
+
+    def __init__(self, poemas: int = 0, subcategorias: int = 0, depth: int = 0, bytes: int = 0):
+        self.poemas = poemas
+        self.subcategorias = subcategorias
+        self.depth = depth
+        self.bytes = bytes
+
 
 class Categoria(BaseModel):
     """Modelo que representa uma categoria com estrutura recursiva"""
@@ -20,9 +65,123 @@ class Categoria(BaseModel):
     poemas: List[Poema] = Field(default_factory=list)
     subcategorias: List['Categoria'] = Field(default_factory=list)
 
+    # Agregados da subárvore, calculados uma vez (bottom-up) e mantidos
+    # incrementalmente por add_poema/add_subcategoria/record_bytes
+    _stats: Optional[SubtreeStats] = PrivateAttr(default=None)
+    _parent: Optional['Categoria'] = PrivateAttr(default=None)
+    _poema_bytes: Dict[int, int] = PrivateAttr(default_factory=dict)
+
     class Config:
         frozen = False
 
+    def __eq__(self, other: object) -> bool:
+        # Ignora caches e o ponteiro para o pai (evita recursão infinita)
+        if not isinstance(other, Categoria):
+            return NotImplemented
+        return self.__dict__ == other.__dict__
+
+    @property
+    def stats(self) -> SubtreeStats:
+        """Agregados da subárvore, calculados sob demanda"""
+        if self._stats is None:
+            self._compute_stats()
+        return self._stats
+
+    @property
+    def total_poemas(self) -> int:
+        """Número de poemas na categoria e em todas as subcategorias"""
+        return self.stats.poemas
+
+    @property
+    def total_subcategorias(self) -> int:
+        """Número de subcategorias descendentes (todos os níveis)"""
+        return self.stats.subcategorias
+
+    @property
+    def depth(self) -> int:
+        """Profundidade máxima da subárvore (0 se sem subcategorias)"""
+        return self.stats.depth
+
+    @property
+    def total_bytes(self) -> int:
+        """Soma dos tamanhos conhecidos (via record_bytes) na subárvore"""
+        return self.stats.bytes
+
+    def _compute_stats(self) -> None:
+        """Calcula agregados bottom-up, reaproveitando subárvores já calculadas"""
+        order = []
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            order.append(node)
+            for sub in node.subcategorias:
+                sub._parent = node
+                if sub._stats is None:
+                    stack.append(sub)
+
+        for node in reversed(order):
+            stats = SubtreeStats(
+                poemas=len(node.poemas),
+                subcategorias=len(node.subcategorias),
+                bytes=sum(node._poema_bytes.values())
+            )
+            for sub in node.subcategorias:
+                sub_stats = sub._stats
+                stats.poemas += sub_stats.poemas
+                stats.subcategorias += sub_stats.subcategorias
+                stats.depth = max(stats.depth, sub_stats.depth + 1)
+                stats.bytes += sub_stats.bytes
+            node._stats = stats
+
+    def _propagate(self, poemas: int = 0, subcategorias: int = 0, bytes: int = 0) -> None:
+        """Aplica deltas nesta categoria e nos ancestrais já calculados"""
+        node = self
+        child_depth = None
+        while node is not None and node._stats is not None:
+            stats = node._stats
+            stats.poemas += poemas
+            stats.subcategorias += subcategorias
+            stats.bytes += bytes
+            if child_depth is not None:
+                stats.depth = max(stats.depth, child_depth + 1)
+            child_depth = stats.depth
+            node = node._parent
+
+    def add_poema(self, poema: Poema) -> None:
+        """Adiciona poema mantendo os agregados atualizados"""
+        self.poemas.append(poema)
+        self._propagate(poemas=1)
+
+    def add_subcategoria(self, subcategoria: 'Categoria') -> None:
+        """Adiciona subcategoria mantendo os agregados atualizados"""
+        self.subcategorias.append(subcategoria)
+        subcategoria._parent = self
+        if self._stats is None:
+            return
+        sub_stats = subcategoria.stats
+        self._stats.depth = max(self._stats.depth, sub_stats.depth + 1)
+        self._propagate(
+            poemas=sub_stats.poemas,
+            subcategorias=1 + sub_stats.subcategorias,
+            bytes=sub_stats.bytes
+        )
+
+    def record_bytes(self, poema_id: int, size: int) -> None:
+        """Registra o tamanho do arquivo de um poema desta categoria"""
+        delta = size - self._poema_bytes.get(poema_id, 0)
+        self._poema_bytes[poema_id] = size
+        self._propagate(bytes=delta)
+
+    def invalidate_stats(self) -> None:
+        """
+        Descarta os agregados desta categoria e dos ancestrais.
+        Necessário após mutar poemas/subcategorias diretamente.
+        """
+        node = self
+        while node is not None:
+            node._stats = None
+            node = node._parent
+
 
 # Rebuild forward references
 Categoria.model_rebuild()
@@ -38,32 +197,417 @@ class PdfMetadata(BaseModel):
     def __init__(self, **data):
         super().__init__(**data)
         if not self.filename:
-            object.__setattr__(self, 'filename', f"{self.poema_id:04d} - {self.titulo}.pdf")
+            object.__setattr__(self, 'filename', pdf_filename(self.poema_id, self.titulo))
 
     class Config:
         frozen = True
 
 
+class ManifestEntry(BaseModel):
+    """Registro de um PDF baixado: identidade do arquivo e validadores do servidor"""
+    poema_id: int
+    path: str  # Relativo ao diretório base, separador '/'
+    size: int
+    mtime_ns: int
+    sha256: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    saved_at: float
+
+    class Config:
+        frozen = True
+
+
+class TextEntry(BaseModel):
+    """Texto extraído de um poema: origem, identidade do PDF e resultado"""
+    poema_id: int
+    path: str  # PDF de origem, relativo ao diretório base
+    sha256: str
+    mtime_ns: int
+    chars: int = 0
+    extractor: str = ""
+    extracted_at: float
+    erro: Optional[str] = None
+
+    class Config:
+        frozen = True
+
+
+class PoemaMetadata(BaseModel):
+    """Metadados da página /textos/{id} de um poema, com os validadores HTTP"""
+    poema_id: int
+    titulo: Optional[str] = None
+    heteronimo: Optional[str] = None
+    data: Optional[str] = None
+    fonte: Optional[str] = None
+    notas: List[str] = Field(default_factory=list)
+    status: int = 0  # HTTP da última busca (0: sem resposta)
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    fetched_at: float
+    erro: Optional[str] = None
+
+    class Config:
+        frozen = True
+
+
+class RequestRecord(BaseModel):
+    """Uma tentativa HTTP, com tempos por etapa (ms)"""
+    run_id: str = ""
+    ts: float
+    poema_id: int
+    categoria_path: str = ""
+    recurso: str = "pdf"  # "pdf", "pagina" (/textos/{id}) ou "head" (HEAD no PDF)
+    attempt: int = 1
+    status: int = 0  # 0: sem resposta (erro de rede/timeout)
+    bytes: int = 0
+    connect_ms: float = 0.0
+    tls_ms: float = 0.0
+    ttfb_ms: float = 0.0
+    total_ms: float
+    error: Optional[str] = None
+
+    class Config:
+        frozen = True
+
+    @property
+    def ok(self) -> bool:
+        """Tentativa concluída com resposta 2xx (ou 304 a uma requisição condicional)"""
+        return self.error is None and (200 <= self.status < 300 or self.status == 304)
+
+
+class LatencyStats(BaseModel):
+    """Percentis de uma amostra de tempos (ms)"""
+    count: int = 0
+    p50: float = 0.0
+    p90: float = 0.0
+    p95: float = 0.0
+    p99: float = 0.0
+    max: float = 0.0
+
+
+class ThroughputBucket(BaseModel):
+    """Vazão em uma janela de tempo do ledger"""
+    inicio: float
+    requisicoes: int
+    bytes: int
+    bytes_por_s: float
+
+
+class CategoriaLatency(BaseModel):
+    """Latência agregada dos downloads de uma categoria"""
+    path: str
+    requisicoes: int
+    media_ms: float
+    p95_ms: float
+
+
+class LedgerReport(BaseModel):
+    """Relatório agregado das tentativas registradas no ledger"""
+    runs: List[str] = Field(default_factory=list)
+    tentativas: int = 0
+    sucessos: int = 0
+    falhas: int = 0
+    retentativas: int = 0
+    bytes: int = 0
+    total: LatencyStats = Field(default_factory=LatencyStats)
+    ttfb: LatencyStats = Field(default_factory=LatencyStats)
+    connect: LatencyStats = Field(default_factory=LatencyStats)
+    erros: Dict[str, int] = Field(default_factory=dict)
+    throughput: List[ThroughputBucket] = Field(default_factory=list)
+    categorias_lentas: List[CategoriaLatency] = Field(default_factory=list)
+
+
+class SyncRun(BaseModel):
+    """Execução de uma tarefa do daemon (atualização da estrutura ou sync)"""
+    tarefa: str
+    inicio: float
+    fim: float = 0.0
+    ok: bool = False
+    erro: Optional[str] = None
+    detalhes: Dict[str, int] = Field(default_factory=dict)
+
+    @property
+    def duracao(self) -> float:
+        return max(0.0, self.fim - self.inicio)
+
+
+class ProbeReport(BaseModel):
+    """Resultado da sondagem do espaço de IDs contra o catálogo"""
+    ids_catalogo: int = 0
+    maximo_catalogo: int = 0
+    limite_superior: int = 0  # maior ID sondado
+    sondagens: int = 0
+    fora_do_catalogo: List[int] = Field(default_factory=list)  # existem no servidor, faltam no catálogo
+    faixas_vazias: List[Tuple[int, int]] = Field(default_factory=list)  # presumidas vazias por amostragem
+    erros: Dict[int, str] = Field(default_factory=dict)  # sem resposta conclusiva
+    duracao: float = 0.0
+
+
+class PlanItem(BaseModel):
+    """Poema faltante no plano de download, com o que o HEAD informou"""
+    poema_id: int
+    titulo: str
+    categoria_path: str
+    size: Optional[int] = None  # Content-Length; None se o servidor não informou
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    erro: Optional[str] = None  # HEAD sem resposta conclusiva; o download tenta mesmo assim
+
+    class Config:
+        frozen = True
+
+    @property
+    def filename(self) -> str:
+        """Nome do PDF, como o DownloadService o grava"""
+        return pdf_filename(self.poema_id, self.titulo)
+
+    @property
+    def relative_path(self) -> str:
+        """Path do PDF relativo ao diretório base (chave do manifesto)"""
+        return pdf_relative_path(self.categoria_path, self.poema_id, self.titulo)
+
+
+class DownloadPlan(BaseModel):
+    """Plano de download: itens na ordem de execução e estimativas"""
+    criado_em: float
+    base_path: str
+    ordem: str  # "catalogo", "menores" ou "maiores"
+    prioridades: List[str] = Field(default_factory=list)  # categorias que vão à frente, nesta ordem
+    itens: List[PlanItem] = Field(default_factory=list)
+    ausentes: List[int] = Field(default_factory=list)  # 404 no HEAD: fora do plano
+    total_bytes: int = 0  # itens sem Content-Length contam pela mediana
+    sem_tamanho: int = 0
+    latencia_ms: float = 0.0  # por download, até o primeiro byte
+    vazao_bytes_s: float = 0.0  # por download, depois do primeiro byte
+    fonte_vazao: str = "padrão"  # "ledger" (downloads anteriores) ou "padrão"
+    delay_medio: float = 0.0  # pausa entre downloads
+    duracao_estimada: float = 0.0  # segundos
+    espaco_livre: int = 0
+
+    @property
+    def cabe_no_disco(self) -> bool:
+        return self.total_bytes <= self.espaco_livre
+
+
+class SearchHit(BaseModel):
+    """Resultado de busca: poema, onde aparece no catálogo e relevância"""
+    poema_id: int
+    titulo: str
+    categorias: List[str] = Field(default_factory=list)
+    score: float = 0.0
+    trecho: Optional[str] = None  # Trecho do texto com os termos encontrados
+
+
+class CatalogIndex:
+    """
+    Índices em memória sobre a árvore de categorias.
+    
+    Construído em uma única travessia: id -> (poema, categorias que o contêm),
+    path -> categoria e uma lista ordenada de títulos para busca por prefixo.
+    """
+
+    def __init__(self, categorias: List[Categoria]):
+        self.poemas: Dict[int, Tuple[Poema, List[Categoria]]] = {}
+        self.categorias: Dict[str, Categoria] = {}
+        self.titulos: List[Tuple[str, int]] = []
+
+        # Carga inicial: anexa e ordena uma vez
+        self._walk(categorias, self.titulos.append)
+        self.titulos.sort()
+
+    def _walk(self, categorias: List[Categoria], add_titulo: Callable[[Tuple[str, int]], None]) -> None:
+        """Indexa as subárvores em pré-ordem"""
+        stack = list(reversed(categorias))
+        while stack:
+            categoria = stack.pop()
+            self.categorias.setdefault(categoria.path, categoria)
+            for poema in categoria.poemas:
+                self._add(categoria, poema, add_titulo)
+            stack.extend(reversed(categoria.subcategorias))
+
+    def _add(self, categoria: Categoria, poema: Poema, add_titulo: Callable[[Tuple[str, int]], None]) -> None:
+        entry = self.poemas.get(poema.id)
+        if entry is None:
+            self.poemas[poema.id] = (poema, [categoria])
+            add_titulo((poema.titulo.casefold(), poema.id))
+        else:
+            entry[1].append(categoria)
+
+    def add_categoria(self, categoria: Categoria) -> None:
+        """Indexa uma subárvore nova, mantendo os títulos ordenados"""
+        self._walk([categoria], self._insort_titulo)
+
+    def add_poema(self, categoria: Categoria, poema: Poema) -> None:
+        """Indexa um poema recém-adicionado a uma categoria já indexada"""
+        self._add(categoria, poema, self._insort_titulo)
+
+    def _insort_titulo(self, titulo: Tuple[str, int]) -> None:
+        insort(self.titulos, titulo)
+
+    def find_by_titulo_prefix(self, prefix: str) -> Iterator[Poema]:
+        """Itera poemas cujo título começa com prefix (sem diferenciar caixa)"""
+        key = prefix.casefold()
+        titulos = self.titulos
+        i = bisect_left(titulos, (key, -1))
+        while i < len(titulos) and titulos[i][0].startswith(key):
+            yield self.poemas[titulos[i][1]][0]
+            i += 1
+
+
 class StructureCatalog(BaseModel):
     """Catálogo de estrutura completo"""
     total_categorias: int
     total_poemas: int
     categorias: List[Categoria]
 
+    _index: Optional[CatalogIndex] = PrivateAttr(default=None)
+
     @classmethod
     def from_categorias(cls, categorias: List[Categoria]) -> 'StructureCatalog':
         """Factory method para criar catálogo a partir de lista de categorias"""
-        total_poemas = sum(_count_poemas(cat) for cat in categorias)
+        total_poemas = sum(cat.total_poemas for cat in categorias)
         return cls(
             total_categorias=len(categorias),
             total_poemas=total_poemas,
             categorias=categorias
         )
 
+    def __setattr__(self, name: str, value) -> None:
+        super().__setattr__(name, value)
+        if name == 'categorias':
+            self.invalidate_index()
+
+    def __eq__(self, other: object) -> bool:
+        # Ignora o índice privado: dois catálogos com a mesma árvore são iguais
+        if not isinstance(other, StructureCatalog):
+            return NotImplemented
+        return self.__dict__ == other.__dict__
+
+    @property
+    def index(self) -> CatalogIndex:
+        """Índice da árvore, construído sob demanda na primeira consulta"""
+        if self._index is None:
+            self._index = CatalogIndex(self.categorias)
+        return self._index
+
+    def invalidate_index(self) -> None:
+        """
+        Descarta os índices. Deve ser chamado após mutar a árvore
+        diretamente (fora de add_categoria/add_poema).
+        """
+        self._index = None
+
+    def get_poema(self, poema_id: int) -> Optional[Poema]:
+        """Busca poema por id em O(1)"""
+        entry = self.index.poemas.get(poema_id)
+        return entry[0] if entry else None
+
+    def get_categorias_do_poema(self, poema_id: int) -> List[Categoria]:
+        """Retorna as categorias que contêm o poema diretamente"""
+        entry = self.index.poemas.get(poema_id)
+        return list(entry[1]) if entry else []
+
+    def get_categoria(self, path: str) -> Optional[Categoria]:
+        """Busca categoria pelo path em O(1)"""
+        return self.index.categorias.get(path)
+
+    def find_by_titulo_prefix(
+        self,
+        prefix: str,
+        limit: Optional[int] = None
+    ) -> List[Poema]:
+        """
+        Busca poemas por prefixo de título em O(log n + k).
+        
+        Args:
+            prefix: Prefixo do título (sem diferenciar maiúsculas)
+            limit: Número máximo de resultados (opcional)
+            
+        Returns:
+            Poemas em ordem alfabética de título
+        """
+        result = []
+        for poema in self.index.find_by_titulo_prefix(prefix):
+            if limit is not None and len(result) >= limit:
+                break
+            result.append(poema)
+        return result
+
+    def add_categoria(self, categoria: Categoria) -> None:
+        """Adiciona categoria de primeiro nível e atualiza totais"""
+        self.categorias.append(categoria)
+        self.total_categorias += 1
+        self.total_poemas += categoria.total_poemas
+        # Índice já construído é atualizado, não descartado
+        if self._index is not None:
+            self._index.add_categoria(categoria)
+
+    def add_poema(self, categoria_path: str, poema: Poema) -> None:
+        """
+        Adiciona poema a uma categoria existente.
+        
+        Raises:
+            KeyError: Se a categoria não existir no catálogo
+        """
+        categoria = self.get_categoria(categoria_path)
+        if categoria is None:
+            raise KeyError(f"Categoria não encontrada: {categoria_path}")
+        categoria.add_poema(poema)
+        self.total_poemas += 1
+        # get_categoria construiu o índice: atualiza em O(log n) + inserção
+        self._index.add_poema(categoria, poema)
+
+
 
-def _count_poemas(categoria: Categoria) -> int:
-    """Função auxiliar para contar poemas recursivamente"""
-    count = len(categoria.poemas)
-    for sub in categoria.subcategorias:
-        count += _count_poemas(sub)
-    return count
+class PoemaChange(BaseModel):
+    """Alteração de um poema entre dois snapshots do catálogo"""
+    id: int
+    antes: Poema
+    depois: Poema
+
+    class Config:
+        frozen = True
+
+
+class CategoriaChange(BaseModel):
+    """Categoria renomeada ou movida entre dois snapshots"""
+    path_antes: str
+    path_depois: str
+
+    class Config:
+        frozen = True
+
+
+class CatalogDiff(BaseModel):
+    """Diferenças entre dois snapshots do catálogo"""
+    poemas_adicionados: List[Poema] = Field(default_factory=list)
+    poemas_removidos: List[Poema] = Field(default_factory=list)
+    poemas_renomeados: List[PoemaChange] = Field(default_factory=list)
+    poemas_movidos: List[PoemaChange] = Field(default_factory=list)
+    categorias_adicionadas: List[str] = Field(default_factory=list)
+    categorias_removidas: List[str] = Field(default_factory=list)
+    categorias_renomeadas: List[CategoriaChange] = Field(default_factory=list)
+    categorias_movidas: List[CategoriaChange] = Field(default_factory=list)
+
+    @property
+    def is_empty(self) -> bool:
+        """True se os snapshots são equivalentes"""
+        return not any(getattr(self, name) for name in type(self).model_fields)
+
+    @property
+    def changed_poema_ids(self) -> set:
+        """Ids cujo arquivo local precisa ser (re)baixado: novos, renomeados ou movidos"""
+        ids = {poema.id for poema in self.poemas_adicionados}
+        ids.update(change.id for change in self.poemas_renomeados)
+        ids.update(change.id for change in self.poemas_movidos)
+        return ids
+
+    def summary(self) -> str:
+        """Resumo em uma linha"""
+        return (
+            f"poemas: +{len(self.poemas_adicionados)} -{len(self.poemas_removidos)} "
+            f"~{len(self.poemas_renomeados)} renomeados, {len(self.poemas_movidos)} movidos | "
+            f"categorias: +{len(self.categorias_adicionadas)} -{len(self.categorias_removidas)} "
+            f"~{len(self.categorias_renomeadas)} renomeadas, {len(self.categorias_movidas)} movidas"
+        )
@@ -2,7 +2,8 @@
 
 from abc import ABC, abstractmethod
 from pathlib import Path
-from src.domain.models import StructureCatalog
+from typing import AsyncIterator, Callable, Dict, List, Optional, Set, Tuple
+from src.domain.models import Categoria, ManifestEntry, PoemaMetadata, SearchHit, StructureCatalog, TextEntry
 
 
 class IJsonRepository(ABC):
@@ -18,6 +19,34 @@ class IJsonRepository(ABC):
         """Carrega estrutura de arquivo JSON"""
         pass
 
+    @abstractmethod
+    async def load_bytes(self, filepath: Path) -> bytes:
+        """Carrega conteúdo bruto do arquivo JSON, sem decodificar"""
+        pass
+
+    @abstractmethod
+    async def load_catalog(self, filepath: Path, strict: bool = False) -> StructureCatalog:
+        """Carrega arquivo diretamente como catálogo tipado"""
+        pass
+
+    async def load_subtree(self, filepath: Path, path: str) -> Optional[Categoria]:
+        """
+        Carrega apenas a categoria com o path indicado.
+        Implementação padrão carrega o catálogo inteiro; formatos com
+        acesso aleatório podem sobrescrever.
+        """
+        catalog = await self.load_catalog(filepath)
+        return catalog.get_categoria(path)
+
+    async def iter_categorias(self, filepath: Path) -> AsyncIterator[Categoria]:
+        """
+        Itera categorias de primeiro nível. Implementação padrão carrega
+        o catálogo inteiro; formatos incrementais podem sobrescrever.
+        """
+        catalog = await self.load_catalog(filepath)
+        for categoria in catalog.categorias:
+            yield categoria
+
 
 class IPdfFileRepository(ABC):
     """Interface para gerenciamento de arquivos PDF"""
@@ -28,8 +57,14 @@ class IPdfFileRepository(ABC):
         pass
 
     @abstractmethod
-    async def save(self, content: bytes, filepath: Path) -> None:
-        """Salva conteúdo PDF em arquivo"""
+    async def save(
+        self,
+        content: bytes,
+        filepath: Path,
+        poema_id: Optional[int] = None,
+        validators: Optional[Dict[str, str]] = None
+    ) -> None:
+        """Salva conteúdo PDF em arquivo (e registra no manifesto, se houver)"""
         pass
 
     @abstractmethod
@@ -45,3 +80,94 @@ class IDownloadRepository(ABC):
     async def download_pdf(self, poema_id: int, save_path: Path) -> None:
         """Faz download de um PDF específico"""
         pass
+
+
+class IManifestRepository(ABC):
+    """Interface para o manifesto de PDFs baixados"""
+
+    @abstractmethod
+    def record(self, entry: ManifestEntry) -> None:
+        """Registra (ou substitui) a entrada de um arquivo, atomicamente"""
+        pass
+
+    @abstractmethod
+    def get(self, poema_id: int) -> List[ManifestEntry]:
+        """Entradas do poema (um poema pode estar em várias categorias)"""
+        pass
+
+    @abstractmethod
+    def remove(self, poema_id: int, path: str) -> None:
+        """Remove a entrada de um arquivo"""
+        pass
+
+    @abstractmethod
+    def keys(self) -> Set[Tuple[int, str]]:
+        """Pares (poema_id, path) registrados"""
+        pass
+
+
+class ITextRepository(ABC):
+    """Interface para o armazenamento de textos extraídos, um por poema"""
+
+    @abstractmethod
+    def record(self, entry: TextEntry, texto: str) -> None:
+        """Registra (ou substitui) o texto de um poema"""
+        pass
+
+    @abstractmethod
+    def get(self, poema_id: int) -> Optional[str]:
+        """Texto do poema, se extraído"""
+        pass
+
+    @abstractmethod
+    def entries(self) -> Dict[int, TextEntry]:
+        """Metadados de todos os textos, por poema_id (sem os textos)"""
+        pass
+
+    @abstractmethod
+    def remove(self, poema_ids: Set[int]) -> None:
+        """Remove os textos dos poemas"""
+        pass
+
+
+class IMetadataRepository(ABC):
+    """Interface para o armazenamento dos metadados das páginas de poemas"""
+
+    @abstractmethod
+    def record(self, metadata: PoemaMetadata) -> None:
+        """Registra (ou substitui) os metadados de um poema"""
+        pass
+
+    @abstractmethod
+    def get(self, poema_id: int) -> Optional[PoemaMetadata]:
+        """Metadados do poema, se já buscados"""
+        pass
+
+    @abstractmethod
+    def entries(self) -> Dict[int, PoemaMetadata]:
+        """Metadados de todos os poemas, por poema_id"""
+        pass
+
+
+class ISearchIndex(ABC):
+    """Interface para o índice de busca de títulos e textos"""
+
+    @abstractmethod
+    def sync_poemas(self, poemas: Dict[int, Tuple[str, List[str]]]) -> Dict[str, int]:
+        """Alinha os títulos indexados ao catálogo (poema_id -> título, categorias)"""
+        pass
+
+    @abstractmethod
+    def sync_textos(self, origens: Dict[int, str], loader: Callable[[int], Optional[str]]) -> Dict[str, int]:
+        """Alinha os textos indexados aos extraídos (poema_id -> versão do texto)"""
+        pass
+
+    @abstractmethod
+    def search_titles(self, query: str, limit: int = 20, min_similarity: float = 0.5) -> List[SearchHit]:
+        """Busca aproximada por título"""
+        pass
+
+    @abstractmethod
+    def search_text(self, query: str, limit: int = 20) -> List[SearchHit]:
+        """Busca nos textos extraídos"""
+        pass
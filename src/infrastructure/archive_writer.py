@@ -0,0 +1,243 @@
+"""Infrastructure Archive Writer - Tar/Zip em Streaming com Compressão Paralela
+
+O arquivo é escrito sequencialmente (tar em modo stream, zip com data
+descriptors), então a saída pode ser um pipe. A compressão do tar é feita
+em blocos independentes por um pool de threads (zlib e zstd liberam o
+GIL): cada bloco vira um membro gzip ou um frame zstd, e a concatenação é
+um stream válido para `tar -xzf` / `tar --zstd -xf`, como no pigz. A
+memória fica limitada a alguns blocos em voo, qualquer que seja o tamanho
+do arquivo.
+"""
+
+import hashlib
+import io
+import logging
+import os
+import tarfile
+import time
+import zipfile
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import BinaryIO, Deque, Optional, Tuple
+from src.infrastructure import compressed_io
+
+logger = logging.getLogger(__name__)
+
+# formato -> codec do stream tar (zip guarda os PDFs sem recomprimir)
+FORMATS = {
+    'tar': None,
+    'tar.gz': 'gzip',
+    'tar.zst': 'zstd',
+    'zip': None,
+}
+
+_SUFFIXES = {
+    '.tar': 'tar',
+    '.tar.gz': 'tar.gz',
+    '.tgz': 'tar.gz',
+    '.tar.zst': 'tar.zst',
+    '.tzst': 'tar.zst',
+    '.zip': 'zip',
+}
+
+READ_BUFFER = 1 << 20
+BLOCK_SIZE = 4 << 20
+
+# Datas anteriores a 1980 não cabem no cabeçalho zip
+_ZIP_EPOCH = time.mktime((1980, 1, 1, 0, 0, 0, 0, 0, -1))
+
+
+def format_from_path(path: Path) -> Optional[str]:
+    """Formato pela extensão ("mirror.tar.zst" -> "tar.zst"), ou None"""
+    name = path.name.lower()
+    for suffix, fmt in _SUFFIXES.items():
+        if name.endswith(suffix):
+            return fmt
+    return None
+
+
+class _HashingReader:
+    """Lê um arquivo em blocos grandes calculando o SHA-256 no caminho"""
+
+    def __init__(self, f: BinaryIO):
+        self._f = f
+        self.sha256 = hashlib.sha256()
+        self.bytes = 0
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._f.read(size)
+        self.sha256.update(data)
+        self.bytes += len(data)
+        return data
+
+
+def _open_sequential(path: Path) -> BinaryIO:
+    """Abre sem buffer do Python (as leituras já são de READ_BUFFER) e avisa o kernel do acesso sequencial"""
+    f = open(path, 'rb', buffering=0)
+    if hasattr(os, 'posix_fadvise'):
+        os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+    return f
+
+
+class BlockCompressedWriter(io.RawIOBase):
+    """
+    Stream de escrita que comprime blocos independentes em paralelo.
+
+    Os blocos são gravados em raw na ordem de chegada; no máximo
+    2 * workers blocos ficam em voo.
+    """
+
+    def __init__(
+        self,
+        raw: BinaryIO,
+        codec: str,
+        level: Optional[int] = None,
+        workers: Optional[int] = None,
+        block_size: int = BLOCK_SIZE
+    ):
+        super().__init__()
+        self.raw = raw
+        self.codec = compressed_io.resolve_codec(codec)
+        self.level = level
+        self.block_size = block_size
+        self.workers = workers or os.cpu_count() or 1
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self._buffer = bytearray()
+        self._pending: Deque[Future] = deque()
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="compress")
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._buffer += data
+        self.bytes_in += len(data)
+        while len(self._buffer) >= self.block_size:
+            self._submit(bytes(self._buffer[:self.block_size]))
+            del self._buffer[:self.block_size]
+        return len(data)
+
+    def _submit(self, block: bytes) -> None:
+        self._pending.append(self._executor.submit(compressed_io.compress, block, self.codec, self.level))
+        while len(self._pending) > 2 * self.workers:
+            self._drain_one()
+
+    def _drain_one(self) -> None:
+        compressed = self._pending.popleft().result()
+        self.raw.write(compressed)
+        self.bytes_out += len(compressed)
+
+    def close(self) -> None:
+        """Comprime o resto do buffer e grava os blocos pendentes (não fecha raw)"""
+        if self.closed:
+            return
+        try:
+            if self._buffer:
+                self._submit(bytes(self._buffer))
+                self._buffer.clear()
+            while self._pending:
+                self._drain_one()
+            self.raw.flush()
+        finally:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            super().close()
+
+
+class ArchiveWriter:
+    """
+    Escreve um arquivo tar/zip membro a membro, sem seek.
+
+    add_file() lê a origem em blocos de READ_BUFFER e devolve o SHA-256
+    calculado durante a cópia (o conteúdo é lido uma única vez).
+    """
+
+    def __init__(
+        self,
+        raw: BinaryIO,
+        format: str = 'tar',
+        level: Optional[int] = None,
+        workers: Optional[int] = None
+    ):
+        if format not in FORMATS:
+            raise ValueError(f"Formato desconhecido: {format} (opções: {', '.join(FORMATS)})")
+        self.format = format
+        self._compressor: Optional[BlockCompressedWriter] = None
+        self._tar: Optional[tarfile.TarFile] = None
+        self._zip: Optional[zipfile.ZipFile] = None
+
+        if format == 'zip':
+            # PDFs já são comprimidos: ZIP_STORED não gasta CPU à toa
+            self._zip = zipfile.ZipFile(raw, 'w', compression=zipfile.ZIP_STORED)
+            return
+
+        out = raw
+        if FORMATS[format]:
+            self._compressor = out = BlockCompressedWriter(raw, FORMATS[format], level, workers)
+        self._tar = tarfile.open(fileobj=out, mode='w|', bufsize=READ_BUFFER, format=tarfile.PAX_FORMAT)
+        self._tar.copybufsize = READ_BUFFER
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @property
+    def compressed_bytes(self) -> Optional[int]:
+        """Bytes gravados após a compressão (None se não há compressão)"""
+        return self._compressor.bytes_out if self._compressor else None
+
+    def add_stream(self, arcname: str, fileobj: BinaryIO, size: int, mtime: float) -> str:
+        """
+        Adiciona um membro lendo de fileobj.
+
+        Args:
+            arcname: Caminho dentro do arquivo
+            fileobj: Origem, posicionada no início
+            size: Bytes a copiar
+            mtime: Data de modificação do membro
+
+        Returns:
+            SHA-256 do conteúdo copiado
+        """
+        reader = _HashingReader(fileobj)
+        if self._tar is not None:
+            info = tarfile.TarInfo(arcname)
+            info.size = size
+            info.mtime = int(mtime)
+            info.mode = 0o644
+            self._tar.addfile(info, reader)
+        else:
+            info = zipfile.ZipInfo(arcname, date_time=time.localtime(max(mtime, _ZIP_EPOCH))[:6])
+            info.compress_type = zipfile.ZIP_STORED
+            info.file_size = size
+            with self._zip.open(info, 'w') as dest:
+                while chunk := reader.read(READ_BUFFER):
+                    dest.write(chunk)
+        if reader.bytes != size:
+            raise IOError(f"{arcname}: {reader.bytes} bytes lidos, esperados {size} (arquivo alterado durante a exportação?)")
+        return reader.sha256.hexdigest()
+
+    def add_file(self, arcname: str, path: Path) -> Tuple[os.stat_result, str]:
+        """
+        Adiciona um arquivo do disco.
+
+        Returns:
+            (stat da origem, SHA-256 do conteúdo)
+        """
+        with _open_sequential(path) as f:
+            stat = os.fstat(f.fileno())
+            return stat, self.add_stream(arcname, f, stat.st_size, stat.st_mtime)
+
+    def close(self) -> None:
+        """Finaliza o arquivo (não fecha o stream de saída)"""
+        if self._tar is not None:
+            self._tar.close()
+            self._tar = None
+        if self._compressor is not None:
+            self._compressor.close()
+        if self._zip is not None:
+            self._zip.close()
+            self._zip = None
@@ -0,0 +1,306 @@
+"""Infrastructure Binary Catalog - Formato Binário com Leitura via mmap
+
+Layout (little-endian):
+
+    header      magic, versão, totais, contagens e offsets das tabelas
+    categorias  registros fixos ordenados por path (busca binária)
+    filhos      índices u32: raízes primeiro, depois filhos de cada categoria
+    poemas      registros fixos, contíguos por categoria
+    strings     offsets u32 (n + 1) seguidos do blob UTF-8 deduplicado
+
+Nada é decodificado na abertura: cada subárvore é materializada apenas
+quando acessada, e processos distintos compartilham as mesmas páginas
+do page cache.
+"""
+
+import json
+import logging
+import mmap
+import struct
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
+from src.domain.models import Categoria, Poema, StructureCatalog
+from src.domain.repositories import IJsonRepository
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"APCATBIN"
+VERSION = 1
+
+HEADER = struct.Struct('<8sHHIIIIIIQQQQ')
+CATEGORIA = struct.Struct('<IIIIII')  # nome, path, poema_start, poema_count, child_start, child_count
+POEMA = struct.Struct('<qII')         # id, titulo, categoria_path
+U32 = struct.Struct('<I')
+U32_PAIR = struct.Struct('<II')
+
+
+def is_binary_catalog(filepath: Path) -> bool:
+    """Verifica os magic bytes do arquivo"""
+    with filepath.open('rb') as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+def encode_catalog(catalog: StructureCatalog) -> bytes:
+    """
+    Serializa catálogo no formato binário.
+
+    Args:
+        catalog: Catálogo a serializar
+
+    Returns:
+        Conteúdo do arquivo
+    """
+    strings: Dict[str, int] = {}
+
+    def intern(value: str) -> int:
+        idx = strings.get(value)
+        if idx is None:
+            idx = strings[value] = len(strings)
+        return idx
+
+    # Todas as categorias, ordenadas por path para permitir busca binária
+    todas: List[Categoria] = []
+    stack = list(catalog.categorias)
+    while stack:
+        categoria = stack.pop()
+        todas.append(categoria)
+        stack.extend(categoria.subcategorias)
+    todas.sort(key=lambda cat: cat.path)
+    posicao = {id(cat): i for i, cat in enumerate(todas)}
+
+    filhos = [posicao[id(cat)] for cat in catalog.categorias]
+    poemas = bytearray()
+    registros = bytearray()
+    n_poemas = 0
+    for categoria in todas:
+        child_start = len(filhos)
+        filhos.extend(posicao[id(sub)] for sub in categoria.subcategorias)
+        registros += CATEGORIA.pack(
+            intern(categoria.nome),
+            intern(categoria.path),
+            n_poemas,
+            len(categoria.poemas),
+            child_start,
+            len(categoria.subcategorias)
+        )
+        for poema in categoria.poemas:
+            poemas += POEMA.pack(poema.id, intern(poema.titulo), intern(poema.categoria_path))
+        n_poemas += len(categoria.poemas)
+
+    blob = bytearray()
+    offsets = bytearray()
+    for value in strings:  # dict preserva a ordem de inserção (= índice)
+        offsets += U32.pack(len(blob))
+        blob += value.encode('utf-8')
+    offsets += U32.pack(len(blob))
+
+    cat_off = HEADER.size
+    child_off = cat_off + len(registros)
+    poem_off = child_off + U32.size * len(filhos)
+    str_off = poem_off + len(poemas)
+
+    header = HEADER.pack(
+        MAGIC, VERSION, 0,
+        catalog.total_categorias, catalog.total_poemas,
+        len(todas), len(catalog.categorias), n_poemas, len(strings),
+        cat_off, child_off, poem_off, str_off
+    )
+    return b''.join((
+        header,
+        registros,
+        struct.pack(f'<{len(filhos)}I', *filhos),
+        poemas,
+        offsets,
+        blob
+    ))
+
+
+class BinaryCatalogReader:
+    """Leitor lazy de catálogo binário via mmap"""
+
+    def __init__(self, filepath: Path):
+        self.filepath = filepath
+        self._file = filepath.open('rb')
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        (magic, version, _, self.total_categorias, self.total_poemas,
+         self.n_categorias, self.n_raizes, self.n_poemas, n_strings,
+         self._cat_off, self._child_off, self._poem_off, str_off) = HEADER.unpack_from(self._mm, 0)
+
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"Arquivo não é um catálogo binário: {filepath}")
+        if version != VERSION:
+            self.close()
+            raise ValueError(f"Versão de catálogo binário não suportada: {version}")
+
+        self._str_off = str_off
+        self._blob_off = str_off + U32.size * (n_strings + 1)
+        self._strings: Dict[int, str] = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self) -> None:
+        """Libera o mapeamento e o arquivo"""
+        self._mm.close()
+        self._file.close()
+
+    def __len__(self) -> int:
+        return self.n_raizes
+
+    def _string(self, idx: int) -> str:
+        value = self._strings.get(idx)
+        if value is None:
+            start, end = U32_PAIR.unpack_from(self._mm, self._str_off + U32.size * idx)
+            value = self._mm[self._blob_off + start:self._blob_off + end].decode('utf-8')
+            self._strings[idx] = value
+        return value
+
+    def _record(self, idx: int) -> tuple:
+        return CATEGORIA.unpack_from(self._mm, self._cat_off + CATEGORIA.size * idx)
+
+    def _child(self, pos: int) -> int:
+        return U32.unpack_from(self._mm, self._child_off + U32.size * pos)[0]
+
+    def _find(self, path: str) -> Optional[int]:
+        """Busca binária do path na tabela de categorias"""
+        lo, hi = 0, self.n_categorias
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._string(self._record(mid)[1]) < path:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self.n_categorias and self._string(self._record(lo)[1]) == path:
+            return lo
+        return None
+
+    def _decode(self, idx: int) -> Categoria:
+        """Materializa a subárvore da categoria idx"""
+        nome, path, poema_start, poema_count, child_start, child_count = self._record(idx)
+        start = self._poem_off + POEMA.size * poema_start
+        block = self._mm[start:start + POEMA.size * poema_count]
+        string = self._string
+        poemas = [
+            Poema(id=poema_id, titulo=string(titulo), categoria_path=string(categoria_path))
+            for poema_id, titulo, categoria_path in POEMA.iter_unpack(block)
+        ]
+        subcategorias = [
+            self._decode(self._child(child_start + i))
+            for i in range(child_count)
+        ]
+        return Categoria(
+            nome=self._string(nome),
+            path=self._string(path),
+            poemas=poemas,
+            subcategorias=subcategorias
+        )
+
+    def root_paths(self) -> List[str]:
+        """Paths das categorias de primeiro nível, sem decodificar subárvores"""
+        return [self._string(self._record(self._child(i))[1]) for i in range(self.n_raizes)]
+
+    def root(self, position: int) -> Categoria:
+        """Decodifica a categoria de primeiro nível na posição indicada"""
+        if not 0 <= position < self.n_raizes:
+            raise IndexError(position)
+        return self._decode(self._child(position))
+
+    def iter_roots(self) -> Iterator[Categoria]:
+        """Itera categorias de primeiro nível, decodificando uma por vez"""
+        for position in range(self.n_raizes):
+            yield self.root(position)
+
+    def get_categoria(self, path: str) -> Optional[Categoria]:
+        """Decodifica apenas a subárvore com o path indicado (O(log n))"""
+        idx = self._find(path)
+        return self._decode(idx) if idx is not None else None
+
+    def to_catalog(self) -> StructureCatalog:
+        """Decodifica o catálogo inteiro"""
+        return StructureCatalog(
+            total_categorias=self.total_categorias,
+            total_poemas=self.total_poemas,
+            categorias=list(self.iter_roots())
+        )
+
+
+class BinaryStructureRepository(IJsonRepository):
+    """Repositório de catálogo no formato binário mapeado em memória"""
+
+    async def save(self, data: StructureCatalog, filepath: Path) -> None:
+        """
+        Salva catálogo no formato binário.
+
+        Args:
+            data: Catálogo a ser salvo
+            filepath: Caminho do arquivo binário
+        """
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        filepath.write_bytes(encode_catalog(data))
+        logger.info(f"✓ Estrutura binária salva em {filepath}")
+
+    async def load(self, filepath: Path) -> Dict[str, Any]:
+        """Carrega estrutura como dicionário (compatibilidade com IJsonRepository)"""
+        catalog = await self.load_catalog(filepath)
+        return json.loads(catalog.model_dump_json())
+
+    async def load_bytes(self, filepath: Path) -> bytes:
+        """Carrega conteúdo bruto do arquivo binário"""
+        if not filepath.exists():
+            raise FileNotFoundError(f"Arquivo não encontrado: {filepath}")
+        return filepath.read_bytes()
+
+    async def load_catalog(self, filepath: Path, strict: bool = False) -> StructureCatalog:
+        """
+        Carrega o catálogo inteiro a partir do arquivo binário.
+
+        Args:
+            filepath: Caminho do arquivo binário
+            strict: Ignorado; o formato binário é tipado na escrita
+
+        Returns:
+            Catálogo carregado
+        """
+        with self.open(filepath) as reader:
+            catalog = reader.to_catalog()
+        logger.info(f"✓ Estrutura binária carregada de {filepath}")
+        return catalog
+
+    async def load_subtree(self, filepath: Path, path: str) -> Optional[Categoria]:
+        """
+        Decodifica apenas a subárvore com o path indicado.
+
+        Args:
+            filepath: Caminho do arquivo binário
+            path: Path da categoria
+
+        Returns:
+            Categoria com subárvore completa, ou None se não existir
+        """
+        with self.open(filepath) as reader:
+            return reader.get_categoria(path)
+
+    async def iter_categorias(self, filepath: Path) -> AsyncIterator[Categoria]:
+        """Itera categorias de primeiro nível, decodificando uma por vez"""
+        with self.open(filepath) as reader:
+            for categoria in reader.iter_roots():
+                yield categoria
+
+    def open(self, filepath: Path) -> BinaryCatalogReader:
+        """
+        Abre o catálogo para acesso lazy, em O(1).
+
+        Args:
+            filepath: Caminho do arquivo binário
+
+        Returns:
+            Leitor que decodifica subárvores sob demanda
+        """
+        if not filepath.exists():
+            raise FileNotFoundError(f"Arquivo não encontrado: {filepath}")
+        return BinaryCatalogReader(filepath)
@@ -3,9 +3,19 @@
 import logging
 from typing import Optional
 from playwright.async_api import async_playwright, Browser, Page
+from src.utils import metrics
+from src.utils import profiling
 
 logger = logging.getLogger(__name__)
 
+PAGE_BUCKETS = (1.0, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0)
+NAVIGATION_TIME = metrics.histogram(
+    "pessoa_browser_navigation_seconds", "Tempo de navegação até networkidle", buckets=PAGE_BUCKETS
+)
+EXPANSION_TIME = metrics.histogram(
+    "pessoa_browser_expansion_seconds", "Tempo de expansão das categorias via JavaScript", buckets=PAGE_BUCKETS
+)
+
 
 class PlaywrightBrowser:
     """Gerenciador de browser Playwright com lifecycle management"""
@@ -41,6 +51,21 @@ class PlaywrightBrowser:
             await self.playwright.stop()
         logger.info("✓ Playwright fechado")
 
+    @property
+    def is_alive(self) -> bool:
+        """Browser iniciado e ainda conectado (Chromium pode cair em processos longos)"""
+        return self.browser is not None and self.browser.is_connected() and not self.page.is_closed()
+
+    async def restart(self) -> None:
+        """Fecha o que restou do browser e inicia outro"""
+        logger.warning("♻️ Reiniciando browser...")
+        try:
+            await self.__aexit__(None, None, None)
+        except Exception as e:
+            logger.debug(f"Erro ao fechar browser anterior: {e}")
+        self.playwright = self.browser = self.page = None
+        await self.__aenter__()
+
     async def fetch_with_javascript(self) -> str:
         """
         Acessa página principal e executa JavaScript para expandir categorias.
@@ -51,15 +76,19 @@ class PlaywrightBrowser:
 
         try:
             logger.info("🌐 Navegando para página principal...")
-            await self.page.goto(self.BASE_URL, wait_until='networkidle')
+            with NAVIGATION_TIME.time(), profiling.span("browser.navegacao"):
+                await self.page.goto(self.BASE_URL, wait_until='networkidle')
 
             logger.info("⏳ Executando JavaScript para expandir categorias...")
-            await self._expand_all_categories()
+            with EXPANSION_TIME.time(), profiling.span("browser.expansao"):
+                await self._expand_all_categories()
 
             logger.info("⏰ Aguardando processamento final de AJAX...")
-            await self.page.wait_for_timeout(3000)
+            with profiling.span("browser.aguardar_ajax"):
+                await self.page.wait_for_timeout(3000)
 
-            html = await self.page.content()
+            with profiling.span("browser.conteudo"):
+                html = await self.page.content()
             logger.info("✓ Página carregada com conteúdo dinâmico")
             return html
 
@@ -0,0 +1,170 @@
+"""Infrastructure Compressed IO - Armazenamento Comprimido Transparente
+
+Arquivos são gravados com zstd ou gzip em streaming; na leitura o codec é
+detectado pelos magic bytes, então arquivos antigos sem compressão
+continuam legíveis pelo mesmo caminho.
+"""
+
+import gzip
+import io
+import logging
+from pathlib import Path
+from typing import BinaryIO, Optional
+
+try:
+    from compression import zstd as _zstd  # Python 3.14+
+except ImportError:
+    _zstd = None
+
+try:
+    import zstandard as _zstandard  # Alternativa opcional (pip install zstandard)
+except ImportError:
+    _zstandard = None
+
+logger = logging.getLogger(__name__)
+
+GZIP_MAGIC = b'\x1f\x8b'
+ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+
+DEFAULT_LEVELS = {'gzip': 6, 'zstd': 3}
+SUFFIXES = {'gzip': '.gz', 'zstd': '.zst'}
+
+
+def zstd_available() -> bool:
+    """True se há implementação de zstd disponível"""
+    return _zstd is not None or _zstandard is not None
+
+
+def resolve_codec(codec: Optional[str]) -> Optional[str]:
+    """
+    Normaliza o nome do codec.
+
+    Args:
+        codec: "zstd", "gzip", "auto" (zstd se disponível, senão gzip) ou None
+
+    Returns:
+        Codec efetivo, ou None para gravar sem compressão
+    """
+    if codec in (None, 'none'):
+        return None
+    if codec == 'auto':
+        return 'zstd' if zstd_available() else 'gzip'
+    if codec == 'zstd' and not zstd_available():
+        raise ImportError("zstd indisponível: use Python 3.14+ ou instale 'zstandard'")
+    if codec not in DEFAULT_LEVELS:
+        raise ValueError(f"Codec desconhecido: {codec} (opções: zstd, gzip, auto, none)")
+    return codec
+
+
+def detect_codec(filepath: Path) -> Optional[str]:
+    """Detecta o codec pelos magic bytes (None para arquivo sem compressão)"""
+    with filepath.open('rb') as f:
+        head = f.read(4)
+    if head.startswith(ZSTD_MAGIC):
+        return 'zstd'
+    if head.startswith(GZIP_MAGIC):
+        return 'gzip'
+    return None
+
+
+def open_read(filepath: Path) -> BinaryIO:
+    """
+    Abre arquivo para leitura descomprimindo em streaming, conforme os
+    magic bytes.
+
+    Args:
+        filepath: Caminho do arquivo
+
+    Returns:
+        Stream binário com o conteúdo original
+    """
+    codec = detect_codec(filepath)
+    if codec == 'gzip':
+        return gzip.open(filepath, 'rb')
+    if codec == 'zstd':
+        if _zstd is not None:
+            return _zstd.open(filepath, 'rb')
+        if _zstandard is not None:
+            return _zstandard.ZstdDecompressor().stream_reader(filepath.open('rb'), closefd=True)
+        raise ImportError(f"{filepath} usa zstd: use Python 3.14+ ou instale 'zstandard'")
+    return filepath.open('rb')
+
+
+def open_write(filepath: Path, codec: Optional[str], level: Optional[int] = None) -> BinaryIO:
+    """
+    Abre arquivo para escrita comprimindo em streaming.
+
+    Args:
+        filepath: Caminho do arquivo
+        codec: "zstd", "gzip", "auto" ou None (sem compressão)
+        level: Nível de compressão (default do codec se None)
+
+    Returns:
+        Stream binário de escrita
+    """
+    codec = resolve_codec(codec)
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+    if codec is None:
+        return filepath.open('wb')
+
+    level = DEFAULT_LEVELS[codec] if level is None else level
+    if codec == 'gzip':
+        return gzip.open(filepath, 'wb', compresslevel=level)
+    if _zstd is not None:
+        return _zstd.open(filepath, 'wb', level=level)
+    return _zstandard.ZstdCompressor(level=level).stream_writer(filepath.open('wb'), closefd=True)
+
+
+def read_bytes(filepath: Path) -> bytes:
+    """Lê o conteúdo descomprimido do arquivo"""
+    with open_read(filepath) as f:
+        return f.read()
+
+
+def write_bytes(
+    filepath: Path,
+    data: bytes,
+    codec: Optional[str],
+    level: Optional[int] = None,
+    chunk_size: int = 1 << 20
+) -> None:
+    """
+    Grava conteúdo comprimindo em blocos, sem cópia comprimida inteira
+    em memória.
+
+    Args:
+        filepath: Caminho do arquivo
+        data: Conteúdo original
+        codec: "zstd", "gzip", "auto" ou None
+        level: Nível de compressão (opcional)
+        chunk_size: Tamanho de cada bloco enviado ao compressor
+    """
+    view = memoryview(data)
+    with open_write(filepath, codec, level) as f:
+        for start in range(0, len(view), chunk_size):
+            f.write(view[start:start + chunk_size])
+
+
+def compress(data: bytes, codec: str, level: Optional[int] = None) -> bytes:
+    """Comprime em memória (benchmark e textos extraídos)"""
+    codec = resolve_codec(codec)
+    level = DEFAULT_LEVELS[codec] if level is None else level
+    if codec == 'gzip':
+        return gzip.compress(data, compresslevel=level)
+    if _zstd is not None:
+        return _zstd.compress(data, level=level)
+    buffer = io.BytesIO()
+    with _zstandard.ZstdCompressor(level=level).stream_writer(buffer, closefd=False) as f:
+        f.write(data)
+    return buffer.getvalue()
+
+
+def decompress(data: bytes) -> bytes:
+    """Descomprime em memória detectando o codec (benchmark e textos extraídos)"""
+    if data.startswith(GZIP_MAGIC):
+        return gzip.decompress(data)
+    if data.startswith(ZSTD_MAGIC):
+        if _zstd is not None:
+            return _zstd.decompress(data)
+        return _zstandard.ZstdDecompressor().stream_reader(io.BytesIO(data)).read()
+    return data
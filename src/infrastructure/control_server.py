@@ -0,0 +1,91 @@
+"""Infrastructure Control Server - Endpoint HTTP Local do Daemon
+
+Roda no mesmo event loop do daemon (asyncio.start_server), então os
+disparos chegam ao agendador sem sincronização entre threads:
+
+    GET  /status              estado, últimas execuções, próximos agendamentos
+    POST /trigger/<tarefa>    agenda a tarefa para agora (202)
+"""
+
+import asyncio
+import json
+import logging
+from http import HTTPStatus
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ControlServer:
+    """Servidor HTTP mínimo de status e disparo, só para uso local"""
+
+    def __init__(
+        self,
+        status: Callable[[], Dict[str, Any]],
+        trigger: Callable[[str], None],
+        port: int,
+        addr: str = "127.0.0.1"
+    ):
+        self.status = status
+        self.trigger = trigger
+        self.port = port
+        self.addr = addr
+        self._server: Optional[asyncio.Server] = None
+
+    async def __aenter__(self):
+        self._server = await asyncio.start_server(self._handle, self.addr, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        logger.info(f"🛰️ Controle em http://{self.addr}:{self.port}/status")
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+
+    def _route(self, method: str, path: str) -> tuple:
+        """Status HTTP e corpo JSON da resposta"""
+        if path in ('/', '/status'):
+            if method != 'GET':
+                return HTTPStatus.METHOD_NOT_ALLOWED, {'erro': 'use GET'}
+            return HTTPStatus.OK, self.status()
+
+        if path.startswith('/trigger/'):
+            if method != 'POST':
+                return HTTPStatus.METHOD_NOT_ALLOWED, {'erro': 'use POST'}
+            tarefa = path[len('/trigger/'):]
+            try:
+                self.trigger(tarefa)
+            except ValueError as e:
+                return HTTPStatus.NOT_FOUND, {'erro': str(e)}
+            return HTTPStatus.ACCEPTED, {'agendado': tarefa}
+
+        return HTTPStatus.NOT_FOUND, {'erro': f'rota desconhecida: {path}'}
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            request_line = await asyncio.wait_for(reader.readline(), timeout=5)
+            # Cabeçalhos e corpo são ignorados: nenhuma rota os usa
+            while await asyncio.wait_for(reader.readline(), timeout=5) not in (b'\r\n', b'\n', b''):
+                pass
+
+            parts = request_line.decode('latin-1').split()
+            if len(parts) < 2:
+                status, payload = HTTPStatus.BAD_REQUEST, {'erro': 'requisição inválida'}
+            else:
+                method, target = parts[0].upper(), parts[1]
+                status, payload = self._route(method, target.split('?')[0].rstrip('/') or '/')
+                logger.debug(f"{method} {target} -> {status.value}")
+
+            body = json.dumps(payload, ensure_ascii=False, default=str, indent=2).encode('utf-8')
+            writer.write(
+                f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+                f"Content-Type: application/json; charset=utf-8\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                f"Connection: close\r\n\r\n".encode('latin-1') + body
+            )
+            await writer.drain()
+        except (asyncio.TimeoutError, ConnectionError) as e:
+            logger.debug(f"Conexão de controle encerrada: {e}")
+        finally:
+            writer.close()
@@ -1,18 +1,39 @@
 """Infrastructure HTTP Client - Download com Retry"""
 
+import asyncio
 import logging
+import time
 import httpx
-from retry import retry
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
+from src.domain.models import RequestRecord
+from src.infrastructure.ledger import RequestLedger
+from src.infrastructure.rate_limiter import AsyncRateLimiter
+from src.utils import metrics
 
 logger = logging.getLogger(__name__)
 
+HTTP_LATENCY = metrics.histogram(
+    "pessoa_http_request_duration_seconds", "Latência das requisições HTTP", ["status"]
+)
+HTTP_BYTES = metrics.counter("pessoa_http_response_bytes", "Bytes recebidos")
+HTTP_RETRIES = metrics.counter("pessoa_http_retries", "Retentativas de download")
+
 
 class HttpDownloader:
-    """Cliente HTTP para download de PDFs com retry automático"""
+    """
+    Cliente HTTP para download de PDFs e páginas com retry automático.
+
+    base_url permite apontar para um servidor local de teste
+    (benchmarks/stub_site.py); com rate_limiter, toda tentativa, inclusive
+    retentativas, passa pelo mesmo token bucket, qualquer que seja o
+    número de tasks usando o cliente.
+    """
 
-    PDF_URL_TEMPLATE = "http://arquivopessoa.net/typographia/textos/arquivopessoa-{}.pdf"
+    BASE_URL = "http://arquivopessoa.net"
+    PDF_PATH_TEMPLATE = "/typographia/textos/arquivopessoa-{}.pdf"
+    PAGE_PATH_TEMPLATE = "/textos/{}"
+    PAGE_HEADERS = {"Accept": "text/html,application/xhtml+xml"}
     DEFAULT_HEADERS = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
         "Accept": "application/pdf",
@@ -21,16 +42,39 @@ class HttpDownloader:
         "Connection": "keep-alive",
     }
 
-    def __init__(self, timeout: float = 30.0):
+    RETRY_TRIES = 3
+    RETRY_DELAY = 2.0
+    RETRY_BACKOFF = 2.0
+
+    def __init__(
+        self,
+        timeout: float = 30.0,
+        ledger: Optional[RequestLedger] = None,
+        base_url: str = BASE_URL,
+        rate_limiter: Optional[AsyncRateLimiter] = None
+    ):
         self.timeout = timeout
+        self.ledger = ledger
+        self.base_url = base_url.rstrip('/')
+        self.rate_limiter = rate_limiter
         self.client: Optional[httpx.AsyncClient] = None
 
+    def pdf_url(self, poema_id: int) -> str:
+        """URL do PDF do poema"""
+        return self.base_url + self.PDF_PATH_TEMPLATE.format(poema_id)
+
+    def page_url(self, poema_id: int) -> str:
+        """URL da página do poema (/textos/{id})"""
+        return self.base_url + self.PAGE_PATH_TEMPLATE.format(poema_id)
+
     async def __aenter__(self):
         """Context manager entry"""
         self.client = httpx.AsyncClient(
             timeout=self.timeout,
             headers=self.DEFAULT_HEADERS
         )
+        if self.ledger:
+            self.ledger.open()
         logger.info("✓ HTTP Client inicializado")
         return self
 
@@ -38,9 +82,10 @@ class HttpDownloader:
         """Context manager exit"""
         if self.client:
             await self.client.aclose()
+        if self.ledger:
+            self.ledger.close()
         logger.info("✓ HTTP Client fechado")
 
-    @retry(tries=3, delay=2, backoff=2, logger=logger, exceptions=(httpx.HTTPError, httpx.ReadTimeout, Exception))
     async def download(self, poema_id: int) -> bytes:
         """
         Faz download de um PDF com retry automático.
@@ -54,33 +99,223 @@ class HttpDownloader:
         Raises:
             httpx.HTTPError: Se falhar após 3 tentativas
         """
+        content, _ = await self.download_with_validators(poema_id)
+        return content
+
+    async def download_with_validators(
+        self,
+        poema_id: int,
+        categoria_path: str = ""
+    ) -> Tuple[bytes, Dict[str, str]]:
+        """
+        Faz download de um PDF junto com os validadores HTTP da resposta.
+        Tenta RETRY_TRIES vezes, com espera exponencial entre tentativas.
+
+        Args:
+            poema_id: ID do poema
+            categoria_path: Categoria do poema, registrada no ledger
+
+        Returns:
+            Conteúdo do PDF e validadores ('etag', 'last_modified') presentes
+        """
+        _, content, validators = await self._get_with_retry(poema_id, self.pdf_url(poema_id), categoria_path)
+        return content, validators
+
+    async def fetch_page(
+        self,
+        poema_id: int,
+        validators: Optional[Dict[str, str]] = None
+    ) -> Tuple[int, str, Dict[str, str]]:
+        """
+        Busca a página /textos/{id} do poema, condicionalmente.
+
+        Args:
+            poema_id: ID do poema
+            validators: 'etag'/'last_modified' da última busca; o servidor
+                responde 304 sem corpo se a página não mudou
+
+        Returns:
+            Status (200 ou 304), HTML e validadores da resposta
+        """
+        headers = dict(self.PAGE_HEADERS)
+        if validators:
+            if validators.get('etag'):
+                headers['If-None-Match'] = validators['etag']
+            if validators.get('last_modified'):
+                headers['If-Modified-Since'] = validators['last_modified']
+        status, content, novos = await self._get_with_retry(
+            poema_id, self.page_url(poema_id), headers=headers, recurso="pagina"
+        )
+        return status, content.decode('utf-8', errors='replace'), novos
+
+    async def head(self, poema_id: int) -> Tuple[int, Dict[str, str]]:
+        """
+        HEAD no PDF do poema: existência e identidade sem baixar o corpo.
+
+        Args:
+            poema_id: ID do poema
+
+        Returns:
+            Status (200 ou 404, sem exceção) e validadores da resposta,
+            com 'size' (Content-Length) quando informado
+        """
+        status, _, validators = await self._get_with_retry(
+            poema_id, self.pdf_url(poema_id), recurso="head", method="HEAD", accept=(304, 404)
+        )
+        return status, validators
+
+    async def _get_with_retry(
+        self,
+        poema_id: int,
+        url: str,
+        categoria_path: str = "",
+        headers: Optional[Dict[str, str]] = None,
+        recurso: str = "pdf",
+        method: str = "GET",
+        accept: Tuple[int, ...] = (304,)
+    ) -> Tuple[int, bytes, Dict[str, str]]:
+        """Tenta RETRY_TRIES vezes, com espera exponencial entre tentativas"""
+        # O decorator do pacote retry é síncrono: numa corrotina ele só
+        # envolve a criação do objeto e nunca vê a exceção. Laço explícito,
+        # que também conta as retentativas
+        delay = self.RETRY_DELAY
+        for tentativa in range(1, self.RETRY_TRIES + 1):
+            try:
+                return await self._fetch(
+                    poema_id, tentativa, categoria_path, url, headers, recurso, method, accept
+                )
+            except RuntimeError:
+                raise
+            except Exception as e:
+                if tentativa == self.RETRY_TRIES or self._is_permanent(e):
+                    raise
+                HTTP_RETRIES.inc()
+                logger.warning(f"{e}, nova tentativa em {delay}s...")
+                await asyncio.sleep(delay)
+                delay *= self.RETRY_BACKOFF
+
+    async def _fetch(
+        self,
+        poema_id: int,
+        attempt: int = 1,
+        categoria_path: str = "",
+        url: Optional[str] = None,
+        headers: Optional[Dict[str, str]] = None,
+        recurso: str = "pdf",
+        method: str = "GET",
+        accept: Tuple[int, ...] = (304,)
+    ) -> Tuple[int, bytes, Dict[str, str]]:
+        """Uma tentativa, instrumentada (métricas e ledger); status em accept voltam sem exceção"""
         if not self.client:
             raise RuntimeError("HttpDownloader não foi inicializado. Use com context manager.")
 
-        url = self.PDF_URL_TEMPLATE.format(poema_id)
-        
+        url = url or self.pdf_url(poema_id)
+        if self.rate_limiter:
+            await self.rate_limiter.acquire()
+        inicio = time.perf_counter()
+        eventos: Dict[str, float] = {}
+        status = 0
+        nbytes = 0
+        erro: Optional[str] = None
+
+        async def trace(event_name: str, info: dict) -> None:
+            # Eventos do httpcore: connection.connect_tcp.started, ...
+            eventos[event_name] = time.perf_counter()
+
         try:
             logger.debug(f"Downloading: {url}")
-            response = await self.client.get(url)
-            response.raise_for_status()
-            logger.debug(f"✓ Download concluído: {len(response.content)} bytes")
-            return response.content
+            response = await self.client.request(
+                method, url, headers=headers, extensions={"trace": trace} if self.ledger else None
+            )
+            status = response.status_code
+            nbytes = len(response.content)
+            if status not in accept:
+                response.raise_for_status()
+            latency_ms = (time.perf_counter() - inicio) * 1000
+            logger.debug(
+                f"✓ Download concluído: {nbytes} bytes",
+                extra={'poem_id': poema_id, 'bytes': nbytes, 'latency_ms': round(latency_ms, 1)}
+            )
+            HTTP_BYTES.inc(nbytes)
+            validators = {
+                key: response.headers[header]
+                for key, header in (('etag', 'ETag'), ('last_modified', 'Last-Modified'))
+                if header in response.headers
+            }
+            if method == "HEAD" and 'Content-Length' in response.headers:
+                validators['size'] = response.headers['Content-Length']
+            return status, response.content, validators
         except httpx.HTTPStatusError as e:
-            logger.warning(f"HTTP {e.response.status_code} para poema {poema_id}")
+            erro = type(e).__name__
+            logger.warning(
+                f"HTTP {e.response.status_code} para poema {poema_id}",
+                extra={'poem_id': poema_id, 'status': e.response.status_code}
+            )
             raise
         except Exception as e:
-            logger.error(f"Erro ao baixar poema {poema_id}: {e}")
+            erro = type(e).__name__
+            logger.error(
+                f"Erro ao baixar poema {poema_id}: {e}",
+                extra={'poem_id': poema_id, 'error': erro}
+            )
             raise
+        finally:
+            fim = time.perf_counter()
+            HTTP_LATENCY.labels(status=status or "erro").observe(fim - inicio)
+            if self.ledger:
+                self.ledger.record(RequestRecord(
+                    ts=time.time(),
+                    poema_id=poema_id,
+                    categoria_path=categoria_path,
+                    recurso=recurso,
+                    attempt=attempt,
+                    status=status,
+                    bytes=nbytes,
+                    connect_ms=self._elapsed_ms(eventos, "connection.connect_tcp"),
+                    tls_ms=self._elapsed_ms(eventos, "connection.start_tls"),
+                    ttfb_ms=self._ttfb_ms(eventos, inicio),
+                    total_ms=(fim - inicio) * 1000,
+                    error=erro
+                ))
 
-    async def download_and_save(self, poema_id: int, save_path: Path) -> None:
+    @staticmethod
+    def _is_permanent(error: Exception) -> bool:
+        """4xx não muda com nova tentativa (ex.: página inexistente), exceto timeout e limite de taxa"""
+        if not isinstance(error, httpx.HTTPStatusError):
+            return False
+        codigo = error.response.status_code
+        return 400 <= codigo < 500 and codigo not in (408, 429)
+
+    @staticmethod
+    def _elapsed_ms(eventos: Dict[str, float], etapa: str) -> float:
+        """Duração de uma etapa do trace (0 se não ocorreu, ex.: conexão reaproveitada)"""
+        started = eventos.get(f"{etapa}.started")
+        complete = eventos.get(f"{etapa}.complete")
+        if started is None or complete is None:
+            return 0.0
+        return (complete - started) * 1000
+
+    @staticmethod
+    def _ttfb_ms(eventos: Dict[str, float], inicio: float) -> float:
+        """Do início da requisição até os cabeçalhos da resposta"""
+        for name in ("http11.receive_response_headers.complete", "http2.receive_response_headers.complete"):
+            if name in eventos:
+                return (eventos[name] - inicio) * 1000
+        return 0.0
+
+    async def download_and_save(self, poema_id: int, save_path: Path) -> int:
         """
         Faz download de um PDF e salva em arquivo.
         
         Args:
             poema_id: ID do poema
             save_path: Caminho onde salvar o PDF
+            
+        Returns:
+            Número de bytes gravados
         """
         save_path.parent.mkdir(parents=True, exist_ok=True)
         content = await self.download(poema_id)
         save_path.write_bytes(content)
         logger.info(f"✓ Salvo: {save_path.name}")
+        return len(content)
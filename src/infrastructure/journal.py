@@ -0,0 +1,152 @@
+"""Infrastructure Journal - Journal Append-Only de Descoberta do Catálogo"""
+
+import json
+import logging
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+from src.domain.models import Categoria, Poema
+
+logger = logging.getLogger(__name__)
+
+
+class CatalogJournal:
+    """
+    Journal JSONL de eventos de descoberta, gravado durante o parsing.
+
+    Eventos (um por linha):
+        {"t": "c", "nome": ..., "path": ..., "parent": ...}   categoria
+        {"t": "p", "id": ..., "titulo": ..., "path": ...}     poema
+        {"t": "s", "path": ...}                               snapshot do HTML expandido
+        {"t": "fim"}                                          scrape completo
+
+    As linhas são acumuladas e gravadas em lotes, amortizando o custo de
+    I/O; o que já foi descarregado sobrevive a uma queda do processo.
+    O replay é idempotente: um novo parsing do mesmo HTML pode ser
+    acrescentado a um journal parcial sem duplicar descobertas.
+    """
+
+    def __init__(self, filepath: Path, batch_size: int = 500):
+        self.filepath = filepath
+        self.batch_size = batch_size
+        self._pending: List[str] = []
+        self._file = None
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def open(self) -> None:
+        """Abre o journal em modo append"""
+        self.filepath.parent.mkdir(parents=True, exist_ok=True)
+        self._file = self.filepath.open('a', encoding='utf-8', buffering=1 << 20)
+
+    def close(self) -> None:
+        """Descarrega eventos pendentes e fecha o arquivo"""
+        if self._file:
+            self.flush()
+            self._file.close()
+            self._file = None
+
+    def _append(self, event: dict) -> None:
+        self._pending.append(json.dumps(event, ensure_ascii=False))
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Grava o lote pendente no disco"""
+        if not self._pending or not self._file:
+            return
+        self._file.write('\n'.join(self._pending) + '\n')
+        self._file.flush()
+        self._pending.clear()
+
+    def record_categoria(self, categoria: Categoria, parent_path: str = "") -> None:
+        """Registra descoberta de categoria (antes de seus poemas/subcategorias)"""
+        self._append({'t': 'c', 'nome': categoria.nome, 'path': categoria.path, 'parent': parent_path})
+
+    def record_poema(self, poema: Poema) -> None:
+        """Registra descoberta de poema"""
+        self._append({'t': 'p', 'id': poema.id, 'titulo': poema.titulo, 'path': poema.categoria_path})
+
+    def record_snapshot(self, snapshot_path: Path) -> None:
+        """Registra o snapshot do HTML expandido, de onde o parsing pode ser refeito sem o browser"""
+        self._append({'t': 's', 'path': str(snapshot_path)})
+        self.flush()
+
+    def complete(self) -> None:
+        """Marca o scrape como completo"""
+        self._append({'t': 'fim'})
+        self.flush()
+
+    @staticmethod
+    def replay(filepath: Path) -> Tuple[List[Categoria], bool]:
+        """
+        Reconstrói a árvore a partir do journal (compactação).
+        Uma última linha truncada por queda é ignorada.
+
+        Args:
+            filepath: Caminho do journal
+
+        Returns:
+            Categorias de primeiro nível e se o scrape foi completo
+        """
+        raizes: List[Categoria] = []
+        by_path: Dict[str, Categoria] = {}
+        poemas_vistos: Set[Tuple[str, int]] = set()
+        completo = False
+
+        with filepath.open('r', encoding='utf-8') as f:
+            for line_number, line in enumerate(f, 1):
+                try:
+                    event = json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning(f"Linha {line_number} do journal ignorada (truncada)")
+                    continue
+
+                kind = event['t']
+                if kind == 'c':
+                    if event['path'] in by_path:
+                        continue
+                    categoria = Categoria(nome=event['nome'], path=event['path'])
+                    by_path[categoria.path] = categoria
+                    parent: Optional[Categoria] = by_path.get(event['parent'])
+                    if parent is None:
+                        raizes.append(categoria)
+                    else:
+                        parent.add_subcategoria(categoria)
+                elif kind == 'p':
+                    categoria = by_path.get(event['path'])
+                    chave = (event['path'], event['id'])
+                    if categoria is not None and chave not in poemas_vistos:
+                        poemas_vistos.add(chave)
+                        categoria.add_poema(Poema(id=event['id'], titulo=event['titulo'], categoria_path=event['path']))
+                elif kind == 'fim':
+                    completo = True
+
+        return raizes, completo
+
+    @staticmethod
+    def snapshot_of(filepath: Path) -> Optional[Path]:
+        """
+        Snapshot registrado no journal, se o arquivo ainda existe.
+
+        Args:
+            filepath: Caminho do journal
+
+        Returns:
+            Último snapshot registrado, ou None
+        """
+        snapshot: Optional[Path] = None
+        with filepath.open('r', encoding='utf-8') as f:
+            for line in f:
+                # Evento raro: evita decodificar as linhas de poemas
+                if not line.startswith('{"t": "s"'):
+                    continue
+                try:
+                    snapshot = Path(json.loads(line)['path'])
+                except (json.JSONDecodeError, KeyError):
+                    continue
+        return snapshot if snapshot is not None and snapshot.exists() else None
@@ -0,0 +1,116 @@
+"""Infrastructure JSON Stream - Leitura Incremental de Arrays JSON"""
+
+import io
+import json
+from typing import Any, BinaryIO, Iterator
+
+_WHITESPACE = ' \t\n\r'
+
+
+class _Reader:
+    """Buffer de texto sobre um stream binário, com leitura sob demanda"""
+
+    def __init__(self, stream: BinaryIO, chunk_size: int):
+        self._text = io.TextIOWrapper(stream, encoding='utf-8')
+        self._chunk_size = chunk_size
+        self.buffer = ''
+        self.pos = 0
+        self.eof = False
+
+    def fill(self, size: int) -> bool:
+        """Descarta o trecho consumido e lê mais texto; False no fim do arquivo"""
+        if self.eof:
+            return False
+        self.buffer = self.buffer[self.pos:]
+        self.pos = 0
+        chunk = self._text.read(max(size, self._chunk_size))
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer += chunk
+        return True
+
+    def peek(self) -> str:
+        """Próximo caractere não branco (sem consumir); '' no fim"""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.fill(0):
+                return ''
+
+    def expect(self, char: str) -> None:
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"JSON inválido: esperado '{char}', encontrado '{found or 'EOF'}'")
+        self.pos += 1
+
+    def value(self, decoder: json.JSONDecoder) -> Any:
+        """
+        Decodifica o próximo valor JSON completo. Se o buffer terminar no
+        meio do valor, lê mais (dobrando o pedido) e tenta de novo.
+        """
+        self.peek()
+        size = self._chunk_size
+        while True:
+            try:
+                value, end = decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if not self.fill(size):
+                    raise
+                size *= 2
+                continue
+            # Número no fim do buffer pode estar truncado
+            if end == len(self.buffer) and not self.eof and self.fill(size):
+                continue
+            self.pos = end
+            return value
+
+
+def iter_array_items(
+    stream: BinaryIO,
+    key: str = 'categorias',
+    chunk_size: int = 1 << 20
+) -> Iterator[Any]:
+    """
+    Itera os elementos do array associado a key no objeto raiz, sem
+    decodificar o documento inteiro.
+
+    Cada elemento é decodificado pelo scanner C do módulo json; apenas o
+    elemento corrente e um chunk de leitura ficam em memória.
+
+    Args:
+        stream: Arquivo binário posicionado no início do documento
+        key: Chave do array no objeto raiz
+        chunk_size: Tamanho (em caracteres) de cada leitura
+
+    Yields:
+        Cada elemento do array, já decodificado
+    """
+    decoder = json.JSONDecoder()
+    reader = _Reader(stream, chunk_size)
+
+    reader.expect('{')
+    if reader.peek() == '}':
+        return
+
+    while True:
+        name = reader.value(decoder)
+        reader.expect(':')
+
+        if name == key:
+            reader.expect('[')
+            if reader.peek() == ']':
+                return
+            while True:
+                yield reader.value(decoder)
+                if reader.peek() == ']':
+                    return
+                reader.expect(',')
+        else:
+            reader.value(decoder)  # Ignora outras chaves (ex.: totais)
+
+        if reader.peek() == '}':
+            return
+        reader.expect(',')
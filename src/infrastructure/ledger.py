@@ -0,0 +1,115 @@
+"""Infrastructure Ledger - Registro Append-Only de Tentativas HTTP"""
+
+import json
+import logging
+import time
+from pathlib import Path
+from typing import Iterator, List, Optional
+from src.domain.models import RequestRecord
+
+logger = logging.getLogger(__name__)
+
+
+class RequestLedger:
+    """
+    Ledger JSONL de tentativas de download, compartilhado entre execuções.
+
+    Uma linha por tentativa, com chaves curtas:
+        {"run": ..., "ts": ..., "id": ..., "cat": ..., "rec": "pdf", "try": 1,
+         "st": 200, "b": 48213, "conn": 35.1, "tls": 0.0, "ttfb": 212.4,
+         "tot": 260.8, "err": null}
+
+    Tempos em milissegundos. "conn" inclui a resolução DNS (o httpcore não
+    expõe as duas etapas separadas) e é 0 quando a conexão é reaproveitada.
+    Linhas são gravadas em lotes, como no journal de descoberta.
+    """
+
+    DEFAULT_PATH = Path("output/download_ledger.jsonl")
+
+    def __init__(self, filepath: Path, run_id: Optional[str] = None, batch_size: int = 50):
+        self.filepath = filepath
+        self.run_id = run_id or time.strftime('%Y%m%d-%H%M%S')
+        self.batch_size = batch_size
+        self._pending: List[str] = []
+        self._file = None
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def open(self) -> None:
+        """Abre o ledger em modo append"""
+        self.filepath.parent.mkdir(parents=True, exist_ok=True)
+        self._file = self.filepath.open('a', encoding='utf-8')
+
+    def close(self) -> None:
+        """Descarrega tentativas pendentes e fecha o arquivo"""
+        if self._file:
+            self.flush()
+            self._file.close()
+            self._file = None
+
+    def flush(self) -> None:
+        """Grava o lote pendente no disco"""
+        if not self._pending or not self._file:
+            return
+        self._file.write('\n'.join(self._pending) + '\n')
+        self._file.flush()
+        self._pending.clear()
+
+    def record(self, record: RequestRecord) -> None:
+        """Registra uma tentativa"""
+        self._pending.append(json.dumps({
+            'run': self.run_id,
+            'ts': round(record.ts, 3),
+            'id': record.poema_id,
+            'cat': record.categoria_path,
+            'rec': record.recurso,
+            'try': record.attempt,
+            'st': record.status,
+            'b': record.bytes,
+            'conn': round(record.connect_ms, 1),
+            'tls': round(record.tls_ms, 1),
+            'ttfb': round(record.ttfb_ms, 1),
+            'tot': round(record.total_ms, 1),
+            'err': record.error,
+        }, ensure_ascii=False))
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    @staticmethod
+    def read(filepath: Path) -> Iterator[RequestRecord]:
+        """
+        Lê as tentativas registradas. Linhas truncadas são ignoradas.
+
+        Args:
+            filepath: Caminho do ledger
+
+        Yields:
+            Cada tentativa, na ordem de gravação
+        """
+        with filepath.open('r', encoding='utf-8') as f:
+            for line_number, line in enumerate(f, 1):
+                try:
+                    row = json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning(f"Linha {line_number} do ledger ignorada (truncada)")
+                    continue
+                yield RequestRecord(
+                    run_id=row['run'],
+                    ts=row['ts'],
+                    poema_id=row['id'],
+                    categoria_path=row['cat'],
+                    recurso=row.get('rec', 'pdf'),  # ledgers antigos só tinham PDFs
+                    attempt=row['try'],
+                    status=row['st'],
+                    bytes=row['b'],
+                    connect_ms=row['conn'],
+                    tls_ms=row['tls'],
+                    ttfb_ms=row['ttfb'],
+                    total_ms=row['tot'],
+                    error=row['err']
+                )
@@ -0,0 +1,247 @@
+"""Infrastructure Manifest - Manifesto SQLite de PDFs Baixados"""
+
+import hashlib
+import logging
+import os
+import re
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+from src.domain.models import ManifestEntry
+from src.domain.repositories import IManifestRepository
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS arquivos (
+    poema_id INTEGER NOT NULL,
+    path TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    sha256 TEXT NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    saved_at REAL NOT NULL,
+    PRIMARY KEY (poema_id, path)
+);
+CREATE TABLE IF NOT EXISTS meta (
+    chave TEXT PRIMARY KEY,
+    valor TEXT NOT NULL
+);
+"""
+
+COLUMNS = ('poema_id', 'path', 'size', 'mtime_ns', 'sha256', 'etag', 'last_modified', 'saved_at')
+
+# "0042 - Título.pdf" -> 42
+_PDF_NAME = re.compile(r'^(\d+) - .+\.pdf$')
+
+
+def sha256_file(filepath: Path) -> str:
+    """Hash SHA-256 do arquivo, lido em blocos"""
+    with filepath.open('rb') as f:
+        return hashlib.file_digest(f, 'sha256').hexdigest()
+
+
+def looks_complete_pdf(filepath: Path) -> bool:
+    """
+    Verificação barata de PDF íntegro: cabeçalho %PDF- e marcador %%EOF
+    no final. Detecta downloads truncados sem parsear o documento.
+    """
+    try:
+        with filepath.open('rb') as f:
+            if f.read(5) != b'%PDF-':
+                return False
+            f.seek(0, os.SEEK_END)
+            f.seek(max(0, f.tell() - 1024))
+            return b'%%EOF' in f.read()
+    except OSError:
+        return False
+
+
+def build_entry(
+    filepath: Path,
+    relative_path: str,
+    poema_id: int,
+    sha256: str,
+    validators: Optional[Dict[str, str]] = None
+) -> ManifestEntry:
+    """Monta entrada a partir do arquivo já gravado no disco"""
+    stat = filepath.stat()
+    validators = validators or {}
+    return ManifestEntry(
+        poema_id=poema_id,
+        path=relative_path,
+        size=stat.st_size,
+        mtime_ns=stat.st_mtime_ns,
+        sha256=sha256,
+        etag=validators.get('etag'),
+        last_modified=validators.get('last_modified'),
+        saved_at=time.time()
+    )
+
+
+class SqliteManifestRepository(IManifestRepository):
+    """
+    Manifesto de downloads em SQLite (WAL), chaveado por (poema_id, path).
+
+    Cada registro é uma transação própria: uma queda no meio do download
+    nunca deixa entrada para arquivo parcial.
+    """
+
+    def __init__(self, filepath: Path):
+        self.filepath = filepath
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(filepath)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self) -> None:
+        """Fecha a conexão"""
+        self._conn.close()
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM arquivos").fetchone()[0]
+
+    @staticmethod
+    def _entry(row: tuple) -> ManifestEntry:
+        return ManifestEntry(**dict(zip(COLUMNS, row)))
+
+    def record(self, entry: ManifestEntry) -> None:
+        """Registra (ou substitui) a entrada de um arquivo, atomicamente"""
+        with self._conn:
+            self._conn.execute(
+                f"INSERT OR REPLACE INTO arquivos ({', '.join(COLUMNS)}) VALUES ({', '.join('?' * len(COLUMNS))})",
+                tuple(getattr(entry, column) for column in COLUMNS)
+            )
+
+    def get(self, poema_id: int) -> List[ManifestEntry]:
+        """Entradas do poema (um poema pode estar em várias categorias)"""
+        rows = self._conn.execute(
+            f"SELECT {', '.join(COLUMNS)} FROM arquivos WHERE poema_id = ?", (poema_id,)
+        )
+        return [self._entry(row) for row in rows]
+
+    def remove(self, poema_id: int, path: str) -> None:
+        """Remove a entrada de um arquivo"""
+        with self._conn:
+            self._conn.execute("DELETE FROM arquivos WHERE poema_id = ? AND path = ?", (poema_id, path))
+
+    def _get_meta(self, chave: str) -> Optional[str]:
+        row = self._conn.execute("SELECT valor FROM meta WHERE chave = ?", (chave,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, chave: str, valor: str) -> None:
+        with self._conn:
+            self._conn.execute("INSERT OR REPLACE INTO meta (chave, valor) VALUES (?, ?)", (chave, valor))
+
+    def keys(self) -> Set[Tuple[int, str]]:
+        """Pares (poema_id, path) registrados"""
+        return set(self._conn.execute("SELECT poema_id, path FROM arquivos"))
+
+    def entries(self) -> Iterator[ManifestEntry]:
+        """Itera todas as entradas"""
+        for row in self._conn.execute(f"SELECT {', '.join(COLUMNS)} FROM arquivos"):
+            yield self._entry(row)
+
+    def reconcile(
+        self,
+        base_path: Path,
+        adopt: Optional[bool] = None,
+        max_workers: int = 8,
+        full: bool = False
+    ) -> Dict[str, int]:
+        """
+        Sincroniza o manifesto com o disco.
+
+        Arquivos com tamanho e mtime iguais aos registrados são aceitos só
+        com um stat; os demais são re-hasheados. Conteúdo diferente do
+        registrado (truncado/substituído) ou arquivo ausente remove a
+        entrada, e o poema volta a ser faltante. Com adopt, PDFs íntegros
+        sem entrada (baixados antes do manifesto) são incorporados; isso
+        percorre todo o diretório, então por padrão acontece só na
+        primeira reconciliação do manifesto (depois, só as entradas
+        registradas recebem stat). Com full, todos os arquivos são
+        re-hasheados (detecta corrupção que preserva tamanho e mtime).
+
+        Args:
+            base_path: Diretório base dos PDFs
+            adopt: Incorporar PDFs existentes sem entrada (None: só se
+                o manifesto nunca fez adoção)
+            max_workers: Threads para hashing
+            full: Re-hashear mesmo arquivos com stat inalterado
+
+        Returns:
+            Contadores: verificados, rehash, removidos, adotados
+        """
+        stats = {'verificados': 0, 'rehash': 0, 'removidos': 0, 'adotados': 0}
+        suspeitos: List[ManifestEntry] = []
+
+        for entry in list(self.entries()):
+            stats['verificados'] += 1
+            try:
+                stat = (base_path / entry.path).stat()
+            except FileNotFoundError:
+                self.remove(entry.poema_id, entry.path)
+                stats['removidos'] += 1
+                continue
+            if full or stat.st_size != entry.size or stat.st_mtime_ns != entry.mtime_ns:
+                suspeitos.append(entry)
+
+        if adopt is None:
+            adopt = self._get_meta('adocao') is None
+
+        novos: List[Tuple[int, str]] = []
+        if adopt:
+            conhecidos = self.keys()
+            for root, _, files in os.walk(base_path):
+                for name in files:
+                    match = _PDF_NAME.match(name)
+                    if not match:
+                        continue
+                    relative = Path(root, name).relative_to(base_path).as_posix()
+                    key = (int(match.group(1)), relative)
+                    if key not in conhecidos:
+                        novos.append(key)
+
+        def hash_if_valid(relative: str) -> Optional[str]:
+            filepath = base_path / relative
+            return sha256_file(filepath) if looks_complete_pdf(filepath) else None
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            hashes = executor.map(hash_if_valid, [entry.path for entry in suspeitos])
+            for entry, digest in zip(suspeitos, hashes):
+                stats['rehash'] += 1
+                if digest == entry.sha256:
+                    # Só o mtime mudou (ex.: cópia): conteúdo confere
+                    self.record(build_entry(
+                        base_path / entry.path, entry.path, entry.poema_id, digest,
+                        {'etag': entry.etag, 'last_modified': entry.last_modified}
+                    ))
+                else:
+                    self.remove(entry.poema_id, entry.path)
+                    stats['removidos'] += 1
+
+            hashes = executor.map(hash_if_valid, [relative for _, relative in novos])
+            for (poema_id, relative), digest in zip(novos, hashes):
+                if digest is not None:
+                    self.record(build_entry(base_path / relative, relative, poema_id, digest))
+                    stats['adotados'] += 1
+
+        if adopt:
+            self._set_meta('adocao', str(time.time()))
+
+        logger.info(
+            f"✓ Manifesto reconciliado: {stats['verificados']} verificados, "
+            f"{stats['rehash']} re-hasheados, {stats['removidos']} removidos, "
+            f"{stats['adotados']} adotados"
+        )
+        return stats
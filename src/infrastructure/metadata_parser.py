@@ -0,0 +1,108 @@
+"""Infrastructure Metadata Parser - Metadados da Página /textos/{id}
+
+Parser em streaming sobre html.parser da biblioteca padrão: não monta
+árvore como o BeautifulSoup, só acumula o texto dos elementos cujas
+classes CSS estão em CAMPOS. Uma página é processada em uma única
+passada, sem dependência extra.
+"""
+
+import logging
+from html.parser import HTMLParser
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# classe CSS na página do texto -> campo de PoemaMetadata
+CAMPOS = {
+    'titulo-texto': 'titulo',
+    'autor': 'heteronimo',
+    'data': 'data',
+    'fonte': 'fonte',
+    'nota': 'notas',
+    'nota-editorial': 'notas',
+}
+
+# Campos com várias ocorrências; os demais guardam a primeira
+MULTIPLOS = {'notas'}
+
+_VOID = {'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta', 'source', 'track', 'wbr'}
+_BLOCK = {'br', 'p', 'div', 'li', 'tr'}
+
+
+class _MetadataHTMLParser(HTMLParser):
+    """Acumula o texto dos elementos marcados por CAMPOS (aninhamento incluso)"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        # (tag, campo aberto por ela ou None)
+        self._stack: List[tuple] = []
+        self._abertos: List[List[str]] = []
+        self._em_title = False
+        self.title: List[str] = []
+        self.valores: Dict[str, List[str]] = {}
+
+    def handle_starttag(self, tag: str, attrs) -> None:
+        if tag == 'title':
+            self._em_title = True
+        if self._abertos and tag in _BLOCK:
+            self._abertos[-1].append('\n')
+        if tag in _VOID:
+            return
+
+        campo = None
+        for name, value in attrs:
+            if name == 'class' and value:
+                campo = next((CAMPOS[c] for c in value.split() if c in CAMPOS), None)
+                break
+        self._stack.append((tag, campo))
+        if campo:
+            self._abertos.append([])
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag == 'title':
+            self._em_title = False
+        if tag in _VOID:
+            return
+        # HTML real fecha tags fora de ordem: desempilha até a correspondente
+        if not any(aberta == tag for aberta, _ in self._stack):
+            return
+        while self._stack:
+            aberta, campo = self._stack.pop()
+            if campo:
+                texto = ' '.join(''.join(self._abertos.pop()).split())
+                if texto:
+                    self.valores.setdefault(campo, []).append(texto)
+            if aberta == tag:
+                break
+
+    def handle_data(self, data: str) -> None:
+        if self._em_title:
+            self.title.append(data)
+        if self._abertos:
+            self._abertos[-1].append(data)
+
+
+def parse_metadata(html: str) -> Dict[str, object]:
+    """
+    Extrai os metadados de uma página de texto.
+
+    Args:
+        html: HTML da página /textos/{id}
+
+    Returns:
+        Campos encontrados (titulo, heteronimo, data, fonte, notas);
+        título cai para o <title> da página se não houver elemento próprio
+    """
+    parser = _MetadataHTMLParser()
+    parser.feed(html)
+    parser.close()
+
+    campos: Dict[str, object] = {}
+    for campo, valores in parser.valores.items():
+        campos[campo] = valores if campo in MULTIPLOS else valores[0]
+    if 'titulo' not in campos:
+        titulo: Optional[str] = ' '.join(''.join(parser.title).split()) or None
+        if titulo:
+            # "Título - Arquivo Pessoa" -> "Título"
+            campos['titulo'] = titulo.rsplit(' - ', 1)[0]
+    return campos
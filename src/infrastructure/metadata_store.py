@@ -0,0 +1,103 @@
+"""Infrastructure Metadata Store - Metadados das Páginas de Poemas em SQLite"""
+
+import json
+import logging
+import sqlite3
+from pathlib import Path
+from typing import Dict, Optional
+from src.domain.models import PoemaMetadata
+from src.domain.repositories import IMetadataRepository
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS metadados (
+    poema_id INTEGER PRIMARY KEY,
+    titulo TEXT,
+    heteronimo TEXT,
+    data TEXT,
+    fonte TEXT,
+    notas TEXT NOT NULL,
+    status INTEGER NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    fetched_at REAL NOT NULL,
+    erro TEXT
+);
+"""
+
+COLUMNS = (
+    'poema_id', 'titulo', 'heteronimo', 'data', 'fonte', 'notas',
+    'status', 'etag', 'last_modified', 'fetched_at', 'erro'
+)
+
+
+class SqliteMetadataStore(IMetadataRepository):
+    """
+    Metadados por poema_id, ao lado do catálogo (output/metadados.db).
+
+    fetched_at e os validadores HTTP de cada página decidem o que buscar
+    de novo. Gravações são agrupadas em transações (commit a cada
+    batch_size registros), então uma interrupção perde no máximo um lote.
+    """
+
+    DEFAULT_PATH = Path("output/metadados.db")
+
+    def __init__(self, filepath: Path = DEFAULT_PATH, batch_size: int = 100):
+        self.filepath = filepath
+        self.batch_size = batch_size
+        self._pending = 0
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(filepath)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self) -> None:
+        """Confirma gravações pendentes e fecha a conexão"""
+        self.commit()
+        self._conn.close()
+
+    def commit(self) -> None:
+        """Confirma o lote pendente"""
+        self._conn.commit()
+        self._pending = 0
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM metadados").fetchone()[0]
+
+    @staticmethod
+    def _metadata(row: tuple) -> PoemaMetadata:
+        campos = dict(zip(COLUMNS, row))
+        campos['notas'] = json.loads(campos['notas'])
+        return PoemaMetadata(**campos)
+
+    def record(self, metadata: PoemaMetadata) -> None:
+        """Registra (ou substitui) os metadados de um poema"""
+        valores = [getattr(metadata, column) for column in COLUMNS]
+        valores[COLUMNS.index('notas')] = json.dumps(metadata.notas, ensure_ascii=False)
+        self._conn.execute(
+            f"INSERT OR REPLACE INTO metadados ({', '.join(COLUMNS)}) VALUES ({', '.join('?' * len(COLUMNS))})",
+            valores
+        )
+        self._pending += 1
+        if self._pending >= self.batch_size:
+            self.commit()
+
+    def get(self, poema_id: int) -> Optional[PoemaMetadata]:
+        """Metadados do poema, se já buscados"""
+        row = self._conn.execute(
+            f"SELECT {', '.join(COLUMNS)} FROM metadados WHERE poema_id = ?", (poema_id,)
+        ).fetchone()
+        return self._metadata(row) if row else None
+
+    def entries(self) -> Dict[int, PoemaMetadata]:
+        """Metadados de todos os poemas, por poema_id"""
+        rows = self._conn.execute(f"SELECT {', '.join(COLUMNS)} FROM metadados")
+        return {row[0]: self._metadata(row) for row in rows}
@@ -4,6 +4,7 @@ import logging
 from typing import Optional, List
 from bs4 import BeautifulSoup
 from src.domain.models import Categoria, Poema
+from src.infrastructure.journal import CatalogJournal
 
 logger = logging.getLogger(__name__)
 
@@ -11,12 +12,17 @@ logger = logging.getLogger(__name__)
 class HtmlParserAdapter:
     """Adaptador para parsing de HTML com BeautifulSoup"""
 
-    def parse_categories(self, html: str) -> List[Categoria]:
+    def parse_categories(
+        self,
+        html: str,
+        journal: Optional[CatalogJournal] = None
+    ) -> List[Categoria]:
         """
         Extrai categorias principais do HTML.
         
         Args:
             html: Conteúdo HTML da página
+            journal: Journal que recebe cada descoberta (opcional)
             
         Returns:
             Lista de categorias de primeiro nível
@@ -31,7 +37,7 @@ class HtmlParserAdapter:
 
         # Extrai categorias principais (primeiro nível)
         for li_categoria in ul_indice.find_all('li', class_='categoria', recursive=False):
-            categoria = self._parse_categoria(li_categoria)
+            categoria = self._parse_categoria(li_categoria, journal=journal)
             if categoria:
                 categorias.append(categoria)
 
@@ -40,7 +46,8 @@ class HtmlParserAdapter:
     def _parse_categoria(
         self,
         li_element,
-        parent_path: str = ""
+        parent_path: str = "",
+        journal: Optional[CatalogJournal] = None
     ) -> Optional[Categoria]:
         """Parse de uma categoria individual (recursiva)"""
         try:
@@ -58,6 +65,8 @@ class HtmlParserAdapter:
                 path = titulo
 
             categoria = Categoria(nome=titulo, path=path)
+            if journal:
+                journal.record_categoria(categoria, parent_path)
 
             # Procura por poemas e subcategorias
             ul_interna = li_element.find('ul', recursive=False)
@@ -66,13 +75,15 @@ class HtmlParserAdapter:
                 for li_texto in ul_interna.find_all('li', class_='texto', recursive=False):
                     poema = self._parse_poema(li_texto, path)
                     if poema:
-                        categoria.poemas.append(poema)
+                        categoria.add_poema(poema)
+                        if journal:
+                            journal.record_poema(poema)
 
                 # Subcategorias
                 for li_sub in ul_interna.find_all('li', class_='categoria', recursive=False):
-                    sub_categoria = self._parse_categoria(li_sub, path)
+                    sub_categoria = self._parse_categoria(li_sub, path, journal)
                     if sub_categoria:
-                        categoria.subcategorias.append(sub_categoria)
+                        categoria.add_subcategoria(sub_categoria)
 
             return categoria
         except Exception as e:
@@ -0,0 +1,69 @@
+"""Infrastructure Rate Limiter - Token Bucket para Requisições Concorrentes"""
+
+import asyncio
+import time
+from typing import Callable, Optional
+from src.utils import metrics
+
+RATE_LIMIT_WAIT = metrics.counter(
+    "pessoa_http_rate_limit_wait_seconds", "Tempo total de espera pelo limitador de taxa"
+)
+
+
+class AsyncRateLimiter:
+    """
+    Token bucket compartilhado por todas as tasks de um cliente HTTP.
+
+    Libera no máximo `rate` requisições por segundo, com rajadas de até
+    `burst`. Quem espera é atendido em ordem de chegada (a espera acontece
+    com o lock tomado), então a concorrência esconde latência sem aumentar
+    a carga no servidor.
+    """
+
+    def __init__(self, rate: float, burst: int = 1, clock: Callable[[], float] = time.monotonic):
+        if rate <= 0:
+            raise ValueError(f"rate deve ser positivo: {rate}")
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._clock = clock
+        self._tokens = float(self.burst)
+        self._updated = clock()
+        self._lock: Optional[asyncio.Lock] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def acquire(self) -> float:
+        """
+        Aguarda um token.
+
+        Returns:
+            Segundos esperados
+        """
+        # Lock criado no event loop em uso: o limitador pode nascer fora dele
+        # ou sobreviver a um asyncio.run
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._lock = asyncio.Lock()
+            self._loop = loop
+
+        inicio = self._clock()
+        async with self._lock:
+            while True:
+                agora = self._clock()
+                self._tokens = min(self.burst, self._tokens + (agora - self._updated) * self.rate)
+                self._updated = agora
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    break
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+        espera = self._clock() - inicio
+        if espera:
+            RATE_LIMIT_WAIT.inc(espera)
+        return espera
+
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        return False
@@ -1,17 +1,33 @@
 """Infrastructure Repositories - Implementações Concretas"""
 
+import hashlib
 import json
 import logging
+import os
 from pathlib import Path
-from typing import Dict, Any
-from src.domain.repositories import IJsonRepository, IPdfFileRepository
-from src.domain.models import StructureCatalog
+from typing import AsyncIterator, Dict, Any, Optional
+from src.domain.repositories import IJsonRepository, IManifestRepository, IPdfFileRepository
+from src.domain.models import Categoria, StructureCatalog
+from src.infrastructure import compressed_io
+from src.infrastructure.json_stream import iter_array_items
+from src.infrastructure.manifest import build_entry
+from src.infrastructure.serializers import CatalogSerializer, get_serializer
 
 logger = logging.getLogger(__name__)
 
 
 class JsonStructureRepository(IJsonRepository):
-    """Repositório para persistência de estrutura em JSON"""
+    """Repositório para persistência de estrutura em JSON (opcionalmente comprimido)"""
+
+    def __init__(
+        self,
+        serializer: Optional[CatalogSerializer] = None,
+        compression: Optional[str] = None,
+        level: Optional[int] = None
+    ):
+        self.serializer = serializer or get_serializer()
+        self.compression = compression
+        self.level = level
 
     async def save(self, data: StructureCatalog, filepath: Path) -> None:
         """
@@ -21,12 +37,9 @@ class JsonStructureRepository(IJsonRepository):
             data: Catálogo a ser salvo
             filepath: Caminho do arquivo JSON
         """
-        filepath.parent.mkdir(parents=True, exist_ok=True)
-
-        with filepath.open('w', encoding='utf-8') as f:
-            json.dump(data.model_dump(), f, ensure_ascii=False, indent=4)
+        compressed_io.write_bytes(filepath, self.serializer.encode(data), self.compression, self.level)
 
-        logger.info(f"✓ Estrutura salva em {filepath}")
+        logger.info(f"✓ Estrutura salva em {filepath} ({self.serializer.name}, {self.compression or 'sem compressão'})")
 
     async def load(self, filepath: Path) -> Dict[str, Any]:
         """
@@ -41,35 +54,115 @@ class JsonStructureRepository(IJsonRepository):
         if not filepath.exists():
             raise FileNotFoundError(f"Arquivo não encontrado: {filepath}")
 
-        with filepath.open('r', encoding='utf-8') as f:
+        with compressed_io.open_read(filepath) as f:
             data = json.load(f)
 
         logger.info(f"✓ Estrutura carregada de {filepath}")
         return data
 
+    async def load_bytes(self, filepath: Path) -> bytes:
+        """
+        Carrega conteúdo bruto do arquivo JSON (descomprimido se necessário).
+        
+        Args:
+            filepath: Caminho do arquivo JSON
+            
+        Returns:
+            Bytes do arquivo, prontos para validação em uma única chamada
+        """
+        if not filepath.exists():
+            raise FileNotFoundError(f"Arquivo não encontrado: {filepath}")
+
+        data = compressed_io.read_bytes(filepath)
+        logger.info(f"✓ Estrutura carregada de {filepath}")
+        return data
+
+    async def load_catalog(self, filepath: Path, strict: bool = False) -> StructureCatalog:
+        """
+        Carrega arquivo JSON diretamente como catálogo tipado.
+        
+        Args:
+            filepath: Caminho do arquivo JSON
+            strict: Ativa validação estrita (sem coerção de tipos)
+            
+        Returns:
+            Catálogo carregado
+        """
+        raw = await self.load_bytes(filepath)
+        return self.serializer.decode(raw, strict=strict)
+
+    async def iter_categorias(self, filepath: Path) -> AsyncIterator[Categoria]:
+        """
+        Itera categorias de primeiro nível lendo o arquivo incrementalmente.
+        O pico de memória é limitado pela maior categoria, não pelo arquivo.
+        
+        Args:
+            filepath: Caminho do arquivo JSON
+            
+        Yields:
+            Cada categoria de primeiro nível, já validada
+        """
+        if not filepath.exists():
+            raise FileNotFoundError(f"Arquivo não encontrado: {filepath}")
+
+        with compressed_io.open_read(filepath) as f:
+            for data in iter_array_items(f, 'categorias'):
+                yield Categoria.model_validate(data)
+
 
 class PdfFileRepository(IPdfFileRepository):
     """Repositório para gerenciamento de arquivos PDF no sistema de arquivos"""
 
-    def __init__(self, base_path: Path):
+    def __init__(self, base_path: Path, manifest: Optional[IManifestRepository] = None):
         self.base_path = base_path or Path("arquivos_pessoa")
+        self.manifest = manifest
 
     async def exists(self, filepath: Path) -> bool:
         """Verifica se arquivo PDF existe"""
         return filepath.exists()
 
-    async def save(self, content: bytes, filepath: Path) -> None:
+    async def save(
+        self,
+        content: bytes,
+        filepath: Path,
+        poema_id: Optional[int] = None,
+        validators: Optional[Dict[str, str]] = None
+    ) -> None:
         """
         Salva conteúdo PDF em arquivo.
-        
+
+        A escrita vai para um .part renomeado no final (os.replace é
+        atômico), então o caminho final nunca contém PDF parcial. Com
+        manifesto e poema_id, a entrada é registrada após o rename.
+
         Args:
             content: Conteúdo do PDF em bytes
             filepath: Caminho onde salvar
+            poema_id: ID do poema, para o manifesto
+            validators: ETag/Last-Modified da resposta HTTP
         """
         filepath.parent.mkdir(parents=True, exist_ok=True)
-        filepath.write_bytes(content)
+        partial = filepath.with_name(filepath.name + '.part')
+        partial.write_bytes(content)
+        os.replace(partial, filepath)
         logger.debug(f"PDF salvo: {filepath}")
 
+        if self.manifest is not None and poema_id is not None:
+            self.manifest.record(build_entry(
+                filepath,
+                self._relative(filepath),
+                poema_id,
+                hashlib.sha256(content).hexdigest(),
+                validators
+            ))
+
+    def _relative(self, filepath: Path) -> str:
+        """Path relativo ao diretório base, como chave do manifesto"""
+        try:
+            return filepath.relative_to(self.base_path).as_posix()
+        except ValueError:
+            return filepath.as_posix()
+
     async def get_size(self, filepath: Path) -> int:
         """Obtém tamanho do arquivo em bytes"""
         if not filepath.exists():
@@ -0,0 +1,309 @@
+"""Infrastructure Search Index - Índice Invertido de Títulos e Textos em SQLite
+
+Títulos: índice invertido de trigramas (tabela trigramas, chave
+(tri, poema_id)) sobre o título normalizado sem acentos. A busca mede
+quanto dos trigramas da consulta cada título contém, ponderado por IDF,
+o que tolera erros de digitação e acentuação ("ode maritma" acha "Ode
+Marítima"). Só os trigramas raros da consulta geram candidatos: um
+título sem nenhum deles não alcança a similaridade mínima, então
+trigramas presentes em quase todo título ("poe", "de ") não obrigam a
+varrer o índice inteiro.
+
+Textos: FTS5 com tokenizer unicode61 remove_diacritics, ranqueado por
+bm25, sobre os textos extraídos por `pessoa extract`.
+
+Atualizações são incrementais: cada poema guarda uma assinatura
+(título e categorias) e cada texto a versão da extração (sha256 do PDF
+e momento da extração); só o que mudou é reescrito.
+"""
+
+import hashlib
+import logging
+import math
+import sqlite3
+from collections import Counter
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+from src.domain.models import SearchHit
+from src.domain.repositories import ISearchIndex
+from src.utils.helpers import TextHelper
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS poemas (
+    poema_id INTEGER PRIMARY KEY,
+    titulo TEXT NOT NULL,
+    titulo_norm TEXT NOT NULL,
+    categorias TEXT NOT NULL,
+    n_trigramas INTEGER NOT NULL,
+    assinatura TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS trigramas (
+    tri TEXT NOT NULL,
+    poema_id INTEGER NOT NULL,
+    PRIMARY KEY (tri, poema_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS frequencias (
+    tri TEXT PRIMARY KEY,
+    n INTEGER NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS textos_origem (
+    poema_id INTEGER PRIMARY KEY,
+    versao TEXT NOT NULL
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS textos USING fts5(
+    texto, tokenize = 'unicode61 remove_diacritics 2'
+);
+CREATE TABLE IF NOT EXISTS meta (
+    chave TEXT PRIMARY KEY,
+    valor TEXT NOT NULL
+);
+"""
+
+
+def _signature(titulo: str, categorias: List[str]) -> str:
+    return hashlib.sha1('\x1f'.join([titulo, *sorted(categorias)]).encode('utf-8')).hexdigest()
+
+
+class SqliteSearchIndex(ISearchIndex):
+    """Índice de busca persistido em um único arquivo SQLite"""
+
+    DEFAULT_PATH = Path("output/busca.db")
+
+    def __init__(self, filepath: Path = DEFAULT_PATH):
+        self.filepath = filepath
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(filepath)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self) -> None:
+        """Fecha a conexão"""
+        self._conn.close()
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM poemas").fetchone()[0]
+
+    def get_meta(self, chave: str) -> Optional[str]:
+        """Valor auxiliar (ex.: mtime do catálogo indexado)"""
+        row = self._conn.execute("SELECT valor FROM meta WHERE chave = ?", (chave,)).fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, chave: str, valor: str) -> None:
+        """Grava valor auxiliar"""
+        with self._conn:
+            self._conn.execute("INSERT OR REPLACE INTO meta (chave, valor) VALUES (?, ?)", (chave, valor))
+
+    def sync_poemas(self, poemas: Dict[int, Tuple[str, List[str]]]) -> Dict[str, int]:
+        """
+        Alinha o índice de títulos ao catálogo, reescrevendo só o que mudou.
+
+        Args:
+            poemas: poema_id -> (título, paths das categorias que o contêm)
+
+        Returns:
+            Contadores: adicionados, atualizados, removidos
+        """
+        atuais = {
+            poema_id: (assinatura, titulo_norm)
+            for poema_id, assinatura, titulo_norm
+            in self._conn.execute("SELECT poema_id, assinatura, titulo_norm FROM poemas")
+        }
+        stats = {'adicionados': 0, 'atualizados': 0, 'removidos': 0}
+        # Variação da frequência de cada trigrama (alimenta o IDF da busca)
+        delta: Counter = Counter()
+
+        with self._conn:
+            for poema_id, (titulo, categorias) in poemas.items():
+                assinatura = _signature(titulo, categorias)
+                anterior = atuais.get(poema_id)
+                if anterior is not None and anterior[0] == assinatura:
+                    continue
+                if anterior is not None:
+                    self._remove_trigrams(poema_id, anterior[1], delta)
+                    stats['atualizados'] += 1
+                else:
+                    stats['adicionados'] += 1
+
+                normalizado = TextHelper.normalize_search(titulo)
+                grams = TextHelper.trigrams(normalizado)
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO poemas "
+                    "(poema_id, titulo, titulo_norm, categorias, n_trigramas, assinatura) VALUES (?, ?, ?, ?, ?, ?)",
+                    (poema_id, titulo, normalizado, '\n'.join(categorias), len(grams), assinatura)
+                )
+                self._conn.executemany(
+                    "INSERT INTO trigramas (tri, poema_id) VALUES (?, ?)",
+                    [(tri, poema_id) for tri in grams]
+                )
+                delta.update(grams)
+
+            removidos = atuais.keys() - poemas.keys()
+            for poema_id in removidos:
+                self._remove_trigrams(poema_id, atuais[poema_id][1], delta)
+                self._conn.execute("DELETE FROM poemas WHERE poema_id = ?", (poema_id,))
+            stats['removidos'] = len(removidos)
+
+            variacoes = [(tri, n) for tri, n in delta.items() if n]
+            if variacoes:
+                self._conn.executemany(
+                    "INSERT INTO frequencias (tri, n) VALUES (?, ?) "
+                    "ON CONFLICT (tri) DO UPDATE SET n = n + excluded.n",
+                    variacoes
+                )
+                self._conn.execute("DELETE FROM frequencias WHERE n <= 0")
+        return stats
+
+    def _remove_trigrams(self, poema_id: int, titulo_norm: str, delta: Counter) -> None:
+        """Remove os trigramas de um título (pela chave primária, sem varrer a tabela)"""
+        grams = TextHelper.trigrams(titulo_norm)
+        self._conn.executemany(
+            "DELETE FROM trigramas WHERE tri = ? AND poema_id = ?",
+            [(tri, poema_id) for tri in grams]
+        )
+        delta.subtract(grams)
+
+    def sync_textos(self, origens: Dict[int, str], loader: Callable[[int], Optional[str]]) -> Dict[str, int]:
+        """
+        Alinha o índice de textos aos textos extraídos.
+
+        Args:
+            origens: poema_id -> versão do texto (muda a cada nova extração)
+            loader: Carrega o texto de um poema (só chamado para os alterados)
+
+        Returns:
+            Contadores: indexados, removidos
+        """
+        atuais = dict(self._conn.execute("SELECT poema_id, versao FROM textos_origem"))
+        stats = {'indexados': 0, 'removidos': 0}
+
+        with self._conn:
+            for poema_id, versao in origens.items():
+                if atuais.get(poema_id) == versao:
+                    continue
+                texto = loader(poema_id)
+                if texto is None:
+                    continue
+                self._conn.execute("DELETE FROM textos WHERE rowid = ?", (poema_id,))
+                self._conn.execute("INSERT INTO textos (rowid, texto) VALUES (?, ?)", (poema_id, texto))
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO textos_origem (poema_id, versao) VALUES (?, ?)", (poema_id, versao)
+                )
+                stats['indexados'] += 1
+
+            removidos = [(poema_id,) for poema_id in atuais.keys() - origens.keys()]
+            if removidos:
+                self._conn.executemany("DELETE FROM textos WHERE rowid = ?", removidos)
+                self._conn.executemany("DELETE FROM textos_origem WHERE poema_id = ?", removidos)
+                stats['removidos'] = len(removidos)
+        return stats
+
+    def search_titles(self, query: str, limit: int = 20, min_similarity: float = 0.5) -> List[SearchHit]:
+        """
+        Busca aproximada por título.
+
+        score = fração (ponderada por IDF) dos trigramas da consulta
+        presentes no título, tolerando erros de digitação e palavras
+        faltando, com empate desfeito pela similaridade de Jaccard
+        (prefere títulos mais curtos) e bônus para a consulta como
+        substring exata.
+
+        Args:
+            query: Texto da consulta
+            limit: Máximo de resultados
+            min_similarity: Fração mínima (ponderada) de trigramas em comum
+
+        Returns:
+            Resultados em ordem decrescente de score
+        """
+        normalizado = TextHelper.normalize_search(query)
+        grams = TextHelper.trigrams(normalizado)
+        if not grams:
+            return []
+
+        total = len(self) or 1
+        placeholders = ', '.join('?' * len(grams))
+        frequencias = dict(self._conn.execute(
+            f"SELECT tri, n FROM frequencias WHERE tri IN ({placeholders})", tuple(grams)
+        ))
+        # Trigrama ausente do índice pesa como o mais raro (erro de digitação)
+        pesos = {tri: math.log(1 + total / frequencias.get(tri, 1)) for tri in grams}
+        peso_total = sum(pesos.values())
+
+        # Filtro por prefixo: percorre do mais raro ao mais comum até que o
+        # peso restante não alcance min_similarity sozinho; todo título
+        # relevante contém ao menos um dos trigramas escolhidos
+        seletivos = []
+        restante = peso_total
+        for tri in sorted(grams, key=lambda tri: -pesos[tri]):
+            if restante < min_similarity * peso_total:
+                break
+            seletivos.append(tri)
+            restante -= pesos[tri]
+        presentes = [tri for tri in seletivos if tri in frequencias]
+        if not presentes:
+            return []
+
+        rows = self._conn.execute(
+            f"SELECT poema_id, titulo, titulo_norm, categorias, n_trigramas FROM poemas "
+            f"WHERE poema_id IN (SELECT poema_id FROM trigramas WHERE tri IN ({', '.join('?' * len(presentes))}))",
+            tuple(presentes)
+        )
+
+        scored = []
+        for poema_id, titulo, titulo_norm, categorias, n_trigramas in rows:
+            comuns = grams & TextHelper.trigrams(titulo_norm)
+            cobertura = sum(pesos[tri] for tri in comuns) / peso_total
+            if cobertura < min_similarity:
+                continue
+            jaccard = len(comuns) / (len(grams) + n_trigramas - len(comuns))
+            score = cobertura + 0.5 * jaccard + (0.5 if normalizado in titulo_norm else 0.0)
+            scored.append((score, poema_id, titulo, categorias))
+
+        scored.sort(key=lambda item: (-item[0], item[2]))
+        return [
+            SearchHit(poema_id=poema_id, titulo=titulo, categorias=categorias.split('\n'), score=round(score, 3))
+            for score, poema_id, titulo, categorias in scored[:limit]
+        ]
+
+    def search_text(self, query: str, limit: int = 20) -> List[SearchHit]:
+        """
+        Busca nos textos extraídos: todos os termos, ranqueada por bm25.
+
+        Args:
+            query: Termos (o último também casa como prefixo)
+            limit: Máximo de resultados
+
+        Returns:
+            Resultados com trecho destacado entre [ ]
+        """
+        termos = TextHelper.normalize_search(query).split()
+        if not termos:
+            return []
+        match = ' '.join(f'"{termo}"' for termo in termos[:-1]) + f' "{termos[-1]}"*'
+
+        rows = self._conn.execute(
+            "SELECT t.rowid, p.titulo, p.categorias, bm25(textos), "
+            "snippet(textos, 0, '[', ']', '…', 12) "
+            "FROM textos t LEFT JOIN poemas p ON p.poema_id = t.rowid "
+            "WHERE textos MATCH ? ORDER BY bm25(textos) LIMIT ?",
+            (match.strip(), limit)
+        )
+        return [
+            SearchHit(
+                poema_id=poema_id,
+                titulo=titulo or f"#{poema_id}",
+                categorias=categorias.split('\n') if categorias else [],
+                score=round(-rank, 3),
+                trecho=' '.join(trecho.split())
+            )
+            for poema_id, titulo, categorias, rank, trecho in rows
+        ]
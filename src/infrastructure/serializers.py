@@ -0,0 +1,122 @@
+"""Infrastructure Serializers - Backends de Serialização do Catálogo"""
+
+import logging
+from abc import ABC, abstractmethod
+from typing import Dict, Type
+from pydantic import BaseModel
+from src.domain.models import StructureCatalog
+
+logger = logging.getLogger(__name__)
+
+
+def _model_fields(obj):
+    """Hook de encoding: expõe os campos do modelo sem copiar (model_dump)"""
+    if isinstance(obj, BaseModel):
+        return obj.__dict__
+    raise TypeError(f"Tipo não serializável: {type(obj).__name__}")
+
+
+class CatalogSerializer(ABC):
+    """Interface para backends de (de)serialização do catálogo"""
+
+    name = ""
+
+    def __init__(self, pretty: bool = False):
+        self.pretty = pretty
+
+    @abstractmethod
+    def encode(self, catalog: StructureCatalog) -> bytes:
+        """Serializa catálogo diretamente dos modelos tipados"""
+        pass
+
+    def decode(self, raw: bytes, strict: bool = False) -> StructureCatalog:
+        """
+        Desserializa bytes diretamente para o catálogo tipado.
+
+        Comum a todos os backends: pydantic-core parseia e valida em uma
+        passada, sem montar dicts intermediários. Decodificar com
+        orjson/msgspec e validar depois seria uma segunda passada completa.
+        """
+        return StructureCatalog.model_validate_json(raw, strict=strict)
+
+
+class PydanticSerializer(CatalogSerializer):
+    """Backend padrão: pydantic-core (Rust), sem dependências extras"""
+
+    name = "pydantic"
+
+    def encode(self, catalog: StructureCatalog) -> bytes:
+        return catalog.model_dump_json(indent=4 if self.pretty else None).encode('utf-8')
+
+
+class OrjsonSerializer(CatalogSerializer):
+    """Backend orjson (opcional: pip install orjson)"""
+
+    name = "orjson"
+
+    def __init__(self, pretty: bool = False):
+        super().__init__(pretty)
+        import orjson
+        self._orjson = orjson
+        self._option = orjson.OPT_INDENT_2 if pretty else 0
+
+    def encode(self, catalog: StructureCatalog) -> bytes:
+        return self._orjson.dumps(catalog, default=_model_fields, option=self._option)
+
+
+class MsgspecSerializer(CatalogSerializer):
+    """Backend msgspec (opcional: pip install msgspec)"""
+
+    name = "msgspec"
+
+    def __init__(self, pretty: bool = False):
+        super().__init__(pretty)
+        import msgspec
+        self._msgspec = msgspec
+        self._encoder = msgspec.json.Encoder(enc_hook=_model_fields)
+
+    def encode(self, catalog: StructureCatalog) -> bytes:
+        raw = self._encoder.encode(catalog)
+        if self.pretty:
+            raw = self._msgspec.json.format(raw, indent=4)
+        return raw
+
+
+SERIALIZERS: Dict[str, Type[CatalogSerializer]] = {
+    PydanticSerializer.name: PydanticSerializer,
+    OrjsonSerializer.name: OrjsonSerializer,
+    MsgspecSerializer.name: MsgspecSerializer,
+}
+
+
+def get_serializer(name: str = "auto", pretty: bool = False) -> CatalogSerializer:
+    """
+    Cria backend de serialização pelo nome.
+
+    Args:
+        name: "pydantic", "orjson", "msgspec" ou "auto" (orjson > msgspec > pydantic,
+            conforme o que estiver instalado). A leitura é a mesma em todos
+            (model_validate_json); a ordem segue o encode medido por
+            benchmarks/bench_serializers.py: orjson empata ou vence no
+            compacto e é o mais rápido (e menor) no indentado
+        pretty: Gera JSON indentado em vez de compacto
+
+    Returns:
+        Backend instanciado
+
+    Raises:
+        ValueError: Se o backend não existir
+        ImportError: Se a dependência opcional do backend não estiver instalada
+    """
+    if name == "auto":
+        for candidate in (OrjsonSerializer, MsgspecSerializer):
+            try:
+                return candidate(pretty)
+            except ImportError:
+                continue
+        return PydanticSerializer(pretty)
+
+    if name not in SERIALIZERS:
+        raise ValueError(f"Serializador desconhecido: {name} (opções: {', '.join(SERIALIZERS)}, auto)")
+
+    return SERIALIZERS[name](pretty)
@@ -0,0 +1,399 @@
+"""Infrastructure SQLite Catalog - Catálogo em SQLite com Upserts Incrementais"""
+
+import json
+import logging
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from src.domain.models import Categoria, Poema, StructureCatalog, pdf_relative_path
+from src.domain.repositories import IJsonRepository
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS categorias (
+    id INTEGER PRIMARY KEY,
+    parent_id INTEGER REFERENCES categorias(id) ON DELETE CASCADE,
+    nome TEXT NOT NULL,
+    path TEXT NOT NULL UNIQUE,
+    position INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_categorias_parent ON categorias(parent_id, position);
+
+CREATE TABLE IF NOT EXISTS poemas (
+    id INTEGER NOT NULL,
+    categoria_path TEXT NOT NULL REFERENCES categorias(path) ON DELETE CASCADE,
+    titulo TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    downloaded_at REAL,
+    PRIMARY KEY (categoria_path, id)
+);
+CREATE INDEX IF NOT EXISTS idx_poemas_id ON poemas(id);
+CREATE INDEX IF NOT EXISTS idx_poemas_pendentes ON poemas(categoria_path) WHERE downloaded_at IS NULL;
+"""
+
+# Momento em que o manifesto registrou o PDF do poema (NULL se ausente)
+_MANIFEST_SAVED_AT = (
+    "SELECT a.saved_at FROM manifesto.arquivos a "
+    "WHERE a.poema_id = poemas.id "
+    "AND a.path = pdf_relative_path(poemas.categoria_path, poemas.id, poemas.titulo)"
+)
+
+
+def _subtree_range(path: str) -> Tuple[str, str]:
+    """
+    Intervalo [início, fim) de paths descendentes de path.
+    '0' é o caractere seguinte a '/', então o intervalo cobre 'path/...'
+    e usa o índice de path sem depender de LIKE.
+    """
+    return f"{path}/", f"{path}0"
+
+
+class SqliteStructureRepository(IJsonRepository):
+    """Repositório de catálogo em SQLite (lista de adjacência + path materializado)"""
+
+    def _connect(self, filepath: Path) -> sqlite3.Connection:
+        """Abre conexão e garante o schema"""
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(filepath)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA foreign_keys=ON")
+        conn.executescript(SCHEMA)
+        return conn
+
+    def _open_existing(self, filepath: Path) -> sqlite3.Connection:
+        if not filepath.exists():
+            raise FileNotFoundError(f"Arquivo não encontrado: {filepath}")
+        return self._connect(filepath)
+
+    async def save(self, data: StructureCatalog, filepath: Path) -> None:
+        """
+        Sincroniza o banco com o catálogo em uma transação.
+        Apenas linhas novas, alteradas ou removidas são escritas.
+
+        Args:
+            data: Catálogo a ser salvo
+            filepath: Caminho do banco SQLite
+        """
+        conn = self._connect(filepath)
+        try:
+            with conn:
+                stats = self._sync(conn, data)
+        finally:
+            conn.close()
+
+        logger.info(
+            f"✓ Estrutura sincronizada em {filepath} "
+            f"(+{stats['inseridos']} ~{stats['atualizados']} -{stats['removidos']})"
+        )
+
+    def _sync(self, conn: sqlite3.Connection, data: StructureCatalog) -> Dict[str, int]:
+        """Aplica as diferenças entre o banco e o catálogo"""
+        stats = {'inseridos': 0, 'atualizados': 0, 'removidos': 0}
+
+        # Categorias: pré-ordem garante que o pai existe antes dos filhos
+        existing = {
+            path: (cat_id, parent_id, nome, position)
+            for cat_id, parent_id, nome, path, position
+            in conn.execute("SELECT id, parent_id, nome, path, position FROM categorias")
+        }
+        ids: Dict[str, int] = {}
+        stack: List[Tuple[Categoria, Optional[int], int]] = [
+            (cat, None, pos) for pos, cat in reversed(list(enumerate(data.categorias)))
+        ]
+        while stack:
+            categoria, parent_id, position = stack.pop()
+            row = existing.get(categoria.path)
+            if row is None:
+                cursor = conn.execute(
+                    "INSERT INTO categorias (parent_id, nome, path, position) VALUES (?, ?, ?, ?)",
+                    (parent_id, categoria.nome, categoria.path, position)
+                )
+                cat_id = cursor.lastrowid
+                stats['inseridos'] += 1
+            else:
+                cat_id = row[0]
+                if row[1:] != (parent_id, categoria.nome, position):
+                    conn.execute(
+                        "UPDATE categorias SET parent_id = ?, nome = ?, position = ? WHERE id = ?",
+                        (parent_id, categoria.nome, position, cat_id)
+                    )
+                    stats['atualizados'] += 1
+            ids[categoria.path] = cat_id
+            stack.extend(
+                (sub, cat_id, pos)
+                for pos, sub in reversed(list(enumerate(categoria.subcategorias)))
+            )
+
+        # Poemas: chave (categoria_path, id)
+        poemas_existentes = {
+            (path, poema_id): (titulo, position)
+            for poema_id, path, titulo, position
+            in conn.execute("SELECT id, categoria_path, titulo, position FROM poemas")
+        }
+        inserts, updates, seen = [], [], set()
+        for categoria in self._walk(data.categorias):
+            for position, poema in enumerate(categoria.poemas):
+                key = (categoria.path, poema.id)
+                seen.add(key)
+                row = poemas_existentes.get(key)
+                if row is None:
+                    inserts.append((poema.id, categoria.path, poema.titulo, position))
+                elif row != (poema.titulo, position):
+                    updates.append((poema.titulo, position, categoria.path, poema.id))
+
+        conn.executemany(
+            "INSERT INTO poemas (id, categoria_path, titulo, position) VALUES (?, ?, ?, ?)",
+            inserts
+        )
+        conn.executemany(
+            "UPDATE poemas SET titulo = ?, position = ? WHERE categoria_path = ? AND id = ?",
+            updates
+        )
+        stale_poemas = [key for key in poemas_existentes if key not in seen]
+        conn.executemany("DELETE FROM poemas WHERE categoria_path = ? AND id = ?", stale_poemas)
+
+        stale_cats = [(row[0],) for path, row in existing.items() if path not in ids]
+        conn.executemany("DELETE FROM categorias WHERE id = ?", stale_cats)
+
+        conn.executemany(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+            [('total_categorias', str(data.total_categorias)), ('total_poemas', str(data.total_poemas))]
+        )
+
+        stats['inseridos'] += len(inserts)
+        stats['atualizados'] += len(updates)
+        stats['removidos'] += len(stale_poemas) + len(stale_cats)
+        return stats
+
+    @staticmethod
+    def _walk(categorias: Iterable[Categoria]) -> Iterable[Categoria]:
+        stack = list(categorias)
+        while stack:
+            categoria = stack.pop()
+            yield categoria
+            stack.extend(categoria.subcategorias)
+
+    async def load(self, filepath: Path) -> Dict[str, Any]:
+        """Carrega estrutura como dicionário (compatibilidade com IJsonRepository)"""
+        catalog = await self.load_catalog(filepath)
+        return json.loads(catalog.model_dump_json())
+
+    async def load_bytes(self, filepath: Path) -> bytes:
+        """Carrega conteúdo bruto do banco"""
+        if not filepath.exists():
+            raise FileNotFoundError(f"Arquivo não encontrado: {filepath}")
+        return filepath.read_bytes()
+
+    async def load_catalog(self, filepath: Path, strict: bool = False) -> StructureCatalog:
+        """
+        Reconstrói o catálogo inteiro a partir do banco.
+
+        Args:
+            filepath: Caminho do banco SQLite
+            strict: Ignorado; os tipos são garantidos pelo schema
+
+        Returns:
+            Catálogo carregado
+        """
+        conn = self._open_existing(filepath)
+        try:
+            raizes = self._build_tree(conn, None)
+            meta = dict(conn.execute("SELECT key, value FROM meta"))
+        finally:
+            conn.close()
+
+        catalog = StructureCatalog(
+            total_categorias=int(meta.get('total_categorias', len(raizes))),
+            total_poemas=int(meta.get('total_poemas', sum(cat.total_poemas for cat in raizes))),
+            categorias=raizes
+        )
+        logger.info(f"✓ Estrutura carregada de {filepath}")
+        return catalog
+
+    async def load_subtree(self, filepath: Path, path: str) -> Optional[Categoria]:
+        """
+        Carrega apenas a subárvore com o path indicado, via SQL.
+
+        Args:
+            filepath: Caminho do banco SQLite
+            path: Path da categoria
+
+        Returns:
+            Categoria com subárvore, ou None se não existir
+        """
+        conn = self._open_existing(filepath)
+        try:
+            raizes = self._build_tree(conn, path)
+        finally:
+            conn.close()
+        return raizes[0] if raizes else None
+
+    def _build_tree(self, conn: sqlite3.Connection, path: Optional[str]) -> List[Categoria]:
+        """Monta a árvore completa (path=None) ou a subárvore de path"""
+        if path is None:
+            cat_rows = conn.execute(
+                "SELECT id, parent_id, nome, path FROM categorias ORDER BY parent_id, position"
+            ).fetchall()
+            poema_rows = conn.execute(
+                "SELECT id, titulo, categoria_path FROM poemas ORDER BY categoria_path, position"
+            ).fetchall()
+        else:
+            start, end = _subtree_range(path)
+            cat_rows = conn.execute(
+                "SELECT id, parent_id, nome, path FROM categorias "
+                "WHERE path = ? OR (path >= ? AND path < ?) ORDER BY parent_id, position",
+                (path, start, end)
+            ).fetchall()
+            poema_rows = conn.execute(
+                "SELECT id, titulo, categoria_path FROM poemas "
+                "WHERE categoria_path = ? OR (categoria_path >= ? AND categoria_path < ?) "
+                "ORDER BY categoria_path, position",
+                (path, start, end)
+            ).fetchall()
+
+        by_id: Dict[int, Categoria] = {}
+        by_path: Dict[str, Categoria] = {}
+        for cat_id, _, nome, cat_path in cat_rows:
+            categoria = Categoria(nome=nome, path=cat_path)
+            by_id[cat_id] = categoria
+            by_path[cat_path] = categoria
+
+        for poema_id, titulo, categoria_path in poema_rows:
+            by_path[categoria_path].poemas.append(
+                Poema(id=poema_id, titulo=titulo, categoria_path=categoria_path)
+            )
+
+        raizes = []
+        for cat_id, parent_id, _, cat_path in cat_rows:
+            parent = by_id.get(parent_id)
+            if parent is None or cat_path == path:
+                raizes.append(by_id[cat_id])
+            else:
+                parent.subcategorias.append(by_id[cat_id])
+        return raizes
+
+    def poemas_under(self, filepath: Path, path: str) -> List[Poema]:
+        """
+        Lista poemas da categoria e de todas as subcategorias, sem montar a árvore.
+
+        Args:
+            filepath: Caminho do banco SQLite
+            path: Path da categoria
+
+        Returns:
+            Poemas em ordem de path e posição
+        """
+        start, end = _subtree_range(path)
+        return self._query_poemas(
+            filepath,
+            "WHERE categoria_path = ? OR (categoria_path >= ? AND categoria_path < ?)",
+            (path, start, end)
+        )
+
+    def poemas_pendentes(
+        self,
+        filepath: Path,
+        path: Optional[str] = None,
+        manifest_path: Optional[Path] = None
+    ) -> List[Poema]:
+        """
+        Lista poemas ainda não marcados como baixados.
+
+        Args:
+            filepath: Caminho do banco SQLite
+            path: Restringe à subárvore deste path (opcional)
+            manifest_path: Manifesto de downloads; se informado, as marcas
+                são alinhadas a ele antes da consulta (ver sync_downloaded)
+
+        Returns:
+            Poemas pendentes
+        """
+        if manifest_path is not None:
+            self.sync_downloaded(filepath, manifest_path)
+        if path is None:
+            return self._query_poemas(filepath, "WHERE downloaded_at IS NULL", ())
+        start, end = _subtree_range(path)
+        return self._query_poemas(
+            filepath,
+            "WHERE downloaded_at IS NULL "
+            "AND (categoria_path = ? OR (categoria_path >= ? AND categoria_path < ?))",
+            (path, start, end)
+        )
+
+    def _query_poemas(self, filepath: Path, where: str, params: tuple) -> List[Poema]:
+        conn = self._open_existing(filepath)
+        try:
+            rows = conn.execute(
+                f"SELECT id, titulo, categoria_path FROM poemas {where} "
+                "ORDER BY categoria_path, position",
+                params
+            ).fetchall()
+        finally:
+            conn.close()
+        return [Poema(id=poema_id, titulo=titulo, categoria_path=path) for poema_id, titulo, path in rows]
+
+    def mark_downloaded(self, filepath: Path, poema_ids: Iterable[int]) -> None:
+        """
+        Marca poemas como baixados em uma única transação.
+
+        Args:
+            filepath: Caminho do banco SQLite
+            poema_ids: Ids dos poemas baixados
+        """
+        now = time.time()
+        conn = self._open_existing(filepath)
+        try:
+            with conn:
+                conn.executemany(
+                    "UPDATE poemas SET downloaded_at = ? WHERE id = ?",
+                    ((now, poema_id) for poema_id in poema_ids)
+                )
+        finally:
+            conn.close()
+
+    def sync_downloaded(self, filepath: Path, manifest_path: Path) -> int:
+        """
+        Alinha downloaded_at ao manifesto de downloads, em SQL: o poema
+        está baixado se o manifesto registra o PDF no path da sua
+        categoria (mesma regra de nomes do download). PDFs removidos do
+        manifesto voltam a ficar pendentes.
+
+        Args:
+            filepath: Caminho do banco SQLite
+            manifest_path: Manifesto (.manifest.db) do diretório base
+
+        Returns:
+            Quantidade de poemas cuja marca mudou
+        """
+        conn = self._open_existing(filepath)
+        try:
+            if not manifest_path.exists():
+                with conn:
+                    return conn.execute(
+                        "UPDATE poemas SET downloaded_at = NULL WHERE downloaded_at IS NOT NULL"
+                    ).rowcount
+
+            conn.create_function("pdf_relative_path", 3, pdf_relative_path, deterministic=True)
+            conn.execute("ATTACH DATABASE ? AS manifesto", (str(manifest_path),))
+            try:
+                with conn:
+                    # Só linhas cuja marca muda são escritas
+                    alteradas = conn.execute(
+                        f"UPDATE poemas SET downloaded_at = ({_MANIFEST_SAVED_AT}) "
+                        f"WHERE downloaded_at IS NOT ({_MANIFEST_SAVED_AT})"
+                    ).rowcount
+            finally:
+                conn.execute("DETACH DATABASE manifesto")
+        finally:
+            conn.close()
+
+        logger.info(f"✓ Catálogo alinhado ao manifesto {manifest_path} ({alteradas} poemas atualizados)")
+        return alteradas
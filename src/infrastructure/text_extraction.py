@@ -0,0 +1,134 @@
+"""Infrastructure Text Extraction - Backends de Extração de Texto de PDF
+
+Backends opcionais, escolhidos como os serializadores do catálogo:
+
+    pypdf      puro Python (pip install pypdf)
+    pdftotext  poppler-utils no PATH; mais rápido e preserva o layout dos versos
+
+As funções de worker ficam no nível do módulo para serem usadas por um
+ProcessPoolExecutor: cada processo instancia o backend uma única vez.
+"""
+
+import logging
+import re
+import shutil
+import subprocess
+import unicodedata
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Dict, Optional, Tuple, Type
+
+logger = logging.getLogger(__name__)
+
+_TRAILING_SPACES = re.compile(r'[ \t]+\n')
+_BLANK_LINES = re.compile(r'\n{3,}')
+
+
+def normalize_text(texto: str) -> str:
+    """NFC, quebras de linha \\n, sem espaços ao fim da linha e no máximo uma linha em branco"""
+    texto = unicodedata.normalize('NFC', texto.replace('\r\n', '\n').replace('\f', '\n'))
+    texto = _TRAILING_SPACES.sub('\n', texto)
+    return _BLANK_LINES.sub('\n\n', texto).strip()
+
+
+class TextExtractor(ABC):
+    """Backend de extração de texto de um PDF"""
+
+    name: str = ""
+
+    @abstractmethod
+    def extract(self, filepath: Path) -> str:
+        """Texto bruto do PDF, páginas em ordem"""
+        pass
+
+
+class PypdfExtractor(TextExtractor):
+    """Backend pypdf (opcional: pip install pypdf)"""
+
+    name = "pypdf"
+
+    def __init__(self):
+        from pypdf import PdfReader
+        self._reader = PdfReader
+
+    def extract(self, filepath: Path) -> str:
+        reader = self._reader(filepath)
+        return "\n\n".join(page.extract_text() or "" for page in reader.pages)
+
+
+class PdftotextExtractor(TextExtractor):
+    """Backend pdftotext do poppler-utils (opcional: apt install poppler-utils)"""
+
+    name = "pdftotext"
+
+    def __init__(self, timeout: float = 60.0):
+        self._binary = shutil.which("pdftotext")
+        if self._binary is None:
+            raise ImportError("pdftotext não encontrado no PATH (instale poppler-utils)")
+        self.timeout = timeout
+
+    def extract(self, filepath: Path) -> str:
+        result = subprocess.run(
+            [self._binary, "-layout", "-enc", "UTF-8", str(filepath), "-"],
+            capture_output=True,
+            timeout=self.timeout,
+            check=True
+        )
+        return result.stdout.decode('utf-8', errors='replace')
+
+
+EXTRACTORS: Dict[str, Type[TextExtractor]] = {
+    PdftotextExtractor.name: PdftotextExtractor,
+    PypdfExtractor.name: PypdfExtractor,
+}
+
+
+def get_extractor(name: str = "auto") -> TextExtractor:
+    """
+    Cria backend de extração pelo nome.
+
+    Args:
+        name: "pdftotext", "pypdf" ou "auto" (pdftotext > pypdf, conforme o
+            que estiver disponível)
+
+    Returns:
+        Backend instanciado
+
+    Raises:
+        ValueError: Se o backend não existir
+        ImportError: Se nenhum backend (ou o pedido) estiver disponível
+    """
+    if name == "auto":
+        for candidate in EXTRACTORS.values():
+            try:
+                return candidate()
+            except ImportError:
+                continue
+        raise ImportError("Nenhum extrator de texto disponível: instale pypdf ou poppler-utils")
+
+    if name not in EXTRACTORS:
+        raise ValueError(f"Extrator desconhecido: {name} (opções: {', '.join(EXTRACTORS)}, auto)")
+
+    return EXTRACTORS[name]()
+
+
+_worker_extractor: Optional[TextExtractor] = None
+
+
+def init_worker(name: str) -> None:
+    """Initializer do pool: instancia o backend uma vez por processo"""
+    global _worker_extractor
+    _worker_extractor = get_extractor(name)
+
+
+def extract_in_worker(filepath: str) -> Tuple[str, Optional[str]]:
+    """
+    Extrai e normaliza o texto de um PDF dentro de um worker.
+
+    Returns:
+        Texto e mensagem de erro (texto vazio em caso de erro)
+    """
+    try:
+        return normalize_text(_worker_extractor.extract(Path(filepath))), None
+    except Exception as e:
+        return "", f"{type(e).__name__}: {e}"
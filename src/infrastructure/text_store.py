@@ -0,0 +1,109 @@
+"""Infrastructure Text Store - Textos Extraídos por Poema em SQLite"""
+
+import logging
+import sqlite3
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Set, Tuple
+from src.domain.models import TextEntry
+from src.domain.repositories import ITextRepository
+from src.infrastructure import compressed_io
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS textos (
+    poema_id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL,
+    sha256 TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    chars INTEGER NOT NULL,
+    extractor TEXT NOT NULL,
+    extracted_at REAL NOT NULL,
+    erro TEXT,
+    texto BLOB NOT NULL
+);
+"""
+
+COLUMNS = ('poema_id', 'path', 'sha256', 'mtime_ns', 'chars', 'extractor', 'extracted_at', 'erro')
+
+
+class SqliteTextStore(ITextRepository):
+    """
+    Um texto por poema_id, comprimido (zstd, ou gzip sem zstd).
+
+    Cada linha guarda sha256 e mtime do PDF de origem: é o cache que
+    permite reprocessar só arquivos novos ou alterados. Gravações são
+    agrupadas em transações (commit a cada batch_size textos).
+    """
+
+    DEFAULT_PATH = Path("output/textos.db")
+
+    def __init__(self, filepath: Path = DEFAULT_PATH, batch_size: int = 200):
+        self.filepath = filepath
+        self.batch_size = batch_size
+        self._pending = 0
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(filepath)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self) -> None:
+        """Confirma gravações pendentes e fecha a conexão"""
+        self.commit()
+        self._conn.close()
+
+    def commit(self) -> None:
+        """Confirma o lote pendente"""
+        self._conn.commit()
+        self._pending = 0
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM textos").fetchone()[0]
+
+    def record(self, entry: TextEntry, texto: str) -> None:
+        """Registra (ou substitui) o texto de um poema"""
+        blob = compressed_io.compress(texto.encode('utf-8'), 'auto')
+        self._conn.execute(
+            f"INSERT OR REPLACE INTO textos ({', '.join(COLUMNS)}, texto) "
+            f"VALUES ({', '.join('?' * (len(COLUMNS) + 1))})",
+            tuple(getattr(entry, column) for column in COLUMNS) + (blob,)
+        )
+        self._pending += 1
+        if self._pending >= self.batch_size:
+            self.commit()
+
+    def touch(self, poema_id: int, path: str, mtime_ns: int) -> None:
+        """Atualiza origem/mtime quando o conteúdo (sha256) não mudou"""
+        self._conn.execute(
+            "UPDATE textos SET path = ?, mtime_ns = ? WHERE poema_id = ?", (path, mtime_ns, poema_id)
+        )
+
+    def get(self, poema_id: int) -> Optional[str]:
+        """Texto do poema, se extraído"""
+        row = self._conn.execute("SELECT texto FROM textos WHERE poema_id = ?", (poema_id,)).fetchone()
+        if row is None:
+            return None
+        return compressed_io.decompress(row[0]).decode('utf-8')
+
+    def entries(self) -> Dict[int, TextEntry]:
+        """Metadados de todos os textos, por poema_id (sem os textos)"""
+        rows = self._conn.execute(f"SELECT {', '.join(COLUMNS)} FROM textos")
+        return {row[0]: TextEntry(**dict(zip(COLUMNS, row))) for row in rows}
+
+    def iter_texts(self) -> Iterator[Tuple[int, str]]:
+        """Itera (poema_id, texto) em ordem de id, ignorando extrações com erro"""
+        rows = self._conn.execute("SELECT poema_id, texto FROM textos WHERE erro IS NULL ORDER BY poema_id")
+        for poema_id, blob in rows:
+            yield poema_id, compressed_io.decompress(blob).decode('utf-8')
+
+    def remove(self, poema_ids: Set[int]) -> None:
+        """Remove os textos dos poemas"""
+        with self._conn:
+            self._conn.executemany("DELETE FROM textos WHERE poema_id = ?", [(i,) for i in poema_ids])
@@ -0,0 +1,126 @@
+"""Main Daemon - Sincronização Contínua com Browser e Conexões Aquecidos"""
+
+import argparse
+import asyncio
+import logging
+import signal
+from contextlib import AsyncExitStack
+from pathlib import Path
+from typing import List, Optional
+from config import DIContainer
+from src.application.sync_service import SyncScheduler
+from src.infrastructure.control_server import ControlServer
+from src.infrastructure.ledger import RequestLedger
+from src.utils import metrics
+from src.utils.logger import setup_logging
+
+# Configurar logging
+logger = setup_logging("daemon", logging.INFO)
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Argumentos de linha de comando (argv: default sys.argv[1:])"""
+    parser = argparse.ArgumentParser(
+        description="Daemon: atualiza a estrutura e baixa faltantes periodicamente, sem reiniciar browser/HTTP"
+    )
+    parser.add_argument(
+        "--sync-every",
+        type=float,
+        default=15,
+        help="Intervalo entre syncs de faltantes, em minutos (default: 15)"
+    )
+    parser.add_argument(
+        "--refresh-every",
+        type=float,
+        default=360,
+        help="Intervalo entre atualizações da estrutura, em minutos; 0 desativa (default: 360)"
+    )
+    parser.add_argument(
+        "--refresh-on-start",
+        action="store_true",
+        help="Atualiza a estrutura logo ao iniciar, antes do primeiro sync"
+    )
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=8765,
+        help="Porta do endpoint local de status/disparo (default: 8765)"
+    )
+    parser.add_argument("--headed", action="store_true", help="Browser visível (default: headless)")
+    parser.add_argument(
+        "--base-path",
+        type=Path,
+        default=Path("arquivos_pessoa"),
+        help="Diretório dos PDFs (default: arquivos_pessoa)"
+    )
+    parser.add_argument(
+        "--log-json",
+        action="store_true",
+        help="Logs em JSON lines (campos estruturados como poem_id, bytes, latency_ms)"
+    )
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        default=None,
+        help="Expõe métricas em http://127.0.0.1:PORT/metrics"
+    )
+    return parser.parse_args(argv)
+
+
+async def main(argv: Optional[List[str]] = None):
+    """Mantém browser e cliente HTTP abertos e executa o agendador até SIGTERM/SIGINT"""
+    args = parse_args(argv)
+    if args.log_json:
+        setup_logging("daemon", logging.INFO, json_format=True)
+    if args.metrics_port is not None:
+        metrics.REGISTRY.start_http_server(args.metrics_port)
+
+    refresh_interval = args.refresh_every * 60 if args.refresh_every > 0 else None
+    args.base_path.mkdir(parents=True, exist_ok=True)
+    sync_service = DIContainer.create_sync_service(
+        args.base_path,
+        headless=not args.headed,
+        ledger_path=RequestLedger.DEFAULT_PATH
+    )
+    scheduler = SyncScheduler(
+        sync_service,
+        sync_interval=args.sync_every * 60,
+        refresh_interval=refresh_interval,
+        refresh_on_start=args.refresh_on_start
+    )
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    logger.info("🔁 Iniciando daemon de sincronização")
+    async with AsyncExitStack() as stack:
+        await stack.enter_async_context(sync_service.download_service.http_downloader)
+
+        # Sem atualizações agendadas, o browser só abre no primeiro disparo manual
+        browser = sync_service.scraper_service.browser
+        stack.push_async_exit(browser)
+        if refresh_interval or args.refresh_on_start:
+            await browser.__aenter__()
+
+        await stack.enter_async_context(ControlServer(scheduler.status, scheduler.trigger, args.port))
+        stack.callback(sync_service.manifest.close)
+
+        runner = asyncio.create_task(scheduler.run())
+        stopping = asyncio.create_task(stop.wait())
+        await asyncio.wait({runner, stopping}, return_when=asyncio.FIRST_COMPLETED)
+
+        logger.info("🛑 Encerrando daemon...")
+        stopping.cancel()
+        runner.cancel()
+        try:
+            await runner
+        except asyncio.CancelledError:
+            pass
+
+    logger.info("✓ Daemon encerrado")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
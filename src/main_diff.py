@@ -0,0 +1,58 @@
+"""Main Diff - Comparação entre Snapshots do Catálogo"""
+
+import argparse
+import asyncio
+import logging
+from pathlib import Path
+from typing import List, Optional
+from config import DIContainer
+from src.utils.logger import setup_logging
+
+# Configurar logging
+logger = setup_logging("diff", logging.INFO)
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Argumentos de linha de comando (argv: default sys.argv[1:])"""
+    parser = argparse.ArgumentParser(description="Compara dois snapshots do catálogo")
+    parser.add_argument("antigo", type=Path, help="Catálogo anterior (JSON)")
+    parser.add_argument(
+        "novo",
+        type=Path,
+        nargs="?",
+        default=Path("output/categorias_estrutura.json"),
+        help="Catálogo atual (default: output/categorias_estrutura.json)"
+    )
+    parser.add_argument(
+        "-o", "--output",
+        type=Path,
+        default=Path("output/catalog_diff.json"),
+        help="Arquivo de saída do diff, consumível por main_download --diff"
+    )
+    return parser.parse_args(argv)
+
+
+async def main(argv: Optional[List[str]] = None):
+    """Orquestração da comparação"""
+    args = parse_args(argv)
+
+    structure_service = DIContainer.create_structure_service()
+    diff_service = DIContainer.create_diff_service()
+
+    antigo = await structure_service.load_structure(args.antigo)
+    novo = await structure_service.load_structure(args.novo)
+
+    diff = diff_service.diff(antigo, novo)
+    diff_service.save_diff(diff, args.output)
+
+    for change in diff.categorias_renomeadas:
+        logger.info(f"  ✎ {change.path_antes} → {change.path_depois}")
+    for change in diff.categorias_movidas:
+        logger.info(f"  ➜ {change.path_antes} → {change.path_depois}")
+
+    logger.info(f"📊 {diff.summary()}")
+    logger.info(f"📥 {len(diff.changed_poema_ids)} poemas novos ou alterados para baixar")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,92 +1,321 @@
 """Main Download - Script de Download Resumível com Clean Architecture"""
 
+import argparse
 import asyncio
 import logging
 from pathlib import Path
+from typing import AsyncIterator, List, Optional
 from config import DIContainer
+from src.application.plan_service import PlanService
 from src.application.progress_tracker import ProgressTracker
+from src.domain.models import DownloadPlan, PlanItem
+from src.utils.helpers import TextHelper
+from src.infrastructure.ledger import RequestLedger
+from src.infrastructure.sqlite_catalog import SqliteStructureRepository
+from src.utils import metrics, profiling
 from src.utils.logger import setup_logging
 
 # Configurar logging
 logger = setup_logging("download", logging.INFO)
 
 
-async def main():
-    """Orquestração principal de downloads resumíveis"""
-    
+async def iter_list(items: list) -> AsyncIterator:
+    """Adapta lista ao mesmo protocolo do streaming de categorias"""
+    for item in items:
+        yield item
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Argumentos de linha de comando (argv: default sys.argv[1:])"""
+    parser = argparse.ArgumentParser(description="Download resumível de poemas faltantes")
+    parser.add_argument(
+        "--diff",
+        type=Path,
+        default=None,
+        help="Diff gerado por main_diff/main_scraper: baixa apenas poemas novos ou alterados"
+    )
+    parser.add_argument(
+        "--categoria",
+        default=None,
+        help="Path de uma categoria: carrega e baixa apenas essa subárvore"
+    )
+    parser.add_argument(
+        "--plan",
+        type=Path,
+        default=None,
+        help="Plano gerado por `pessoa plan`: baixa os itens pendentes na ordem do plano"
+    )
+    parser.add_argument(
+        "--format",
+        choices=("auto", "json", "binary", "sqlite"),
+        default="auto",
+        help="Catálogo lido: auto (binário se atual, senão JSON), json, binary ou sqlite "
+             "(pendentes consultados em SQL contra o manifesto)"
+    )
+    parser.add_argument(
+        "--log-json",
+        action="store_true",
+        help="Logs em JSON lines (campos estruturados como poem_id, bytes, latency_ms)"
+    )
+    parser.add_argument(
+        "--metrics-file",
+        type=Path,
+        default=None,
+        help="Grava métricas no formato Prometheus (textfile) a cada atualização de progresso"
+    )
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        default=None,
+        help="Expõe métricas em http://127.0.0.1:PORT/metrics"
+    )
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="time",
+        choices=profiling.MODES,
+        default=None,
+        help="Mede wall/CPU por fase e chamada; 'cprofile' ou 'sample' adicionam profiler (relatório em output/profiles/)"
+    )
+    return parser.parse_args(argv)
+
+
+async def download_plan(plan_path: Path, metrics_file: Optional[Path] = None) -> int:
+    """Executa um plano de `pessoa plan`, pulando o que já foi baixado desde então; retorna o código de saída"""
+    if not plan_path.exists():
+        logger.error(f"❌ Plano não encontrado: {plan_path}")
+        logger.info("💡 Execute primeiro: pessoa plan")
+        return 1
+    plan = DownloadPlan.model_validate_json(plan_path.read_text(encoding='utf-8'))
+    base_path = Path(plan.base_path)
+
+    with DIContainer.create_manifest(base_path) as manifest:
+        # O plano pode ter ficado para trás: o manifesto decide o que falta
+        manifest.reconcile(base_path)
+        itens = PlanService.pending(plan, manifest.keys())
+        if not itens:
+            logger.info("✅ Nenhum item pendente no plano!")
+            return 0
+
+        restante = sum(item.size or 0 for item in itens)
+        livre = PlanService.free_space(base_path)
+        if restante > livre:
+            logger.error(
+                f"❌ Espaço insuficiente em {base_path}: {TextHelper.format_bytes(livre)} livres, "
+                f"faltam {TextHelper.format_bytes(restante)}"
+            )
+            return 1
+        logger.info(
+            f"📋 Plano {plan_path} (ordem: {plan.ordem}): {len(itens)} de {len(plan.itens)} PDFs pendentes, "
+            f"{TextHelper.format_bytes(restante)}"
+        )
+
+        profiling.phase("Download do Plano")
+        download_service = DIContainer.create_download_service(
+            base_path,
+            min_delay=2.0,
+            max_delay=2.3,
+            manifest=manifest,
+            ledger_path=RequestLedger.DEFAULT_PATH
+        )
+        async with download_service.http_downloader:
+            progress_tracker = ProgressTracker(len(itens))
+            if metrics_file:
+                progress_tracker.on_progress(lambda atual, total: metrics.REGISTRY.write_textfile(metrics_file))
+            await download_service.download_plan(itens, progress_tracker)
+
+    logger.info("\n" + "="*60)
+    logger.info("✅ Plano executado!")
+    logger.info("="*60)
+    logger.info(f"📊 Resumo: {progress_tracker.get_summary()}")
+    return 0
+
+
+async def download_pending(
+    catalog_path: Path,
+    categoria_path: Optional[str] = None,
+    metrics_file: Optional[Path] = None
+) -> int:
+    """Baixa os pendentes do catálogo SQLite, consultados em SQL contra o manifesto; retorna o código de saída"""
+    if not catalog_path.exists():
+        logger.error(f"❌ Catálogo não encontrado: {catalog_path}")
+        logger.info("💡 Execute primeiro: pessoa scrape --format sqlite")
+        return 1
+    base_path = Path("arquivos_pessoa")
+    catalog_repo = SqliteStructureRepository()
+
+    with DIContainer.create_manifest(base_path) as manifest:
+        manifest.reconcile(base_path)
+        pendentes = catalog_repo.poemas_pendentes(catalog_path, categoria_path, manifest.filepath)
+        if not pendentes:
+            logger.info("✅ Nenhum poema faltante encontrado!")
+            return 0
+        logger.info(f"📊 Total de {len(pendentes)} poemas para baixar\n")
+
+        profiling.phase("Download dos Pendentes")
+        download_service = DIContainer.create_download_service(
+            base_path,
+            min_delay=2.0,
+            max_delay=2.3,
+            manifest=manifest,
+            ledger_path=RequestLedger.DEFAULT_PATH
+        )
+        itens = [
+            PlanItem(poema_id=poema.id, titulo=poema.titulo, categoria_path=poema.categoria_path)
+            for poema in pendentes
+        ]
+        async with download_service.http_downloader:
+            progress_tracker = ProgressTracker(len(itens))
+            if metrics_file:
+                progress_tracker.on_progress(lambda atual, total: metrics.REGISTRY.write_textfile(metrics_file))
+            await download_service.download_plan(itens, progress_tracker)
+
+        # Marca no catálogo o que foi salvo
+        catalog_repo.sync_downloaded(catalog_path, manifest.filepath)
+
+    logger.info("\n" + "="*60)
+    logger.info("✅ Download de poemas faltantes concluído!")
+    logger.info("="*60)
+    logger.info(f"📊 Resumo: {progress_tracker.get_summary()}")
+    return 0
+
+
+async def main(argv: Optional[List[str]] = None) -> int:
+    """Orquestração principal de downloads resumíveis; retorna o código de saída"""
+    args = parse_args(argv)
+    if args.log_json:
+        setup_logging("download", logging.INFO, json_format=True)
+
+    if args.metrics_file or args.metrics_port is not None:
+        metrics.REGISTRY.enable()
+    if args.metrics_port is not None:
+        metrics.REGISTRY.start_http_server(args.metrics_port)
+
+    if args.profile:
+        profiling.start("download", args.profile)
+
     logger.info("🔄 Iniciando download resumível de poemas faltantes")
     
     try:
+        if args.plan:
+            return await download_plan(args.plan, args.metrics_file)
+
         # Fase 1: Carregar estrutura existente
         logger.info("\n" + "="*60)
         logger.info("FASE 1: Carregando Estrutura Existente")
         logger.info("="*60)
+        profiling.phase("FASE 1: Carregando Estrutura Existente")
+
+        persistence_service = DIContainer.create_catalog_reader(args.format)
+        if args.format == "sqlite" and not args.diff:
+            return await download_pending(persistence_service.default_path, args.categoria, args.metrics_file)
 
-        persistence_service = DIContainer.create_persistence_service()
-        
         try:
-            catalog = await persistence_service.load_catalog()
-            logger.info(f"✓ {catalog.total_categorias} categorias carregadas")
+            if args.categoria:
+                categoria = await persistence_service.load_categoria(args.categoria)
+                if categoria is None:
+                    logger.error(f"❌ Categoria não encontrada: {args.categoria}")
+                    return 1
+                categorias = iter_list([categoria])
+                logger.info(f"✓ Categoria '{categoria.nome}' carregada ({categoria.total_poemas} poemas)")
+            else:
+                if not persistence_service.default_path.exists():
+                    raise FileNotFoundError(
+                        f"Arquivo de estrutura não encontrado: {persistence_service.default_path}"
+                    )
+                # Streaming: uma categoria de primeiro nível em memória por vez
+                categorias = persistence_service.iter_categorias()
+                logger.info(f"✓ Estrutura aberta em streaming: {persistence_service.default_path}")
         except FileNotFoundError as e:
             logger.error(f"❌ {e}")
             logger.info("💡 Execute primeiro: python src/main_scraper.py")
-            return
+            return 1
 
         # Fase 2: Filtrar poemas faltantes
         logger.info("\n" + "="*60)
         logger.info("FASE 2: Identificando Poemas Faltantes")
         logger.info("="*60)
+        profiling.phase("FASE 2: Identificando Poemas Faltantes")
 
-        filter_service = DIContainer.create_filter_service(Path("arquivos_pessoa"))
-        
-        categorias_faltantes = []
-        for categoria in catalog.categorias:
-            cat_filtrada = filter_service.filter_missing_poemas(categoria)
-            if cat_filtrada:
-                categorias_faltantes.append(cat_filtrada)
+        base_path = Path("arquivos_pessoa")
+        with DIContainer.create_manifest(base_path) as manifest:
+            categorias_faltantes = []
+            total_faltantes = 0
+            # Manifesto decide o que está baixado; reconciliar só re-hasheia
+            # arquivos cujo tamanho/mtime mudou desde o registro
+            manifest.reconcile(base_path)
 
-        if not categorias_faltantes:
-            logger.info("✅ Nenhum poema faltante encontrado!")
-            return
+            diff_service = changed_ids = None
+            if args.diff:
+                diff_service = DIContainer.create_diff_service()
+                diff = diff_service.load_diff(args.diff)
+                changed_ids = diff.changed_poema_ids
+                logger.info(f"📋 Usando diff {args.diff}: {diff.summary()}")
+                # Poemas só movidos de categoria: o PDF local muda de lugar
+                diff_service.relocate(diff, base_path, manifest)
 
-        # Contar total de poemas faltantes
-        total_faltantes = 0
-        for categoria in categorias_faltantes:
-            total_faltantes += filter_service.count_missing_poemas(categoria)
+            # Criado depois da realocação: guarda as chaves do manifesto
+            filter_service = DIContainer.create_filter_service(base_path, manifest=manifest)
 
-        logger.info(f"📊 Total de {total_faltantes} poemas para baixar\n")
+            # Uma passada calcula árvore e contagem juntas; com diff, só entre
+            # os poemas alterados (o que já foi salvo não é baixado de novo)
+            async for categoria in categorias:
+                candidatas = diff_service.filter_changed([categoria], changed_ids) if args.diff else [categoria]
+                for candidata in candidatas:
+                    cat_filtrada, faltantes = filter_service.plan_missing(candidata)
+                    if cat_filtrada:
+                        categorias_faltantes.append(cat_filtrada)
+                        total_faltantes += faltantes
 
-        # Fase 3: Download de poemas faltantes
-        logger.info("="*60)
-        logger.info("FASE 3: Download de Poemas Faltantes")
-        logger.info("="*60)
+            if not categorias_faltantes:
+                logger.info("✅ Nenhum poema faltante encontrado!")
+                return 0
 
-        download_service = DIContainer.create_download_service(
-            Path("arquivos_pessoa"),
-            min_delay=2.0,
-            max_delay=2.3
-        )
-        
-        async with download_service.http_downloader:
-            # Criar rastreador de progresso
-            progress_tracker = ProgressTracker(total_faltantes)
+            logger.info(f"📊 Total de {total_faltantes} poemas para baixar\n")
+
+            # Fase 3: Download de poemas faltantes
+            logger.info("="*60)
+            logger.info("FASE 3: Download de Poemas Faltantes")
+            logger.info("="*60)
+            profiling.phase("FASE 3: Download de Poemas Faltantes")
+
+            download_service = DIContainer.create_download_service(
+                base_path,
+                min_delay=2.0,
+                max_delay=2.3,
+                manifest=manifest,
+                ledger_path=RequestLedger.DEFAULT_PATH
+            )
+
+            async with download_service.http_downloader:
+                # Criar rastreador de progresso
+                progress_tracker = ProgressTracker(total_faltantes)
+                if args.metrics_file:
+                    progress_tracker.on_progress(
+                        lambda atual, total: metrics.REGISTRY.write_textfile(args.metrics_file)
+                    )
 
-            # Baixar poemas faltantes
-            for categoria in categorias_faltantes:
-                await download_service.download_categoria_recursively(
-                    categoria,
-                    progress_tracker
-                )
+                # Baixar poemas faltantes
+                for categoria in categorias_faltantes:
+                    await download_service.download_categoria_recursively(
+                        categoria,
+                        progress_tracker
+                    )
 
         logger.info("\n" + "="*60)
         logger.info("✅ Download de poemas faltantes concluído!")
         logger.info("="*60)
         logger.info(f"📊 Resumo: {progress_tracker.get_summary()}")
+        return 0
 
     except Exception as e:
         logger.error(f"❌ Erro fatal: {e}", exc_info=True)
         raise
+    finally:
+        profiling.stop()
+        if args.metrics_file:
+            metrics.REGISTRY.write_textfile(args.metrics_file)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    raise SystemExit(asyncio.run(main()))
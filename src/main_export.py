@@ -0,0 +1,117 @@
+"""Main Export - Exportação do Espelho em tar/zip"""
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+from typing import List, Optional
+from config import DIContainer
+from src.infrastructure.archive_writer import FORMATS, READ_BUFFER, ArchiveWriter, format_from_path
+from src.utils import profiling
+from src.utils.helpers import TextHelper
+from src.utils.logger import redirect_console, setup_logging
+
+# Configurar logging
+logger = setup_logging("export", logging.INFO)
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Argumentos de linha de comando (argv: default sys.argv[1:])"""
+    parser = argparse.ArgumentParser(
+        description="Empacota os PDFs na ordem do catálogo, com o catálogo e o manifesto, em um único arquivo"
+    )
+    parser.add_argument(
+        "destino",
+        help="Arquivo de saída (.tar, .tar.gz, .tar.zst, .zip) ou '-' para stdout"
+    )
+    parser.add_argument(
+        "--format",
+        choices=list(FORMATS),
+        default=None,
+        help="Formato (default: pela extensão do destino; tar para stdout)"
+    )
+    parser.add_argument(
+        "--base-path",
+        type=Path,
+        default=Path("arquivos_pessoa"),
+        help="Diretório dos PDFs (default: arquivos_pessoa)"
+    )
+    parser.add_argument("--level", type=int, default=None, help="Nível de compressão (default do codec)")
+    parser.add_argument("--workers", type=int, default=None, help="Threads de compressão (default: nº de CPUs)")
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="time",
+        choices=profiling.MODES,
+        default=None,
+        help="Mede wall/CPU por fase e chamada; 'cprofile' ou 'sample' adicionam profiler (relatório em output/profiles/)"
+    )
+    return parser.parse_args(argv)
+
+
+async def main(argv: Optional[List[str]] = None) -> int:
+    """Orquestração da exportação"""
+    args = parse_args(argv)
+    to_stdout = args.destino == "-"
+    if to_stdout:
+        # stdout carrega o arquivo: o log vai para stderr
+        redirect_console(sys.stderr)
+
+    destino = None if to_stdout else Path(args.destino)
+    fmt = args.format or ('tar' if to_stdout else format_from_path(destino))
+    if fmt is None:
+        logger.error(f"❌ Extensão não reconhecida em {destino}: use --format ({', '.join(FORMATS)})")
+        return 1
+
+    if not args.base_path.exists():
+        logger.error(f"❌ Diretório não encontrado: {args.base_path}")
+        return 1
+
+    persistence_service = DIContainer.create_catalog_reader()
+    if not persistence_service.default_path.exists():
+        logger.error(f"❌ Catálogo não encontrado: {persistence_service.default_path}")
+        logger.info("💡 Execute primeiro: pessoa scrape")
+        return 1
+
+    export_service = DIContainer.create_export_service(args.base_path)
+    if args.profile:
+        profiling.start("export", args.profile)
+
+    # Arquivo: grava em .part e renomeia no final, nunca deixa arquivo truncado
+    parcial = None if to_stdout else destino.with_name(destino.name + ".part")
+    raw = sys.stdout.buffer if to_stdout else open(parcial, 'wb', buffering=READ_BUFFER)
+    inicio = time.perf_counter()
+    try:
+        logger.info(f"📦 Exportando {args.base_path} para {args.destino} ({fmt})")
+        with ArchiveWriter(raw, fmt, args.level, args.workers) as writer:
+            stats = await export_service.export(persistence_service, writer)
+        raw.flush()
+        if not to_stdout:
+            raw.close()
+            os.replace(parcial, destino)
+    except BaseException:
+        if not to_stdout:
+            raw.close()
+            parcial.unlink(missing_ok=True)
+        raise
+    finally:
+        if export_service.manifest is not None:
+            export_service.manifest.close()
+        profiling.stop()
+
+    elapsed = time.perf_counter() - inicio
+    saida = f" → {TextHelper.format_bytes(destino.stat().st_size)}" if destino else ""
+    logger.info(
+        f"✓ {stats['arquivos']} PDFs, {TextHelper.format_bytes(stats['bytes'])}{saida} em {elapsed:.1f}s "
+        f"({TextHelper.format_bytes(stats['bytes'] / max(elapsed, 1e-9))}/s)"
+    )
+    if stats['ausentes']:
+        logger.info(f"💡 {stats['ausentes']} poemas do catálogo sem PDF no disco (pessoa download)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(asyncio.run(main()))
@@ -0,0 +1,117 @@
+"""Main Extract - Extração de Texto dos PDFs Baixados"""
+
+import argparse
+import asyncio
+import logging
+from pathlib import Path
+from typing import List, Optional
+from config import DIContainer
+from src.infrastructure.text_extraction import EXTRACTORS
+from src.infrastructure.text_store import SqliteTextStore
+from src.utils import profiling
+from src.utils.logger import setup_logging
+
+# Configurar logging
+logger = setup_logging("extract", logging.INFO)
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Argumentos de linha de comando (argv: default sys.argv[1:])"""
+    parser = argparse.ArgumentParser(description="Extrai o texto dos PDFs em paralelo, só de arquivos novos ou alterados")
+    parser.add_argument(
+        "base_path",
+        type=Path,
+        nargs="?",
+        default=Path("arquivos_pessoa"),
+        help="Diretório dos PDFs (default: arquivos_pessoa)"
+    )
+    parser.add_argument(
+        "--catalog",
+        action="store_true",
+        help="Percorre o catálogo em vez do diretório e remove textos de poemas fora dele"
+    )
+    parser.add_argument(
+        "--backend",
+        choices=["auto", *EXTRACTORS],
+        default="auto",
+        help="Extrator de texto (default: auto, pdftotext > pypdf)"
+    )
+    parser.add_argument("--workers", type=int, default=None, help="Processos de extração (default: nº de CPUs)")
+    parser.add_argument("--force", action="store_true", help="Ignora o cache e extrai tudo novamente")
+    parser.add_argument(
+        "-o", "--output",
+        type=Path,
+        default=SqliteTextStore.DEFAULT_PATH,
+        help=f"Armazenamento dos textos (default: {SqliteTextStore.DEFAULT_PATH})"
+    )
+    parser.add_argument("--show", type=int, default=None, metavar="ID", help="Imprime o texto de um poema e sai")
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="time",
+        choices=profiling.MODES,
+        default=None,
+        help="Mede wall/CPU por fase e chamada; 'cprofile' ou 'sample' adicionam profiler (relatório em output/profiles/)"
+    )
+    return parser.parse_args(argv)
+
+
+async def main(argv: Optional[List[str]] = None) -> int:
+    """Orquestração da extração"""
+    args = parse_args(argv)
+
+    if args.show is not None:
+        with SqliteTextStore(args.output) as store:
+            texto = store.get(args.show)
+        if texto is None:
+            logger.error(f"❌ Poema {args.show} sem texto extraído em {args.output}")
+            return 1
+        print(texto)
+        return 0
+
+    if not args.base_path.exists():
+        logger.error(f"❌ Diretório não encontrado: {args.base_path}")
+        return 1
+
+    if args.profile:
+        profiling.start("extract", args.profile)
+    try:
+        extraction_service = DIContainer.create_extraction_service(
+            args.base_path, args.output, args.backend, args.workers
+        )
+        logger.info(
+            f"📄 Extraindo com {extraction_service.extractor} "
+            f"({extraction_service.max_workers} processos)"
+        )
+
+        profiling.phase("Candidatos")
+        if args.catalog:
+            persistence_service = DIContainer.create_catalog_reader()
+            candidates = {}
+            async for categoria in persistence_service.iter_categorias():
+                for poema_id, paths in extraction_service.candidates_from_categorias([categoria]).items():
+                    candidates.setdefault(poema_id, []).extend(paths)
+            logger.info(f"✓ {len(candidates)} poemas no catálogo {persistence_service.default_path}")
+        else:
+            candidates = extraction_service.candidates_from_archive()
+            logger.info(f"✓ {len(candidates)} poemas com PDF em {args.base_path}")
+
+        profiling.phase("Extração")
+        with extraction_service.store:
+            extraction_service.run(candidates, force=args.force, prune=args.catalog)
+        if extraction_service.manifest is not None:
+            extraction_service.manifest.close()
+    except ImportError as e:
+        logger.error(f"❌ {e}")
+        return 1
+    except FileNotFoundError as e:
+        logger.error(f"❌ {e}")
+        logger.info("💡 Execute primeiro: pessoa scrape")
+        return 1
+    finally:
+        profiling.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(asyncio.run(main()))
@@ -0,0 +1,110 @@
+"""Main Metadata - Metadados das Páginas /textos/{id}"""
+
+import argparse
+import asyncio
+import json
+import logging
+from pathlib import Path
+from typing import List, Optional, Set
+from config import DIContainer
+from src.infrastructure.ledger import RequestLedger
+from src.infrastructure.metadata_store import SqliteMetadataStore
+from src.utils import profiling
+from src.utils.logger import setup_logging
+
+# Configurar logging
+logger = setup_logging("metadata", logging.INFO)
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Argumentos de linha de comando (argv: default sys.argv[1:])"""
+    parser = argparse.ArgumentParser(
+        description="Busca data, heterónimo, fonte e notas de cada poema, só para IDs novos ou vencidos"
+    )
+    parser.add_argument("--concurrency", type=int, default=4, help="Requisições simultâneas (default: 4)")
+    parser.add_argument("--rate", type=float, default=1.0, help="Máximo de requisições por segundo (default: 1.0)")
+    parser.add_argument(
+        "--max-age",
+        type=float,
+        default=30.0,
+        help="Dias até os metadados de um poema vencerem (default: 30)"
+    )
+    parser.add_argument("--force", action="store_true", help="Busca todos os poemas, ignorando a idade")
+    parser.add_argument("--limit", type=int, default=None, help="Máximo de páginas nesta execução")
+    parser.add_argument(
+        "--base-url",
+        default=None,
+        help="Servidor alternativo (ex.: http://127.0.0.1:8081 com benchmarks/stub_site.py)"
+    )
+    parser.add_argument(
+        "-o", "--output",
+        type=Path,
+        default=SqliteMetadataStore.DEFAULT_PATH,
+        help=f"Armazenamento dos metadados (default: {SqliteMetadataStore.DEFAULT_PATH})"
+    )
+    parser.add_argument("--show", type=int, default=None, metavar="ID", help="Imprime os metadados de um poema e sai")
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="time",
+        choices=profiling.MODES,
+        default=None,
+        help="Mede wall/CPU por fase e chamada; 'cprofile' ou 'sample' adicionam profiler (relatório em output/profiles/)"
+    )
+    return parser.parse_args(argv)
+
+
+async def catalog_ids() -> Optional[Set[int]]:
+    """IDs distintos do catálogo (None se não há catálogo)"""
+    persistence_service = DIContainer.create_catalog_reader()
+    if not persistence_service.default_path.exists():
+        logger.error(f"❌ Catálogo não encontrado: {persistence_service.default_path}")
+        return None
+
+    return await persistence_service.poema_ids()
+
+
+async def main(argv: Optional[List[str]] = None) -> int:
+    """Orquestração do crawler de metadados"""
+    args = parse_args(argv)
+
+    if args.show is not None:
+        with SqliteMetadataStore(args.output) as store:
+            metadata = store.get(args.show)
+        if metadata is None:
+            logger.error(f"❌ Poema {args.show} sem metadados em {args.output}")
+            return 1
+        print(json.dumps(metadata.model_dump(), ensure_ascii=False, indent=2))
+        return 0
+
+    ids = await catalog_ids()
+    if ids is None:
+        logger.info("💡 Execute primeiro: pessoa scrape")
+        return 1
+
+    metadata_service = DIContainer.create_metadata_service(
+        args.output,
+        concurrency=args.concurrency,
+        rate=args.rate,
+        max_age_days=args.max_age,
+        base_url=args.base_url,
+        ledger_path=RequestLedger.DEFAULT_PATH
+    )
+    logger.info(
+        f"🌐 {len(ids)} poemas no catálogo; {args.concurrency} conexões, até {args.rate:g} req/s "
+        f"em {metadata_service.http_downloader.base_url}"
+    )
+
+    if args.profile:
+        profiling.start("metadata", args.profile)
+    try:
+        async with metadata_service.http_downloader:
+            with metadata_service.store:
+                stats = await metadata_service.run(ids, force=args.force, limit=args.limit)
+    finally:
+        profiling.stop()
+    return 1 if stats['erros'] and not (stats['atualizados'] or stats['inalterados']) else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(asyncio.run(main()))
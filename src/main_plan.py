@@ -0,0 +1,154 @@
+"""Main Plan - Plano de Download (HEAD nos Faltantes, Bytes, Duração e Disco)"""
+
+import argparse
+import asyncio
+import logging
+from pathlib import Path
+from typing import List, Optional, Tuple
+from config import DIContainer
+from src.application.plan_service import ORDENS, PlanService
+from src.domain.models import Poema
+from src.infrastructure.ledger import RequestLedger
+from src.utils.helpers import TextHelper
+from src.utils.logger import setup_logging
+
+# Configurar logging
+logger = setup_logging("plan", logging.INFO)
+
+DEFAULT_PLAN = Path("output/download_plan.json")
+
+# Mesmos delays de `pessoa download`, que executa o plano
+MIN_DELAY = 2.0
+MAX_DELAY = 2.3
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Argumentos de linha de comando (argv: default sys.argv[1:])"""
+    parser = argparse.ArgumentParser(
+        description="HEAD nos poemas faltantes: bytes, duração estimada e espaço em disco antes do download"
+    )
+    parser.add_argument(
+        "--categoria",
+        default=None,
+        help="Path de uma categoria: planeja apenas essa subárvore"
+    )
+    parser.add_argument(
+        "--order",
+        choices=ORDENS,
+        default="catalogo",
+        help="Ordem de execução: catalogo, menores ou maiores primeiro (default: catalogo)"
+    )
+    parser.add_argument(
+        "--prioridade",
+        action="append",
+        default=[],
+        metavar="CATEGORIA",
+        help="Path de categoria cujos poemas vão à frente (repetível, na ordem dada)"
+    )
+    parser.add_argument("--concurrency", type=int, default=8, help="HEADs simultâneos (default: 8)")
+    parser.add_argument("--rate", type=float, default=2.0, help="Máximo de requisições por segundo (default: 2.0)")
+    parser.add_argument(
+        "--base-url",
+        default=None,
+        help="Servidor alternativo (ex.: http://127.0.0.1:8081 com benchmarks/stub_site.py)"
+    )
+    parser.add_argument(
+        "-o", "--output",
+        type=Path,
+        default=DEFAULT_PLAN,
+        help=f"Arquivo do plano (default: {DEFAULT_PLAN})"
+    )
+    return parser.parse_args(argv)
+
+
+async def missing_poemas(base_path: Path, categoria_path: Optional[str]) -> Optional[List[Tuple[Poema, str]]]:
+    """Poemas faltantes (poema, categoria_path) na ordem do catálogo (None se não há catálogo)"""
+    persistence_service = DIContainer.create_catalog_reader()
+    if not persistence_service.default_path.exists():
+        logger.error(f"❌ Catálogo não encontrado: {persistence_service.default_path}")
+        return None
+
+    # Manifesto decide o que está baixado, como em `pessoa download`
+    with DIContainer.create_manifest(base_path) as manifest:
+        manifest.reconcile(base_path)
+        filter_service = DIContainer.create_filter_service(base_path, manifest=manifest)
+
+        faltantes: List[Tuple[Poema, str]] = []
+        if categoria_path:
+            categoria = await persistence_service.load_categoria(categoria_path)
+            if categoria is None:
+                logger.error(f"❌ Categoria não encontrada: {categoria_path}")
+                return None
+            cat_filtrada, _ = filter_service.plan_missing(categoria)
+            if cat_filtrada:
+                faltantes.extend(PlanService.collect(cat_filtrada))
+            return faltantes
+
+        # Streaming: uma categoria de primeiro nível em memória por vez
+        async for categoria in persistence_service.iter_categorias():
+            cat_filtrada, _ = filter_service.plan_missing(categoria)
+            if cat_filtrada:
+                faltantes.extend(PlanService.collect(cat_filtrada))
+        return faltantes
+
+async def main(argv: Optional[List[str]] = None) -> int:
+    """Monta o plano; retorna 1 se não houver catálogo ou espaço em disco"""
+    args = parse_args(argv)
+    base_path = Path("arquivos_pessoa")
+
+    faltantes = await missing_poemas(base_path, args.categoria)
+    if faltantes is None:
+        logger.info("💡 Execute primeiro: pessoa scrape")
+        return 1
+    if not faltantes:
+        logger.info("✅ Nenhum poema faltante encontrado!")
+        return 0
+
+    plan_service = DIContainer.create_plan_service(
+        base_path,
+        concurrency=args.concurrency,
+        rate=args.rate,
+        base_url=args.base_url,
+        ledger_path=RequestLedger.DEFAULT_PATH,
+        min_delay=MIN_DELAY,
+        max_delay=MAX_DELAY
+    )
+    logger.info(
+        f"📡 HEAD em {len(faltantes)} poemas faltantes ({plan_service.http_downloader.base_url}, "
+        f"{args.concurrency} conexões, até {args.rate:g} req/s)"
+    )
+    # Lido em streaming; só as amostras mais recentes ficam em memória
+    history = RequestLedger.read(RequestLedger.DEFAULT_PATH) if RequestLedger.DEFAULT_PATH.exists() else ()
+    async with plan_service.http_downloader:
+        plan = await plan_service.build(faltantes, args.order, args.prioridade, history)
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(plan.model_dump_json(indent=2), encoding='utf-8')
+
+    logger.info(f"📋 Plano: {len(plan.itens)} PDFs, {TextHelper.format_bytes(plan.total_bytes)} ({args.output})")
+    if plan.sem_tamanho:
+        logger.info(f"  {plan.sem_tamanho} sem Content-Length, estimados pela mediana")
+    if plan.ausentes:
+        logger.warning(f"⚠️  {len(plan.ausentes)} poemas com 404, fora do plano: {TextHelper.format_ranges(plan.ausentes)}")
+    erros = sum(1 for item in plan.itens if item.erro)
+    if erros:
+        logger.warning(f"⚠️  {erros} HEADs sem resposta conclusiva; ficam no plano")
+    logger.info(
+        f"⏱️  Duração estimada: {TextHelper.format_duration(plan.duracao_estimada)} "
+        f"(latência {plan.latencia_ms:.0f} ms, {TextHelper.format_bytes(plan.vazao_bytes_s)}/s por PDF, "
+        f"{plan.delay_medio:.2f}s entre downloads; fonte: {plan.fonte_vazao})"
+    )
+
+    if not plan.cabe_no_disco:
+        logger.error(
+            f"❌ Espaço insuficiente em {base_path}: {TextHelper.format_bytes(plan.espaco_livre)} livres, "
+            f"o plano precisa de {TextHelper.format_bytes(plan.total_bytes)}"
+        )
+        return 1
+    logger.info(f"💾 {TextHelper.format_bytes(plan.espaco_livre)} livres em disco")
+    logger.info(f"💡 Para executar: pessoa download --plan {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(asyncio.run(main()))
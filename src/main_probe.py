@@ -0,0 +1,104 @@
+"""Main Probe - Sondagem de IDs no Servidor contra o Catálogo"""
+
+import argparse
+import asyncio
+import logging
+from pathlib import Path
+from typing import List, Optional
+from config import DIContainer
+from src.infrastructure.ledger import RequestLedger
+from src.utils.helpers import TextHelper
+from src.utils.logger import setup_logging
+
+# Configurar logging
+logger = setup_logging("probe", logging.INFO)
+
+DEFAULT_REPORT = Path("output/probe_report.json")
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Argumentos de linha de comando (argv: default sys.argv[1:])"""
+    parser = argparse.ArgumentParser(
+        description="Procura, com HEAD nos PDFs, poemas que existem no servidor mas faltam no catálogo (sem browser)"
+    )
+    parser.add_argument("--concurrency", type=int, default=8, help="Sondagens simultâneas (default: 8)")
+    parser.add_argument("--rate", type=float, default=2.0, help="Máximo de requisições por segundo (default: 2.0)")
+    parser.add_argument(
+        "--beyond",
+        type=int,
+        default=1024,
+        help="Procura IDs até max+beyond acima do maior ID do catálogo (default: 1024)"
+    )
+    parser.add_argument("--dense", type=int, default=16, help="Lacunas até este tamanho são sondadas inteiras (default: 16)")
+    parser.add_argument(
+        "--min-span",
+        type=int,
+        default=256,
+        help="Lacunas até este tamanho sem nenhum acerto são dadas como vazias (default: 256)"
+    )
+    parser.add_argument("--exhaustive", action="store_true", help="Sonda todo ID fora do catálogo, sem amostragem")
+    parser.add_argument(
+        "--base-url",
+        default=None,
+        help="Servidor alternativo (ex.: http://127.0.0.1:8081 com benchmarks/stub_site.py)"
+    )
+    parser.add_argument(
+        "--json",
+        type=Path,
+        default=DEFAULT_REPORT,
+        help=f"Relatório em JSON (default: {DEFAULT_REPORT})"
+    )
+    return parser.parse_args(argv)
+
+
+async def main(argv: Optional[List[str]] = None) -> int:
+    """Sonda o espaço de IDs; retorna 1 se houver poemas fora do catálogo"""
+    args = parse_args(argv)
+
+    persistence_service = DIContainer.create_catalog_reader()
+    if not persistence_service.default_path.exists():
+        logger.error(f"❌ Catálogo não encontrado: {persistence_service.default_path}")
+        logger.info("💡 Execute primeiro: pessoa scrape")
+        return 1
+    ids = await persistence_service.poema_ids()
+
+    discovery_service = DIContainer.create_discovery_service(
+        concurrency=args.concurrency,
+        rate=args.rate,
+        base_url=args.base_url,
+        ledger_path=RequestLedger.DEFAULT_PATH,
+        dense_span=args.dense,
+        min_span=args.min_span,
+        beyond=args.beyond,
+        exhaustive=args.exhaustive
+    )
+    logger.info(
+        f"🔭 Sondando IDs em {discovery_service.http_downloader.base_url} "
+        f"({len(ids)} poemas no catálogo, até {args.rate:g} req/s)"
+    )
+    async with discovery_service.http_downloader:
+        report = await discovery_service.probe(ids)
+
+    args.json.parent.mkdir(parents=True, exist_ok=True)
+    args.json.write_text(report.model_dump_json(indent=2), encoding='utf-8')
+
+    logger.info(
+        f"✓ {report.sondagens} sondagens em {report.duracao:.1f}s; limite superior {report.limite_superior}, "
+        f"{len(report.faixas_vazias)} faixas presumidas vazias"
+    )
+    if report.erros:
+        logger.warning(f"⚠️  {len(report.erros)} IDs sem resposta conclusiva: {TextHelper.format_ranges(report.erros)}")
+    if not report.fora_do_catalogo:
+        logger.info("✅ Nenhum poema fora do catálogo")
+        return 0
+
+    logger.warning(
+        f"⚠️  {len(report.fora_do_catalogo)} poemas no servidor fora do catálogo: "
+        f"{TextHelper.format_ranges(report.fora_do_catalogo)}"
+    )
+    logger.info(f"💡 Relatório em {args.json}; reexecute o scrape (pessoa scrape) para completar o catálogo")
+    return 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(asyncio.run(main()))
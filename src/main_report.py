@@ -0,0 +1,78 @@
+"""Main Report - Relatório do Ledger de Requisições HTTP"""
+
+import argparse
+import logging
+from pathlib import Path
+from typing import List, Optional
+from config import DIContainer
+from src.infrastructure.ledger import RequestLedger
+from src.utils.logger import setup_logging
+
+# Configurar logging
+logger = setup_logging("report", logging.INFO)
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Argumentos de linha de comando (argv: default sys.argv[1:])"""
+    parser = argparse.ArgumentParser(description="Percentis, vazão e erros das execuções de download")
+    parser.add_argument(
+        "ledger",
+        type=Path,
+        nargs="?",
+        default=RequestLedger.DEFAULT_PATH,
+        help=f"Ledger de requisições (default: {RequestLedger.DEFAULT_PATH})"
+    )
+    parser.add_argument(
+        "--run",
+        action="append",
+        default=None,
+        help="Restringe a uma execução (repetível); 'last' seleciona a mais recente"
+    )
+    parser.add_argument(
+        "--recurso",
+        action="append",
+        choices=["pdf", "pagina", "head"],
+        default=None,
+        help="Restringe a um tipo de requisição (repetível; default: todos)"
+    )
+    parser.add_argument("--bucket", type=int, default=60, help="Janela da série de vazão, em segundos")
+    parser.add_argument("--top", type=int, default=10, help="Quantas categorias mais lentas listar")
+    parser.add_argument("--json", type=Path, default=None, help="Grava também o relatório em JSON")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None):
+    """Gera o relatório a partir do ledger"""
+    args = parse_args(argv)
+
+    if not args.ledger.exists():
+        logger.error(f"❌ Ledger não encontrado: {args.ledger}")
+        logger.info("💡 Execute primeiro: python -m src.main_download")
+        return
+
+    runs = set(args.run) if args.run else None
+    if runs and "last" in runs:
+        ultima = None
+        for record in RequestLedger.read(args.ledger):
+            ultima = record.run_id
+        runs = (runs - {"last"}) | ({ultima} if ultima else set())
+
+    report_service = DIContainer.create_report_service()
+    report = report_service.build(
+        RequestLedger.read(args.ledger),
+        runs=runs,
+        bucket_seconds=args.bucket,
+        top_categorias=args.top,
+        recursos=set(args.recurso) if args.recurso else None
+    )
+
+    print(report_service.format_report(report))
+
+    if args.json:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        args.json.write_text(report.model_dump_json(indent=2), encoding='utf-8')
+        logger.info(f"✓ Relatório salvo em {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,20 +1,51 @@
 """Main Scraper - Script Principal de Scraping com Clean Architecture"""
 
+import argparse
 import asyncio
 import logging
+import time
 
 from pathlib import Path
+from typing import List, Optional
 from config import DIContainer
 from src.application.progress_tracker import ProgressTracker
+from src.infrastructure.journal import CatalogJournal
+from src.infrastructure.ledger import RequestLedger
+from src.infrastructure import compressed_io
+from src.utils import profiling
 from src.utils.logger import setup_logging
 
 # Configurar logging
 logger = setup_logging("scraper", logging.INFO)
 
 
-async def main():
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Argumentos de linha de comando (argv: default sys.argv[1:])"""
+    parser = argparse.ArgumentParser(description="Scraping do índice e download dos PDFs")
+    parser.add_argument(
+        "--format",
+        choices=("json", "binary", "sqlite"),
+        default="binary",
+        help="Cópia do catálogo gravada além do JSON: binary (default, leitura lazy), "
+             "sqlite (upserts incrementais; use `pessoa download --format sqlite`) ou json (nenhuma)"
+    )
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="time",
+        choices=profiling.MODES,
+        default=None,
+        help="Mede wall/CPU por fase e chamada; 'cprofile' ou 'sample' adicionam profiler (relatório em output/profiles/)"
+    )
+    return parser.parse_args(argv)
+
+
+async def main(argv: Optional[List[str]] = None):
     """Orquestração principal do scraper"""
-    
+    args = parse_args(argv)
+    if args.profile:
+        profiling.start("scraper", args.profile)
+
     logger.info("🚀 Iniciando scraper do Arquivo Pessoa (Clean Architecture)")
     
     try:
@@ -22,25 +53,83 @@ async def main():
         logger.info("\n" + "="*60)
         logger.info("FASE 1: Web Scraping e Extração de Estrutura")
         logger.info("="*60)
+        profiling.phase("FASE 1: Web Scraping e Extração de Estrutura")
+
+        catalog_path = Path("output/categorias_estrutura.json")
+        journal_path = Path("output/categorias_estrutura.journal.jsonl")
+        persistence_service = DIContainer.create_persistence_service(compression="auto")
 
-        scraper_service = DIContainer.create_scraper_service(headless=False)
-        async with scraper_service.browser:
-            catalog = await scraper_service.fetch_and_extract_structure()
+        # Journal completo de uma execução interrompida: dispensa o browser.
+        # Incompleto, mas com o snapshot do HTML expandido: refaz só o parsing
+        retomar = False
+        snapshot_path = None
+        if journal_path.exists():
+            parcial, retomar = persistence_service.replay_journal(journal_path)
+            if retomar:
+                logger.info(f"♻️ Retomando do journal: {parcial.total_poemas} poemas já descobertos")
+            else:
+                snapshot_path = CatalogJournal.snapshot_of(journal_path)
+                if snapshot_path:
+                    logger.info(
+                        f"♻️ Journal incompleto ({parcial.total_poemas} poemas); "
+                        f"refazendo o parsing de {snapshot_path}"
+                    )
+                else:
+                    logger.warning(f"⚠️ Journal incompleto ({parcial.total_poemas} poemas) sem snapshot; refazendo scraping")
+
+        if not retomar:
+            scraper_service = DIContainer.create_scraper_service(headless=False)
+            # Journal em append: o replay ignora descobertas repetidas
+            with CatalogJournal(journal_path) as journal:
+                if snapshot_path:
+                    await scraper_service.extract_from_snapshot(snapshot_path, journal)
+                else:
+                    codec = compressed_io.resolve_codec("auto")
+                    snapshot_path = Path("output/snapshots") / (
+                        f"indice-{time.strftime('%Y%m%d-%H%M%S')}.html{compressed_io.SUFFIXES[codec]}"
+                    )
+                    async with scraper_service.browser:
+                        await scraper_service.fetch_and_extract_structure(journal, snapshot_path)
 
         # Fase 2: Persistência de Estrutura
         logger.info("\n" + "="*60)
         logger.info("FASE 2: Persistência de Estrutura")
         logger.info("="*60)
+        profiling.phase("FASE 2: Persistência de Estrutura")
+
+        anterior = None
+        if catalog_path.exists():
+            anterior = await persistence_service.load_catalog()
+
+        # Consolida o journal no catálogo (o journal é removido em seguida)
+        catalog = await persistence_service.compact_journal(journal_path, catalog_path)
+
+        # Comparar com o snapshot anterior
+        if anterior is not None:
+            diff_service = DIContainer.create_diff_service()
+            diff = diff_service.diff(anterior, catalog)
+            diff_service.save_diff(diff, Path("output/catalog_diff.json"))
 
-        persistence_service = DIContainer.create_persistence_service()
-        await persistence_service.save_catalog(catalog, Path("arquivos_pessoa"))
+        # Cópia binária (leitura lazy por main_download --categoria) ou
+        # SQLite (pendentes em SQL por main_download --format sqlite)
+        if args.format != "json":
+            copy_service = DIContainer.create_persistence_service(format=args.format)
+            await copy_service.save_catalog(catalog, None)
 
         # Fase 3: Download de PDFs
         logger.info("\n" + "="*60)
         logger.info("FASE 3: Download de Arquivos PDF")
         logger.info("="*60)
+        profiling.phase("FASE 3: Download de Arquivos PDF")
 
-        download_service = DIContainer.create_download_service(Path("arquivos_pessoa"), min_delay=2.0, max_delay=2.3)
+        base_path = Path("arquivos_pessoa")
+        download_service = DIContainer.create_download_service(
+            base_path,
+            min_delay=2.0,
+            max_delay=2.3,
+            manifest=DIContainer.create_manifest(base_path),
+            ledger_path=RequestLedger.DEFAULT_PATH
+        )
         async with download_service.http_downloader:
             # Criar rastreador de progresso
             progress_tracker = ProgressTracker(catalog.total_poemas)
@@ -59,6 +148,8 @@ async def main():
     except Exception as e:
         logger.error(f"❌ Erro fatal: {e}", exc_info=True)
         raise
+    finally:
+        profiling.stop()
 
 
 if __name__ == "__main__":
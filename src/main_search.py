@@ -0,0 +1,73 @@
+"""Main Search - Busca no Catálogo e nos Textos Extraídos"""
+
+import argparse
+import asyncio
+import json
+import logging
+import time
+from typing import List, Optional
+from config import DIContainer
+from src.infrastructure.text_store import SqliteTextStore
+from src.utils.helpers import TextHelper
+from src.utils.logger import setup_logging
+
+# Configurar logging
+logger = setup_logging("search", logging.INFO)
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Argumentos de linha de comando (argv: default sys.argv[1:])"""
+    parser = argparse.ArgumentParser(description="Busca poemas por título (aproximada) ou no texto")
+    parser.add_argument("consulta", nargs="*", help="Termos da busca (acentos e caixa são ignorados)")
+    parser.add_argument("--texto", action="store_true", help="Busca no texto extraído (pessoa extract)")
+    parser.add_argument("--limit", type=int, default=20, help="Máximo de resultados (default: 20)")
+    parser.add_argument("--json", action="store_true", help="Resultados em JSON")
+    parser.add_argument(
+        "--reindex",
+        action="store_true",
+        help="Relê catálogo e textos mesmo sem mudança nos arquivos"
+    )
+    return parser.parse_args(argv)
+
+
+async def main(argv: Optional[List[str]] = None) -> int:
+    """Atualiza o índice, se preciso, e busca"""
+    args = parse_args(argv)
+    search_service = DIContainer.create_search_service()
+
+    with search_service.index:
+        # Índice incremental: só relê o que mudou desde a última busca
+        persistence_service = DIContainer.create_catalog_reader()
+        if persistence_service.default_path.exists():
+            await search_service.update_catalog(persistence_service, force=args.reindex)
+        elif not len(search_service.index):
+            logger.error(f"❌ Catálogo não encontrado: {persistence_service.default_path}")
+            logger.info("💡 Execute primeiro: pessoa scrape")
+            return 1
+        search_service.update_texts(SqliteTextStore.DEFAULT_PATH, force=args.reindex)
+
+        consulta = " ".join(args.consulta)
+        if not consulta:
+            logger.info(f"✓ Índice atualizado: {len(search_service.index)} poemas")
+            return 0
+
+        inicio = time.perf_counter()
+        hits = search_service.search(consulta, args.limit, texto=args.texto)
+        elapsed_ms = (time.perf_counter() - inicio) * 1000
+
+    if args.json:
+        print(json.dumps([hit.model_dump() for hit in hits], ensure_ascii=False, indent=2))
+        return 0
+
+    for hit in hits:
+        categoria = hit.categorias[0] if hit.categorias else "-"
+        extra = f" (+{len(hit.categorias) - 1})" if len(hit.categorias) > 1 else ""
+        print(f"{hit.poema_id:>6}  {hit.score:6.2f}  {TextHelper.truncate(hit.titulo, 50):<50}  {categoria}{extra}")
+        if hit.trecho:
+            print(f"{'':>16}{hit.trecho}")
+    print(f"\n{len(hits)} resultados em {elapsed_ms:.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(asyncio.run(main()))
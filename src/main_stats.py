@@ -0,0 +1,113 @@
+"""Main Stats - Resumo do Catálogo, dos Downloads e do Ledger"""
+
+import argparse
+import asyncio
+import logging
+from pathlib import Path
+from typing import List, Optional, Set
+from config import DIContainer
+from src.infrastructure.ledger import RequestLedger
+from src.utils.helpers import TextHelper
+from src.utils.logger import setup_logging
+
+# Configurar logging
+logger = setup_logging("stats", logging.INFO)
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Argumentos de linha de comando (argv: default sys.argv[1:])"""
+    parser = argparse.ArgumentParser(description="Totais do catálogo, PDFs baixados e tentativas HTTP")
+    parser.add_argument(
+        "--base-path",
+        type=Path,
+        default=Path("arquivos_pessoa"),
+        help="Diretório dos PDFs (default: arquivos_pessoa)"
+    )
+    parser.add_argument(
+        "--ledger",
+        type=Path,
+        default=RequestLedger.DEFAULT_PATH,
+        help=f"Ledger de requisições (default: {RequestLedger.DEFAULT_PATH})"
+    )
+    return parser.parse_args(argv)
+
+
+async def catalog_stats(linhas: List[str]) -> Set[int]:
+    """Acrescenta os totais do catálogo e devolve os IDs de poemas"""
+    persistence_service = DIContainer.create_catalog_reader()
+    if not persistence_service.default_path.exists():
+        linhas.append("Catálogo: não encontrado (execute o scrape)")
+        return set()
+
+    raizes = categorias = ocorrencias = 0
+    ids: Set[int] = set()
+    async for categoria in persistence_service.iter_categorias():
+        raizes += 1
+        categorias += 1 + categoria.total_subcategorias
+        ocorrencias += categoria.total_poemas
+        stack = [categoria]
+        while stack:
+            atual = stack.pop()
+            ids.update(poema.id for poema in atual.poemas)
+            stack.extend(atual.subcategorias)
+
+    linhas.append(f"Catálogo: {persistence_service.default_path}")
+    linhas.append(f"  {raizes} categorias raiz, {categorias} categorias")
+    linhas.append(f"  {len(ids)} poemas distintos ({ocorrencias} ocorrências)")
+    return ids
+
+
+def manifest_stats(linhas: List[str], base_path: Path, catalogo: Set[int]) -> None:
+    """Acrescenta os totais do manifesto de downloads"""
+    if not (base_path / ".manifest.db").exists():
+        linhas.append(f"Downloads: sem manifesto em {base_path}")
+        return
+
+    with DIContainer.create_manifest(base_path) as manifest:
+        arquivos = 0
+        total_bytes = 0
+        ids: Set[int] = set()
+        for entry in manifest.entries():
+            arquivos += 1
+            total_bytes += entry.size
+            ids.add(entry.poema_id)
+
+    linhas.append(f"Downloads: {base_path}")
+    linhas.append(f"  {arquivos} arquivos, {len(ids)} poemas distintos, {TextHelper.format_bytes(total_bytes)}")
+    if catalogo:
+        faltantes = len(catalogo - ids)
+        linhas.append(f"  {faltantes} poemas do catálogo sem PDF ({100 * (1 - faltantes / len(catalogo)):.1f}% completo)")
+
+
+def ledger_stats(linhas: List[str], ledger_path: Path) -> None:
+    """Acrescenta os totais do ledger de requisições"""
+    if not ledger_path.exists():
+        linhas.append("Ledger: vazio")
+        return
+
+    runs: dict = {}
+    tentativas = falhas = 0
+    for record in RequestLedger.read(ledger_path):
+        runs.setdefault(record.run_id)
+        tentativas += 1
+        if not record.ok:
+            falhas += 1
+
+    ultima = next(reversed(runs), "-")
+    linhas.append(f"Ledger: {ledger_path}")
+    linhas.append(f"  {len(runs)} execuções (última: {ultima}), {tentativas} tentativas, {falhas} falhas")
+
+
+async def main(argv: Optional[List[str]] = None):
+    """Imprime o resumo; não abre browser nem rede"""
+    args = parse_args(argv)
+
+    linhas: List[str] = []
+    ids = await catalog_stats(linhas)
+    manifest_stats(linhas, args.base_path, ids)
+    ledger_stats(linhas, args.ledger)
+    print("\n".join(linhas))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,72 @@
+"""Main Verify - Verificação dos PDFs Baixados contra o Manifesto"""
+
+import argparse
+import logging
+from pathlib import Path
+from typing import List, Optional
+from config import DIContainer
+from src.utils.logger import setup_logging
+
+# Configurar logging
+logger = setup_logging("verify", logging.INFO)
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Argumentos de linha de comando (argv: default sys.argv[1:])"""
+    parser = argparse.ArgumentParser(description="Confere os PDFs no disco contra o manifesto de downloads")
+    parser.add_argument(
+        "base_path",
+        type=Path,
+        nargs="?",
+        default=Path("arquivos_pessoa"),
+        help="Diretório dos PDFs (default: arquivos_pessoa)"
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Re-hasheia todos os arquivos, não só os com tamanho/mtime alterados"
+    )
+    parser.add_argument(
+        "--no-adopt",
+        action="store_true",
+        help="Não incorpora PDFs íntegros que ainda não estão no manifesto"
+    )
+    parser.add_argument("--workers", type=int, default=8, help="Threads para hashing")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Reconcilia o manifesto com o disco.
+
+    Returns:
+        Código de saída: 1 se algum arquivo registrado sumiu ou não confere
+    """
+    args = parse_args(argv)
+
+    if not args.base_path.exists():
+        logger.error(f"❌ Diretório não encontrado: {args.base_path}")
+        return 1
+
+    with DIContainer.create_manifest(args.base_path) as manifest:
+        stats = manifest.reconcile(
+            args.base_path,
+            adopt=not args.no_adopt,
+            max_workers=args.workers,
+            full=args.full
+        )
+        total = len(manifest)
+
+    if stats['removidos']:
+        logger.warning(
+            f"⚠️ {stats['removidos']} arquivos ausentes ou corrompidos voltaram a ser faltantes; "
+            f"execute o download para recuperá-los"
+        )
+        return 1
+
+    logger.info(f"✅ {total} arquivos conferem com o manifesto")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
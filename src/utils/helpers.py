@@ -1,12 +1,16 @@
 """Utils Helpers - Funções Auxiliares Utilitárias"""
 
 import logging
+import re
+import unicodedata
 from pathlib import Path
-from typing import List
+from typing import Iterable, List, Set
 from src.domain.models import Categoria
 
 logger = logging.getLogger(__name__)
 
+_NON_WORD = re.compile(r'[\W_]+')
+
 
 class PathHelper:
     """Helper para operações com caminhos"""
@@ -70,15 +74,7 @@ class CategoryHelper:
         Returns:
             Profundidade (0 se sem subcategorias)
         """
-        if not categoria.subcategorias:
-            return 0
-
-        max_depth = 0
-        for subcat in categoria.subcategorias:
-            depth = 1 + CategoryHelper.get_depth(subcat)
-            max_depth = max(max_depth, depth)
-
-        return max_depth
+        return categoria.depth
 
     @staticmethod
     def print_tree(categoria: Categoria, indent: int = 0) -> None:
@@ -137,3 +133,87 @@ class TextHelper:
         if len(text) > max_length:
             return text[:max_length - 3] + "..."
         return text
+
+    @staticmethod
+    def format_ranges(ids: Iterable[int]) -> str:
+        """
+        Compacta IDs em faixas.
+
+        Args:
+            ids: IDs (qualquer ordem)
+
+        Returns:
+            Texto como "3-5, 9, 12-13"
+        """
+        faixas: List[List[int]] = []
+        for poema_id in sorted(set(ids)):
+            if faixas and poema_id == faixas[-1][1] + 1:
+                faixas[-1][1] = poema_id
+            else:
+                faixas.append([poema_id, poema_id])
+        return ", ".join(str(lo) if lo == hi else f"{lo}-{hi}" for lo, hi in faixas)
+
+    @staticmethod
+    def format_bytes(size: float) -> str:
+        """
+        Formata tamanho em bytes com unidade legível.
+
+        Args:
+            size: Tamanho em bytes
+
+        Returns:
+            Texto como "1.5 MB"
+        """
+        if abs(size) < 1024:
+            return f"{size:.0f} B"
+        for unit in ("KB", "MB"):
+            size /= 1024
+            if abs(size) < 1024:
+                return f"{size:.1f} {unit}"
+        return f"{size / 1024:.1f} GB"
+
+    @staticmethod
+    def format_duration(seconds: float) -> str:
+        """
+        Formata duração em segundos como H:MM:SS.
+
+        Args:
+            seconds: Duração em segundos
+
+        Returns:
+            Texto como "0:05:42"
+        """
+        seconds = int(max(0, seconds))
+        return f"{seconds // 3600}:{seconds % 3600 // 60:02d}:{seconds % 60:02d}"
+
+    @staticmethod
+    def normalize_search(text: str) -> str:
+        """
+        Normaliza texto para busca: sem acentos, minúsculo, só letras e dígitos.
+
+        Args:
+            text: Texto original
+
+        Returns:
+            Palavras separadas por um espaço ("Ode Marítima!" -> "ode maritima")
+        """
+        decomposed = unicodedata.normalize('NFKD', text.casefold())
+        sem_acentos = ''.join(c for c in decomposed if not unicodedata.combining(c))
+        return ' '.join(word for word in _NON_WORD.split(sem_acentos) if word)
+
+    @staticmethod
+    def trigrams(normalized: str) -> Set[str]:
+        """
+        Trigramas de cada palavra com bordas, como no pg_trgm.
+
+        Args:
+            normalized: Texto já normalizado por normalize_search
+
+        Returns:
+            Conjunto de trigramas ("mar" -> {"  m", " ma", "mar", "ar "})
+        """
+        grams: Set[str] = set()
+        for word in normalized.split():
+            padded = f"  {word} "
+            grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+        return grams
@@ -1,52 +1,176 @@
-"""Utils Logger - Configuração Centralizada de Logging"""
+"""Utils Logger - Configuração Centralizada de Logging
 
+Os handlers de saída rodam em uma thread própria (QueueListener): o código
+que loga, inclusive no event loop, só enfileira o registro. Formatação e
+I/O de console/arquivo não bloqueiam downloads concorrentes.
+"""
+
+import atexit
+import copy
+import json
 import logging
+import logging.handlers
+import queue
 import sys
+from datetime import datetime, timezone
 from pathlib import Path
+from typing import Dict, Optional
+
+TEXT_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# Bibliotecas que logam cada requisição em INFO
+_NOISY_LOGGERS = ('httpx', 'httpcore')
+
+# Atributos padrão de LogRecord; o resto veio de extra={...}
+_RESERVED = set(vars(logging.LogRecord('', 0, '', 0, '', None, None))) | {'message', 'asctime', 'taskName'}
+
+_queue_handler: Optional[logging.handlers.QueueHandler] = None
+_listener: Optional[logging.handlers.QueueListener] = None
+_handlers: Dict[str, logging.Handler] = {}
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    Formata cada registro como uma linha JSON.
+
+    Campos passados em extra (ex.: poem_id, bytes, latency_ms) viram
+    chaves do objeto.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            'ts': datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'msg': record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RESERVED and not key.startswith('_'):
+                payload[key] = value
+        if record.exc_info:
+            payload['exc'] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            # Traceback já renderizado pelo _QueueHandler
+            payload['exc'] = record.exc_text
+        if record.stack_info:
+            payload['stack'] = self.formatStack(record.stack_info)
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+class _QueueHandler(logging.handlers.QueueHandler):
+    """
+    Enfileira o registro sem formatá-lo.
+
+    O prepare() padrão aplica um formatter de texto e anexa o traceback à
+    mensagem, apagando exc_info: o JsonFormatter do listener nunca veria a
+    exceção. Aqui a mensagem é só interpolada e o traceback vai renderizado
+    em exc_text (sem reter frames na fila); cada formatter decide onde
+    colocá-lo.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = record.exc_text or _TRACEBACK_FORMATTER.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+_TRACEBACK_FORMATTER = logging.Formatter()
+
+
+def _formatter(json_format: bool) -> logging.Formatter:
+    return JsonFormatter() if json_format else logging.Formatter(TEXT_FORMAT, datefmt=DATE_FORMAT)
+
+
+def _start_listener() -> None:
+    """Reinicia o listener com o conjunto atual de handlers"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+    _listener = logging.handlers.QueueListener(
+        _queue_handler.queue, *_handlers.values(), respect_handler_level=True
+    )
+    _listener.start()
 
 
 def setup_logging(
     name: str,
     level: int = logging.INFO,
-    log_file: Path = None
+    log_file: Path = None,
+    json_format: bool = False
 ) -> logging.Logger:
     """
     Configura logging centralizado para a aplicação.
-    
+
+    Idempotente: o QueueHandler é instalado uma única vez no logger raiz
+    (todos os módulos propagam para ele); chamadas seguintes só ajustam
+    nível e formato, ou acrescentam um arquivo ainda não configurado.
+
     Args:
         name: Nome do logger (tipicamente __name__)
         level: Nível de logging (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_file: Caminho para arquivo de log (opcional)
-        
+        json_format: Uma linha JSON por registro, com os campos de extra
+
     Returns:
         Logger configurado
     """
-    logger = logging.getLogger(name)
-    logger.setLevel(level)
+    global _queue_handler
+    root = logging.getLogger()
+    formatter = _formatter(json_format)
+    restart = _listener is None
 
-    # Formato de log
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
+    if _queue_handler is None:
+        _queue_handler = _QueueHandler(queue.SimpleQueue())
+        root.addHandler(_queue_handler)
+        atexit.register(shutdown_logging)
 
-    # Handler para console
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(level)
-    console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+        # Handler para console
+        console_handler = logging.StreamHandler(sys.stdout)
+        _handlers['console'] = console_handler
 
     # Handler para arquivo (opcional)
-    if log_file:
+    if log_file and str(log_file) not in _handlers:
         log_file.parent.mkdir(parents=True, exist_ok=True)
-        file_handler = logging.FileHandler(log_file, encoding='utf-8')
-        file_handler.setLevel(level)
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        _handlers[str(log_file)] = logging.FileHandler(log_file, encoding='utf-8')
+        restart = True
+
+    for handler in _handlers.values():
+        handler.setFormatter(formatter)
+        handler.setLevel(level)
+    root.setLevel(level)
+    for noisy in _NOISY_LOGGERS:
+        logging.getLogger(noisy).setLevel(max(level, logging.WARNING))
+
+    if restart:
+        _start_listener()
 
+    logger = logging.getLogger(name)
+    logger.setLevel(level)
     return logger
 
 
+def redirect_console(stream) -> None:
+    """Troca o destino do console (ex.: stderr quando stdout carrega dados)"""
+    handler = _handlers.get('console')
+    if handler is not None:
+        handler.setStream(stream)
+
+
+def shutdown_logging() -> None:
+    """Descarrega a fila e para a thread de logging (registrado em atexit)"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+    for handler in _handlers.values():
+        handler.flush()
+
+
 def get_logger(name: str) -> logging.Logger:
     """Obtém logger existente ou cria novo"""
     return logging.getLogger(name)
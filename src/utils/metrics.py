@@ -0,0 +1,343 @@
+"""Utils Metrics - Contadores, Gauges e Histogramas no Formato Prometheus"""
+
+import logging
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager, nullcontext
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float('inf'):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class _NoopChild:
+    """Filho inerte devolvido por labels() com métricas desabilitadas"""
+
+    def inc(self, amount: float = 1) -> None:
+        pass
+
+    def dec(self, amount: float = 1) -> None:
+        pass
+
+    def set(self, value: float) -> None:
+        pass
+
+    def observe(self, value: float) -> None:
+        pass
+
+    def time(self):
+        return nullcontext()
+
+
+_NOOP = _NoopChild()
+
+
+class _Metric(ABC):
+    """Base: série por combinação de labels, criada sob demanda"""
+
+    kind = ""
+
+    def __init__(self, registry: "MetricsRegistry", name: str, documentation: str, labelnames: Sequence[str]):
+        self._registry = registry
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._children: Dict[Tuple[str, ...], object] = {}
+
+    @abstractmethod
+    def _new_child(self):
+        """Série nova, zerada"""
+        pass
+
+    def labels(self, *values, **kwargs):
+        """
+        Série com os valores de label informados.
+
+        Returns:
+            Filho com inc/dec/set/observe; inerte se métricas desabilitadas
+        """
+        if not self._registry.enabled:
+            return _NOOP
+        if kwargs:
+            values = tuple(str(kwargs[name]) for name in self.labelnames)
+        else:
+            values = tuple(str(value) for value in values)
+        child = self._children.get(values)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(values, self._new_child())
+        return child
+
+    def _default(self):
+        return self.labels() if not self.labelnames else _NOOP
+
+    @property
+    def family(self) -> str:
+        """Nome da família nas linhas HELP/TYPE (o das amostras, sem sufixo de série)"""
+        return self.name
+
+    @abstractmethod
+    def samples(self) -> Iterator[Tuple[str, str, float]]:
+        """(sufixo, labels formatados, valor) de cada série"""
+        pass
+
+
+class _CounterChild:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.value = 0.0
+
+    def inc(self, amount: float = 1) -> None:
+        with self._lock:
+            self.value += amount
+
+
+class Counter(_Metric):
+    """Contador monotônico (exposto com sufixo _total)"""
+
+    kind = "counter"
+
+    def _new_child(self):
+        return _CounterChild()
+
+    def inc(self, amount: float = 1) -> None:
+        self._default().inc(amount)
+
+    @property
+    def family(self) -> str:
+        # No formato 0.0.4 o TYPE nomeia a série: pessoa_x_total, como no prometheus_client
+        return f"{self.name}_total"
+
+    def samples(self):
+        for values, child in list(self._children.items()):
+            yield "_total", _format_labels(self.labelnames, values), child.value
+
+
+class _GaugeChild(_CounterChild):
+    def dec(self, amount: float = 1) -> None:
+        with self._lock:
+            self.value -= amount
+
+    def set(self, value: float) -> None:
+        with self._lock:
+            self.value = value
+
+
+class Gauge(_Metric):
+    """Valor que sobe e desce (ex.: requisições em andamento)"""
+
+    kind = "gauge"
+
+    def _new_child(self):
+        return _GaugeChild()
+
+    def inc(self, amount: float = 1) -> None:
+        self._default().inc(amount)
+
+    def dec(self, amount: float = 1) -> None:
+        self._default().dec(amount)
+
+    def set(self, value: float) -> None:
+        self._default().set(value)
+
+    def samples(self):
+        for values, child in list(self._children.items()):
+            yield "", _format_labels(self.labelnames, values), child.value
+
+
+class _HistogramChild:
+    def __init__(self, buckets: Sequence[float]):
+        self._lock = threading.Lock()
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        with self._lock:
+            self.sum += value
+            self.count += 1
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    self.counts[i] += 1
+                    break
+
+    @contextmanager
+    def time(self):
+        inicio = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - inicio)
+
+
+class Histogram(_Metric):
+    """Distribuição em buckets cumulativos, com soma e contagem"""
+
+    kind = "histogram"
+
+    def __init__(self, registry, name, documentation, labelnames, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(registry, name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (float('inf'),)
+
+    def _new_child(self):
+        return _HistogramChild(self.buckets)
+
+    def observe(self, value: float) -> None:
+        self._default().observe(value)
+
+    def time(self):
+        """Context manager que observa a duração do bloco"""
+        return self._default().time()
+
+    def samples(self):
+        for values, child in list(self._children.items()):
+            acumulado = 0
+            for bound, count in zip(child.buckets, child.counts):
+                acumulado += count
+                le = f'le="{_format_value(bound)}"'
+                yield "_bucket", _format_labels(self.labelnames, values, le), acumulado
+            yield "_sum", _format_labels(self.labelnames, values), child.sum
+            yield "_count", _format_labels(self.labelnames, values), child.count
+
+
+class MetricsRegistry:
+    """
+    Registro de métricas do processo.
+
+    Desabilitado por padrão: cada operação custa uma checagem de flag e
+    nenhuma série é criada. enable() liga a coleta.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    def enable(self) -> None:
+        """Liga a coleta de métricas"""
+        self.enabled = True
+
+    def _register(self, cls, name: str, documentation: str, labelnames: Sequence[str], **kwargs) -> _Metric:
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(self, name, documentation, labelnames, **kwargs)
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        """Registra (ou reutiliza) um contador"""
+        return self._register(Counter, name, documentation, labelnames)
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        """Registra (ou reutiliza) um gauge"""
+        return self._register(Gauge, name, documentation, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        """Registra (ou reutiliza) um histograma"""
+        return self._register(Histogram, name, documentation, labelnames, buckets=buckets)
+
+    def render(self) -> str:
+        """
+        Exposição no formato texto do Prometheus (0.0.4).
+
+        Returns:
+            Texto com HELP, TYPE e amostras de todas as métricas com dados
+        """
+        lines: List[str] = []
+        for metric in list(self._metrics.values()):
+            samples = list(metric.samples())
+            if not samples:
+                continue
+            lines.append(f"# HELP {metric.family} {metric.documentation}")
+            lines.append(f"# TYPE {metric.family} {metric.kind}")
+            for suffix, labels, value in samples:
+                lines.append(f"{metric.name}{suffix}{labels} {_format_value(value)}")
+        return "\n".join(lines) + "\n" if lines else ""
+
+    def write_textfile(self, filepath: Path) -> None:
+        """
+        Grava a exposição em arquivo (para o textfile collector do
+        node_exporter). Escrita em temporário + rename: o coletor nunca lê
+        arquivo pela metade.
+
+        Args:
+            filepath: Caminho do arquivo .prom
+        """
+        if not self.enabled:
+            return
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        temp = filepath.with_name(f"{filepath.name}.{os.getpid()}.tmp")
+        temp.write_text(self.render(), encoding='utf-8')
+        os.replace(temp, filepath)
+
+    def start_http_server(self, port: int, addr: str = "127.0.0.1") -> ThreadingHTTPServer:
+        """
+        Serve /metrics em uma thread daemon.
+
+        Args:
+            port: Porta local
+            addr: Endereço de bind (local por padrão)
+
+        Returns:
+            Servidor, para shutdown()
+        """
+        registry = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?')[0] not in ('/', '/metrics'):
+                    self.send_error(404)
+                    return
+                body = registry.render().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                logger.debug(format % args)
+
+        self.enable()
+        self._server = ThreadingHTTPServer((addr, port), Handler)
+        threading.Thread(target=self._server.serve_forever, daemon=True, name="metrics-http").start()
+        logger.info(f"📈 Métricas em http://{addr}:{self._server.server_port}/metrics")
+        return self._server
+
+
+REGISTRY = MetricsRegistry()
+
+counter = REGISTRY.counter
+gauge = REGISTRY.gauge
+histogram = REGISTRY.histogram
@@ -0,0 +1,287 @@
+"""Utils Profiling - Tempo por Fase/Chamada, cProfile e Amostragem de Pilhas
+
+Uso nos scripts principais:
+
+    profiling.start("download", mode="sample")
+    profiling.phase("FASE 1: carregar")
+    ...
+    profiling.phase("FASE 2: download")
+    profiling.stop()   # grava o relatório
+
+(ou `with RunProfiler(...) as profiler: profiler.phase(...)`).
+
+Serviços marcam trechos com profiling.span("nome"); sem profiler ativo a
+chamada devolve um context manager nulo compartilhado.
+
+Cada execução grava em output/profiles/:
+    <run>-<ts>.txt      relatório: wall/CPU por fase e chamada
+    <run>-<ts>.folded   pilhas no formato "a;b;c valor" (flamegraph.pl,
+                        speedscope, inferno)
+    <run>-<ts>.pstats   estatísticas do cProfile (modo cprofile)
+"""
+
+import cProfile
+import io
+import logging
+import pstats
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+MODES = ("time", "cprofile", "sample")
+
+_path: ContextVar[Tuple[str, ...]] = ContextVar("profiling_path", default=())
+_active: Optional["RunProfiler"] = None
+_NULL = nullcontext()
+
+
+def span(name: str):
+    """
+    Marca um trecho (chamada de serviço) para o profiler ativo.
+
+    Args:
+        name: Nome do trecho, aninhado sob a fase e trechos correntes
+
+    Returns:
+        Context manager; nulo se não houver profiler ativo
+    """
+    if _active is None:
+        return _NULL
+    return _active.span(name)
+
+
+def start(name: str, mode: str = "time", output_dir: Path = Path("output/profiles")) -> "RunProfiler":
+    """Inicia um profiler de execução e o torna o ativo"""
+    profiler = RunProfiler(name, mode, output_dir)
+    profiler.__enter__()
+    return profiler
+
+
+def phase(name: str) -> None:
+    """Inicia uma fase no profiler ativo (no-op sem profiler)"""
+    if _active is not None:
+        _active.phase(name)
+
+
+def stop() -> None:
+    """Encerra o profiler ativo e grava o relatório (no-op sem profiler)"""
+    if _active is not None:
+        _active.__exit__(None, None, None)
+
+
+class _Stats:
+    __slots__ = ("wall", "cpu", "count")
+
+    def __init__(self):
+        self.wall = 0.0
+        self.cpu = 0.0
+        self.count = 0
+
+
+class _Sampler(threading.Thread):
+    """Amostra a pilha da thread principal em intervalo fixo"""
+
+    def __init__(self, profiler: "RunProfiler", interval: float):
+        super().__init__(daemon=True, name="profiling-sampler")
+        self.profiler = profiler
+        self.interval = interval
+        self.target = threading.main_thread().ident
+        self.stacks: Counter = Counter()
+        self._stop_event = threading.Event()
+
+    def run(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            frame = sys._current_frames().get(self.target)
+            if frame is None:
+                continue
+            frames: List[str] = []
+            while frame is not None:
+                code = frame.f_code
+                frames.append(f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})")
+                frame = frame.f_back
+            frames.reverse()
+            phase = self.profiler.current_phase or "(sem fase)"
+            self.stacks[";".join([phase] + frames)] += 1
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        self.join()
+
+
+class RunProfiler:
+    """
+    Profiler de uma execução: wall e CPU por fase e por trecho marcado.
+
+    mode:
+        "time"      apenas tempos (overhead desprezível)
+        "cprofile"  + cProfile durante as fases (.pstats e top no relatório)
+        "sample"    + amostragem de pilhas da thread principal
+
+    O CPU é o do processo (time.process_time): com tasks concorrentes, o
+    CPU de um trecho inclui o das tasks que rodaram enquanto ele esperava.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        mode: str = "time",
+        output_dir: Path = Path("output/profiles"),
+        interval: float = 0.005
+    ):
+        if mode not in MODES:
+            raise ValueError(f"Modo de profiling desconhecido: {mode} (use {', '.join(MODES)})")
+        self.name = name
+        self.mode = mode
+        self.output_dir = output_dir
+        self.interval = interval
+        self.current_phase: Optional[str] = None
+        self._stats: Dict[Tuple[str, ...], _Stats] = defaultdict(_Stats)
+        self._phase_start: Optional[Tuple[float, float]] = None
+        self._run_start = (0.0, 0.0)
+        self._run_total = (0.0, 0.0)
+        self._cprofile: Optional[cProfile.Profile] = None
+        self._sampler: Optional[_Sampler] = None
+
+    def __enter__(self):
+        global _active
+        _active = self
+        if self.mode == "cprofile":
+            self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+        elif self.mode == "sample":
+            self._sampler = _Sampler(self, self.interval)
+            self._sampler.start()
+        self._run_start = (time.perf_counter(), time.process_time())
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        global _active
+        self._end_phase()
+        self._run_total = (
+            time.perf_counter() - self._run_start[0],
+            time.process_time() - self._run_start[1]
+        )
+        if self._cprofile is not None:
+            self._cprofile.disable()
+        if self._sampler is not None:
+            self._sampler.stop()
+        _active = None
+        try:
+            self.write_report()
+        except OSError as e:
+            logger.error(f"❌ Falha ao gravar relatório de profiling: {e}")
+
+    def _end_phase(self) -> None:
+        if self.current_phase is None:
+            return
+        wall0, cpu0 = self._phase_start
+        stats = self._stats[(self.current_phase,)]
+        stats.wall += time.perf_counter() - wall0
+        stats.cpu += time.process_time() - cpu0
+        stats.count += 1
+        self.current_phase = None
+
+    def phase(self, name: str) -> None:
+        """
+        Encerra a fase corrente e inicia outra.
+
+        Args:
+            name: Nome da fase (ex.: "FASE 1: scraping")
+        """
+        self._end_phase()
+        self.current_phase = name
+        self._stats[(name,)]  # Registra na ordem de execução
+        self._phase_start = (time.perf_counter(), time.process_time())
+
+    @contextmanager
+    def span(self, name: str):
+        """Mede um trecho aninhado na fase e nos trechos correntes (por task)"""
+        path = _path.get() + (name,)
+        token = _path.set(path)
+        phase = self.current_phase or "(sem fase)"
+        self._stats[(phase,)]
+        stats = self._stats[(phase,) + path]
+        wall0, cpu0 = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            stats.wall += time.perf_counter() - wall0
+            stats.cpu += time.process_time() - cpu0
+            stats.count += 1
+            _path.reset(token)
+
+    def _ordered_paths(self) -> List[Tuple[str, ...]]:
+        """Paths em pré-ordem, irmãos na ordem em que começaram"""
+        children: Dict[Tuple[str, ...], List[Tuple[str, ...]]] = defaultdict(list)
+        for path in self._stats:
+            children[path[:-1]].append(path)
+        ordered: List[Tuple[str, ...]] = []
+        stack = list(reversed(children[()]))
+        while stack:
+            path = stack.pop()
+            ordered.append(path)
+            stack.extend(reversed(children.get(path, [])))
+        return ordered
+
+    def _report_text(self) -> str:
+        total_wall, total_cpu = self._run_total
+        out = io.StringIO()
+        out.write(f"Profiling: {self.name} (modo {self.mode})\n")
+        out.write(f"Total: wall {total_wall:.3f}s, CPU {total_cpu:.3f}s\n\n")
+        out.write(f"{'trecho':<60} {'n':>7} {'wall s':>10} {'CPU s':>10} {'% wall':>7}\n")
+        out.write("-" * 98 + "\n")
+        for path in self._ordered_paths():
+            stats = self._stats[path]
+            label = "  " * (len(path) - 1) + path[-1]
+            pct = 100 * stats.wall / total_wall if total_wall else 0
+            out.write(f"{label[:60]:<60} {stats.count:>7} {stats.wall:>10.3f} {stats.cpu:>10.3f} {pct:>6.1f}%\n")
+
+        if self._cprofile is not None:
+            out.write("\ncProfile (top 30 por tempo cumulativo)\n")
+            pstats.Stats(self._cprofile, stream=out).sort_stats("cumulative").print_stats(30)
+        return out.getvalue()
+
+    def _folded_lines(self) -> List[str]:
+        """Pilhas em formato folded; sem amostragem, peso = µs de wall exclusivo"""
+        if self._sampler is not None:
+            return [f"{stack} {count}" for stack, count in sorted(self._sampler.stacks.items())]
+
+        lines = []
+        for path, stats in sorted(self._stats.items()):
+            filhos = sum(
+                other.wall for other_path, other in self._stats.items()
+                if len(other_path) == len(path) + 1 and other_path[:len(path)] == path
+            )
+            exclusivo = max(0.0, stats.wall - filhos)
+            if exclusivo > 0:
+                lines.append(f"{';'.join(path)} {int(exclusivo * 1_000_000)}")
+        return lines
+
+    def write_report(self) -> Dict[str, Path]:
+        """
+        Grava relatório, pilhas folded e (modo cprofile) o .pstats.
+
+        Returns:
+            Caminhos gravados por tipo
+        """
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        stem = self.output_dir / f"{self.name}-{time.strftime('%Y%m%d-%H%M%S')}"
+        paths = {
+            'report': stem.with_suffix('.txt'),
+            'folded': stem.with_suffix('.folded'),
+        }
+        paths['report'].write_text(self._report_text(), encoding='utf-8')
+        paths['folded'].write_text("\n".join(self._folded_lines()) + "\n", encoding='utf-8')
+        if self._cprofile is not None:
+            paths['pstats'] = stem.with_suffix('.pstats')
+            self._cprofile.dump_stats(paths['pstats'])
+
+        logger.info(f"⏱️ Profiling salvo em {paths['report']} ({paths['folded'].name})")
+        return paths